@@ -0,0 +1,207 @@
+"""
+Cache persistente em disco para áudio sintetizado (SFX e músicas)
+- Endereçado por conteúdo: a chave é o hash dos parâmetros do gerador
+- PCM salvo em .npy e carregado com memory mapping (sem DSP no cold start)
+- Invalidação automática quando os parâmetros mudam
+- Limite de tamanho com remoção LRU (menos usado recentemente)
+
+Uso: python audio_cache.py  (mostra o conteúdo do cache)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import numpy as np
+
+# Incrementar quando a síntese/DSP mudar de forma que invalide o áudio já salvo
+AUDIO_CACHE_VERSION = 3
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~/.psychedelic_river_raid"), "audio_cache")
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024  # 32 MB
+
+
+class AudioCache:
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        """Cache de PCM em disco compartilhado entre execuções do jogo"""
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.index_file = os.path.join(self.cache_dir, "index.json")
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.dirty = False  # last_used alterado em memória, índice ainda não salvo
+
+        # Estatísticas da sessão
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.enabled = True
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError as e:
+            print(f"⚠️ Cache de áudio desativado: {e}")
+            self.enabled = False
+
+        # Índice: {'entries': {chave: {...}}, 'names': {nome: chave}}
+        self.index = self.load_index() if self.enabled else {'entries': {}, 'names': {}}
+
+    @staticmethod
+    def make_key(params):
+        """Hash estável (sha256) dos parâmetros do gerador"""
+        payload = json.dumps({'version': AUDIO_CACHE_VERSION, 'params': params},
+                             sort_keys=True, default=repr)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def entry_path(self, key):
+        """Arquivo .npy de uma chave"""
+        return os.path.join(self.cache_dir, f"{key}.npy")
+
+    def load_index(self):
+        """Carregar índice do disco (descartando entradas sem arquivo)"""
+        try:
+            if os.path.exists(self.index_file):
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+                entries = {key: entry for key, entry in index.get('entries', {}).items()
+                           if os.path.exists(self.entry_path(key))}
+                names = {name: key for name, key in index.get('names', {}).items()
+                         if key in entries}
+                return {'entries': entries, 'names': names}
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Índice do cache de áudio corrompido, recriando: {e}")
+        return {'entries': {}, 'names': {}}
+
+    def save_index(self):
+        """Salvar índice de forma atômica (arquivo temporário + rename)"""
+        temp_file = self.index_file + ".tmp"
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f)
+            os.replace(temp_file, self.index_file)
+            self.dirty = False
+        except OSError as e:
+            print(f"⚠️ Erro ao salvar índice do cache de áudio: {e}")
+
+    def get(self, name, params):
+        """
+        Obter PCM em cache.
+
+        Returns:
+            np.memmap somente leitura, ou None se não houver entrada válida
+        """
+        if not self.enabled:
+            return None
+
+        key = self.make_key(params)
+        with self.lock:
+            entry = self.index['entries'].get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            try:
+                pcm = np.load(self.entry_path(key), mmap_mode='r')
+            except (OSError, ValueError):
+                # Arquivo removido/corrompido por fora: descartar entrada
+                self._remove(key)
+                self.save_index()
+                self.misses += 1
+                return None
+
+            # Só em memória: o índice é salvo no próximo put/clear ou em flush()
+            entry['last_used'] = time.time()
+            self.dirty = True
+            self.hits += 1
+            return pcm
+
+    def put(self, name, params, pcm):
+        """Salvar PCM no cache, invalidando a versão anterior do mesmo som"""
+        if not self.enabled:
+            return
+
+        key = self.make_key(params)
+        with self.lock:
+            try:
+                np.save(self.entry_path(key), np.ascontiguousarray(pcm))
+            except OSError as e:
+                print(f"⚠️ Erro ao salvar áudio em cache: {e}")
+                return
+
+            # Parâmetros mudaram: a entrada antiga deste nome não será mais usada
+            previous = self.index['names'].get(name)
+            if previous is not None and previous != key:
+                self._remove(previous)
+
+            self.index['entries'][key] = {
+                'name': name,
+                'size': os.path.getsize(self.entry_path(key)),
+                'last_used': time.time()
+            }
+            self.index['names'][name] = key
+            self._evict(keep=key)
+            self.save_index()
+
+    def flush(self):
+        """Salvar o índice se houver acessos (last_used) ainda não gravados"""
+        if not self.enabled:
+            return
+        with self.lock:
+            if self.dirty:
+                self.save_index()
+
+    def total_size(self):
+        """Tamanho total (bytes) das entradas em cache"""
+        return sum(entry['size'] for entry in self.index['entries'].values())
+
+    def clear(self):
+        """Apagar todo o cache"""
+        with self.lock:
+            for key in list(self.index['entries']):
+                self._remove(key)
+            self.save_index()
+
+    def get_stats(self):
+        """Estatísticas do cache"""
+        return {
+            'enabled': self.enabled,
+            'entries': len(self.index['entries']),
+            'total_bytes': self.total_size(),
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+    def _evict(self, keep=None):
+        """Remover entradas menos usadas até caber no limite de tamanho"""
+        by_age = sorted(self.index['entries'].items(), key=lambda item: item[1]['last_used'])
+        total = self.total_size()
+        for key, entry in by_age:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= entry['size']
+            self._remove(key)
+            self.evictions += 1
+
+    def _remove(self, key):
+        """Remover entrada do índice e do disco"""
+        entry = self.index['entries'].pop(key, None)
+        if entry is not None and self.index['names'].get(entry['name']) == key:
+            del self.index['names'][entry['name']]
+        try:
+            os.remove(self.entry_path(key))
+        except OSError:
+            pass
+
+
+if __name__ == "__main__":
+    cache = AudioCache()
+    stats = cache.get_stats()
+    print(f"💾 Cache de áudio em {cache.cache_dir}")
+    print(f"   {stats['entries']} entradas, {stats['total_bytes'] / 1024:.0f} KB "
+          f"de {stats['max_bytes'] / 1024:.0f} KB")
+    for key, entry in sorted(cache.index['entries'].items(), key=lambda item: -item[1]['last_used']):
+        print(f"   {entry['name']:24s} {entry['size'] / 1024:8.0f} KB  {key[:12]}")
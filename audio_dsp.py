@@ -0,0 +1,399 @@
+"""
+Motor DSP em blocos para o pós-processamento de áudio
+- Filtros IIR de um polo e biquad processados em blocos inteiros (NumPy puro)
+- Linhas de delay com feedback processadas por segmentos do tamanho do delay
+- ProcessingChain: grafo de processamento encadeável usado pelo AudioEngine
+- ScratchBuffers: buffers de trabalho reutilizáveis (por thread) para DSP in-place
+
+Uso: python audio_dsp.py  (benchmark de um track de música de 16 segundos)
+"""
+
+import math
+import threading
+import time
+import numpy as np
+
+# Limite de magnitude de |polo|^-n dentro de um bloco (evita overflow no cumsum)
+_MAX_BLOCK_DYNAMIC_RANGE = 1e80
+_MAX_BLOCK_SIZE = 4096
+
+
+def _block_size_for_pole(pole):
+    """Maior bloco em que |polo|^-n ainda cabe com folga em float64"""
+    magnitude = abs(pole)
+    if magnitude == 0:
+        return _MAX_BLOCK_SIZE
+    size = int(math.log(_MAX_BLOCK_DYNAMIC_RANGE) / -math.log(magnitude))
+    return max(1, min(_MAX_BLOCK_SIZE, size))
+
+
+def one_pole(x, gain, pole, state=0.0):
+    """
+    Recorrência y[n] = gain * x[n] + pole * y[n-1] em blocos.
+
+    Dentro de cada bloco a recorrência é resolvida em forma fechada com
+    cumsum (y[k] = p^k * sum(g * x[j] * p^-j) + p^(k+1) * y_anterior).
+    O polo pode ser complexo (usado pelos biquads).
+
+    Returns:
+        (y, último estado)
+    """
+    x = np.asarray(x)
+    dtype = np.complex128 if isinstance(pole, complex) or np.iscomplexobj(x) else np.float64
+    y = np.empty(len(x), dtype=dtype)
+    if len(x) == 0:
+        return y, state
+
+    if pole == 0:
+        y[:] = gain * x
+        return y, y[-1]
+
+    if abs(pole) >= 1:
+        # Filtro instável/marginal: sem forma fechada segura, usar recorrência direta
+        for i in range(len(x)):
+            state = gain * x[i] + pole * state
+            y[i] = state
+        return y, state
+
+    block = min(_block_size_for_pole(pole), len(x))
+    powers = pole ** np.arange(block + 1)       # p^0 .. p^block
+    inverse_powers = 1.0 / powers[:block]        # p^0 .. p^-(block-1)
+
+    # Resposta de estado zero de todos os blocos de uma vez (matriz blocos x amostras)
+    n = len(x)
+    num_blocks = -(-n // block)
+    padded = np.zeros(num_blocks * block, dtype=dtype)
+    padded[:n] = x
+    blocks = padded.reshape(num_blocks, block)
+    zero_state = powers[:block] * np.cumsum(gain * blocks * inverse_powers, axis=1)
+
+    # Estado de entrada de cada bloco: s[k] = z[k] + p^block * s[k-1]
+    # (a mesma recorrência de um polo, agora no nível dos blocos)
+    block_pole = powers[block]
+    block_ends = zero_state[:, -1]
+    if num_blocks == 1 or abs(block_pole) < 1e-18:
+        end_states = block_ends.copy()
+        end_states[0] += block_pole * state
+    else:
+        end_states, _ = one_pole(block_ends, 1.0, block_pole, state)
+    entering = np.empty(num_blocks, dtype=end_states.dtype)
+    entering[0] = state
+    entering[1:] = end_states[:-1]
+
+    blocks_out = zero_state + powers[1:block + 1] * entering[:, None]
+    y[:] = blocks_out.reshape(-1)[:n]
+    return y, y[-1]
+
+
+def one_pole_reference(x, gain, pole, state=0.0):
+    """Recorrência de um polo amostra a amostra (referência para o benchmark)"""
+    y = np.zeros(len(x))
+    for i in range(len(x)):
+        state = gain * x[i] + pole * state
+        y[i] = state
+    return y, state
+
+
+class ScratchBuffers:
+    """
+    Buffers de trabalho pré-alocados e reutilizados entre chamadas.
+
+    Cada thread (jogo, renderizador de música, warm-up) tem o seu conjunto,
+    então os buffers podem ser usados como destino de operações `out=`
+    sem alocar arrays novos a cada etapa.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def get(self, name, length, dtype=np.float32):
+        """View de `length` elementos do buffer `name` (cresce sob demanda)"""
+        buffers = self._local.__dict__.setdefault('buffers', {})
+        key = (name, np.dtype(dtype).str)
+        buffer = buffers.get(key)
+        if buffer is None or len(buffer) < length:
+            buffer = np.empty(length, dtype=dtype)
+            buffers[key] = buffer
+        return buffer[:length]
+
+    def nbytes(self):
+        """Memória ocupada pelos buffers da thread atual"""
+        buffers = self._local.__dict__.get('buffers', {})
+        return sum(buffer.nbytes for buffer in buffers.values())
+
+
+class OnePoleLowPass:
+    """Passa-baixa de um polo: y[n] = a * x[n] + (1 - a) * y[n-1]"""
+
+    def __init__(self, cutoff_freq, sample_rate):
+        self.sample_rate = sample_rate
+        self.set_cutoff(cutoff_freq)
+        self.state = 0.0
+        self.stateful = False  # True = manter estado entre blocos (streaming)
+
+    def set_cutoff(self, cutoff_freq):
+        """Recalcular coeficiente (mesma fórmula do filtro original do AudioEngine)"""
+        nyquist = self.sample_rate / 2
+        self.cutoff_freq = cutoff_freq
+        self.bypass = cutoff_freq >= nyquist
+        self.alpha = cutoff_freq / (cutoff_freq + nyquist)
+
+    def reset(self):
+        """Zerar estado interno"""
+        self.state = 0.0
+
+    def __call__(self, wave):
+        if self.bypass:
+            return wave
+        initial = self.state if self.stateful else 0.0
+        filtered, last = one_pole(wave, self.alpha, 1 - self.alpha, initial)
+        if self.stateful:
+            self.state = last
+        # Recorrência calculada em float64; saída no dtype da entrada (float32 no motor)
+        return filtered.astype(np.asarray(wave).dtype, copy=False)
+
+
+class DCBlocker:
+    """Removedor de DC para streaming: y[n] = x[n] - x[n-1] + r * y[n-1]"""
+
+    def __init__(self, r=0.995):
+        self.r = r
+        self.stateful = False
+        self.reset()
+
+    def reset(self):
+        """Zerar estado interno"""
+        self.last_input = 0.0
+        self.state = 0.0
+
+    def __call__(self, wave):
+        if len(wave) == 0:
+            return wave
+        previous = self.last_input if self.stateful else 0.0
+        initial = self.state if self.stateful else 0.0
+        difference = np.diff(wave, prepend=previous)
+        blocked, last = one_pole(difference, 1.0, self.r, initial)
+        if self.stateful:
+            self.last_input = wave[-1]
+            self.state = last
+        return blocked.astype(wave.dtype, copy=False)
+
+
+class Biquad:
+    """
+    Filtro biquad (fórmulas do RBJ Audio EQ Cookbook).
+
+    O denominador é fatorado em dois polos (possivelmente complexos
+    conjugados) e cada polo é aplicado com one_pole em blocos; o numerador
+    é um FIR de 3 coeficientes vetorizado.
+    """
+
+    def __init__(self, filter_type, freq, sample_rate, q=0.7071):
+        self.filter_type = filter_type
+        self.freq = freq
+        self.q = q
+        self.sample_rate = sample_rate
+        self.b, self.a = self.design(filter_type, freq, sample_rate, q)
+        self.stateful = False
+        self.reset()
+
+    @staticmethod
+    def design(filter_type, freq, sample_rate, q=0.7071):
+        """Calcular coeficientes normalizados (b0, b1, b2), (1, a1, a2)"""
+        w0 = 2 * math.pi * min(freq, sample_rate * 0.499) / sample_rate
+        cos_w0 = math.cos(w0)
+        alpha = math.sin(w0) / (2 * q)
+
+        if filter_type == 'lowpass':
+            b = [(1 - cos_w0) / 2, 1 - cos_w0, (1 - cos_w0) / 2]
+        elif filter_type == 'highpass':
+            b = [(1 + cos_w0) / 2, -(1 + cos_w0), (1 + cos_w0) / 2]
+        elif filter_type == 'bandpass':
+            b = [alpha, 0.0, -alpha]
+        else:
+            raise ValueError(f"Tipo de biquad desconhecido: {filter_type}")
+
+        a0 = 1 + alpha
+        a = [1.0, -2 * cos_w0 / a0, (1 - alpha) / a0]
+        b = [c / a0 for c in b]
+        return b, a
+
+    def reset(self):
+        """Zerar estado interno (histórico de entrada e dos dois polos)"""
+        self.x_history = np.zeros(2)
+        self.pole_states = [0j, 0j]
+
+    def __call__(self, wave):
+        b0, b1, b2 = self.b
+        _, a1, a2 = self.a
+
+        # Numerador FIR (com histórico das duas últimas entradas)
+        history = self.x_history if self.stateful else np.zeros(2)
+        padded = np.concatenate([history, wave])
+        fir = b0 * padded[2:] + b1 * padded[1:-1] + b2 * padded[:-2]
+
+        # Denominador: 1 + a1 z^-1 + a2 z^-2 = (1 - p1 z^-1)(1 - p2 z^-1)
+        discriminant = complex(a1 * a1 - 4 * a2)
+        root = discriminant ** 0.5
+        p1 = (-a1 + root) / 2
+        p2 = (-a1 - root) / 2
+
+        states = self.pole_states if self.stateful else [0j, 0j]
+        stage1, s1 = one_pole(fir.astype(np.complex128), 1.0, p1, states[0])
+        stage2, s2 = one_pole(stage1, 1.0, p2, states[1])
+
+        if self.stateful:
+            self.x_history = padded[-2:].copy()
+            self.pole_states = [s1, s2]
+
+        return stage2.real.astype(np.asarray(wave).dtype)
+
+
+class DelayLine:
+    """
+    Linha de delay com feedback: y[n] = x[n] + feedback * y[n - D].
+
+    Processada em segmentos de D amostras (cada segmento depende apenas do
+    anterior), então o custo é len/D operações de array. Com
+    recirculate=False vira um eco simples: y[n] = x[n] + feedback * x[n - D].
+    """
+
+    def __init__(self, delay, feedback, sample_rate, mix=1.0, recirculate=True):
+        self.delay_samples = max(1, int(delay * sample_rate))
+        self.feedback = feedback
+        self.mix = mix
+        self.recirculate = recirculate
+
+    def __call__(self, wave):
+        d = self.delay_samples
+        source = wave
+        wet = np.array(wave, copy=True)
+
+        for start in range(d, len(wave), d):
+            end = min(start + d, len(wave))
+            previous = wet if self.recirculate else source
+            wet[start:end] += self.feedback * previous[start - d:end - d]
+
+        if self.mix == 1.0:
+            return wet
+        return wave * (1 - self.mix) + wet * self.mix
+
+
+class ProcessingChain:
+    """
+    Grafo linear de processamento encadeável.
+
+    Qualquer callable wave -> wave pode ser um nó (filtros deste módulo,
+    métodos do AudioEngine, lambdas):
+
+        chain = ProcessingChain().add(remove_dc).add(OnePoleLowPass(8000, sr))
+        wave = chain.process(wave)
+    """
+
+    def __init__(self):
+        self.nodes = []      # Lista de (nome, nó)
+        self.disabled = set()
+
+    def add(self, node, name=None):
+        """Adicionar nó no final da cadeia (retorna a própria cadeia)"""
+        self.nodes.append((name, node))
+        return self
+
+    def set_enabled(self, name, enabled=True):
+        """Ligar/desligar um nó nomeado sem reconstruir a cadeia"""
+        if enabled:
+            self.disabled.discard(name)
+        else:
+            self.disabled.add(name)
+
+    def get(self, name):
+        """Obter nó pelo nome (ou None)"""
+        for node_name, node in self.nodes:
+            if node_name == name:
+                return node
+        return None
+
+    def process(self, wave):
+        """Aplicar todos os nós habilitados em sequência"""
+        for name, node in self.nodes:
+            if name is not None and name in self.disabled:
+                continue
+            wave = node(wave)
+        return wave
+
+    def __call__(self, wave):
+        return self.process(wave)
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def benchmark(sample_rate=22050, duration=16.0, repeats=3):
+    """
+    Medir o tempo (ms) do filtro passa-baixa e do reverb de um track de música
+    com os loops amostra a amostra originais e com o motor em blocos.
+    """
+    from audio_synthesis import generate_pulse_wave, generate_triangle_wave
+
+    track = (generate_pulse_wave(440.0, duration, sample_rate, 0.25) * 0.4 +
+             generate_triangle_wave(110.0, duration, sample_rate) * 0.5)
+    nyquist = sample_rate / 2
+    alpha = 8000 / (8000 + nyquist)
+    results = {}
+
+    start = time.perf_counter()
+    reference, _ = one_pole_reference(track, alpha, 1 - alpha)
+    results['lowpass_loop_ms'] = (time.perf_counter() - start) * 1000
+
+    lowpass = OnePoleLowPass(8000, sample_rate)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        block = lowpass(track)
+    results['lowpass_block_ms'] = (time.perf_counter() - start) * 1000 / repeats
+    results['lowpass_max_error'] = float(np.max(np.abs(block - reference)))
+
+    delay_samples = int(0.2 * sample_rate)
+    start = time.perf_counter()
+    echo_loop = np.array(track, copy=True)
+    for i in range(len(track)):
+        if i + delay_samples < len(track):
+            echo_loop[i + delay_samples] += track[i] * 0.4
+    results['delay_loop_ms'] = (time.perf_counter() - start) * 1000
+
+    delay = DelayLine(0.2, 0.4, sample_rate, recirculate=False)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        echo_block = delay(track)
+    results['delay_block_ms'] = (time.perf_counter() - start) * 1000 / repeats
+    results['delay_max_error'] = float(np.max(np.abs(echo_block - echo_loop)))
+
+    biquad = Biquad('lowpass', 4000, sample_rate)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        biquad(track)
+    results['biquad_block_ms'] = (time.perf_counter() - start) * 1000 / repeats
+
+    return results
+
+
+if __name__ == "__main__":
+    print("🎛️ Motor DSP em blocos - track de 16 s a 22050 Hz")
+    for key, value in benchmark().items():
+        unit = "" if key.endswith('error') else " ms"
+        print(f"   {key:20s} {value:12.6g}{unit}")
+
+    # Tempo de renderização de um track completo pelo AudioEngine (se houver mixer)
+    try:
+        import os
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+        import pygame
+        from audio_engine import AudioEngine
+        pygame.init()
+        engine = AudioEngine(use_disk_cache=False)
+        start = time.perf_counter()
+        engine.create_background_music(0)
+        print(f"\n🎶 create_background_music(0): {(time.perf_counter() - start) * 1000:.1f} ms")
+        engine.cleanup()
+    except Exception as e:
+        print(f"\n⚠️ AudioEngine indisponível para o benchmark completo: {e}")
@@ -1,25 +1,46 @@
 import pygame
 import numpy as np
 import math
-import random
 import threading
+import queue
+import os
 import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+import audio_synthesis
+import audio_dsp
+from audio_cache import AudioCache
+from sfx_mixer import SFXMixer, create_voice_channels
+from sound_variants import SoundVariantBank, VARIANT_SOUNDS
 
 class AudioEngine:
-    def __init__(self, sample_rate=22050, channels=2):
+    def __init__(self, sample_rate=22050, channels=2, use_disk_cache=True, init_mixer=True):
         """Sistema de áudio procedural para o jogo"""
-        # Configurações mais profissionais para reduzir ruído
-        pygame.mixer.pre_init(frequency=sample_rate, size=-16, channels=channels, buffer=2048)
-        pygame.mixer.init()
+        # init_mixer=False: só renderização (processos de warm-up), sem dispositivo de áudio
+        self.mixer_enabled = init_mixer
+        if init_mixer:
+            # Configurações mais profissionais para reduzir ruído
+            pygame.mixer.pre_init(frequency=sample_rate, size=-16, channels=channels, buffer=2048)
+            pygame.mixer.init()
         
         self.sample_rate = sample_rate
         self.channels = channels
         self.volume = 0.25  # Volume inicial ainda mais baixo
         
         # Canais de áudio
-        self.music_channel = pygame.mixer.Channel(0)
-        self.sfx_channel = pygame.mixer.Channel(1)
-        self.ambient_channel = pygame.mixer.Channel(2)
+        if init_mixer:
+            self.music_channel = pygame.mixer.Channel(0)
+            self.sfx_channel = pygame.mixer.Channel(1)
+            self.ambient_channel = pygame.mixer.Channel(2)
+            
+            # Pool de vozes para SFX (canal 1 + canais extras a partir do 3)
+            self.sfx_voice_count = 6
+            voice_channels = [self.sfx_channel] + create_voice_channels(3, self.sfx_voice_count - 1)
+            self.sfx_mixer = SFXMixer(voice_channels)
+            
+            # Variações de pitch/ganho/filtro derivadas dos SFX base (round-robin)
+            self.variant_bank = SoundVariantBank(sample_rate, variants=4, policy='round_robin')
         
         # Estado da música
         self.music_playing = False
@@ -27,18 +48,46 @@ class AudioEngine:
         self.music_tempo = 120  # BPM
         self.music_key = 'C'
         
-        # Cache de sons
+        # Cache de sons (memória) e de PCM renderizado (disco, entre execuções)
         self.sound_cache = {}
+        self.disk_cache = AudioCache() if use_disk_cache else None
+        self.music_bank = {}  # PCM de tracks pré-renderizadas no warm-up (sem cache em disco)
         
-        # Thread para música contínua
+        # Progresso do warm-up paralelo (lido pelo MenuSystem para a barra de carregamento)
+        self.warmup_thread = None
+        self.warmup_progress = {'done': 0, 'total': 0, 'running': False, 'current': '',
+                                'elapsed': 0.0, 'workers': 0}
+        
+        # Thread para música contínua (player) + renderizador com lookahead
         self.music_thread = None
+        self.music_render_thread = None
         self.music_running = False
+        self.music_chunk_seconds = 0.5  # Música gerada em streaming, chunk a chunk
+        self.music_lookahead = 4  # Chunks preparados à frente do que está tocando
+        self.prepared_tracks = queue.Queue(maxsize=self.music_lookahead)
+        self.queued_track = None  # Track do chunk entregue via Channel.queue e ainda não iniciado
+        self.music_metrics = {
+            'render_times_ms': [],   # Últimos tempos de renderização (por chunk)
+            'chunks_rendered': 0,
+            'chunks_played': 0,
+            'tracks_rendered': 0,
+            'tracks_played': 0,
+            'underruns': 0           # Vezes em que a track acabou sem a próxima pronta
+        }
+        
+        # Pipeline DSP em float32 in-place com buffers de trabalho reutilizáveis
+        self.dsp_dtype = np.float32
+        self.scratch = audio_dsp.ScratchBuffers()
+        self.rng = np.random.default_rng()
         
         # Configurações avançadas para áudio profissional
         self.dither_amount = 0.0001  # Dithering para reduzir quantização
         self.dc_offset_removal = True  # Remover DC offset
         self.noise_gate_threshold = 0.01  # Gate de ruído
         
+        # Cadeia de masterização (motor DSP em blocos)
+        self.processing_chain = self.build_processing_chain()
+        
         # Configurações de música procedural - Estilo Chiptune/8-bit clássico
         self.chiptune_progressions = [
             # Progressão clássica de jogos de arcade (estilo Galaga/Space Invaders)
@@ -115,44 +164,37 @@ class AudioEngine:
         # Sistema de áudio inicializado com sucesso
     
     def generate_wave(self, frequency, duration, wave_type='sine', amplitude=0.5):
-        """Gerar onda sonora procedural"""
-        frames = int(duration * self.sample_rate)
-        arr = np.zeros(frames)
-        
-        for i in range(frames):
-            t = float(i) / self.sample_rate
-            
-            if wave_type == 'sine':
-                arr[i] = amplitude * np.sin(2 * np.pi * frequency * t)
-            elif wave_type == 'square':
-                arr[i] = amplitude * np.sign(np.sin(2 * np.pi * frequency * t))
-            elif wave_type == 'sawtooth':
-                arr[i] = amplitude * (2 * (t * frequency - np.floor(t * frequency + 0.5)))
-            elif wave_type == 'triangle':
-                arr[i] = amplitude * (2 * np.abs(2 * (t * frequency - np.floor(t * frequency + 0.5))) - 1)
-            elif wave_type == 'noise':
-                arr[i] = amplitude * random.uniform(-1, 1)
-        
-        return arr
+        """Gerar onda sonora procedural (vetorizada, ver audio_synthesis)"""
+        return audio_synthesis.generate_wave(frequency, duration, self.sample_rate, wave_type, amplitude,
+                                             dtype=self.dsp_dtype)
+    
+    def work_buffer(self, wave):
+        """Array de trabalho no dtype do pipeline (só copia se o dtype for diferente)"""
+        return np.asarray(wave, dtype=self.dsp_dtype)
+    
+    def verify_synthesis(self):
+        """Comparar a síntese vetorizada com o loop original (modo de verificação bit a bit)"""
+        return audio_synthesis.compare_with_reference(self.sample_rate)
     
     def apply_envelope(self, wave, attack=0.05, decay=0.1, sustain=0.6, release=0.25):
-        """Aplicar envelope ADSR à onda com transições mais suaves"""
+        """Aplicar envelope ADSR à onda com transições mais suaves (in-place)"""
+        wave = self.work_buffer(wave)
         length = len(wave)
-        envelope = np.ones(length)
+        envelope = self.scratch.get('envelope', length, wave.dtype)
+        envelope.fill(1)
         
         # Attack mais suave
         attack_samples = int(attack * length)
         if attack_samples > 0:
-            attack_curve = np.power(np.linspace(0, 1, attack_samples), 0.5)  # Curva exponencial suave
-            envelope[:attack_samples] = attack_curve
+            # Curva exponencial suave
+            np.sqrt(np.linspace(0, 1, attack_samples), out=envelope[:attack_samples])
         
         # Decay suave
         decay_samples = int(decay * length)
         if decay_samples > 0:
             start_idx = attack_samples
             end_idx = min(start_idx + decay_samples, length)
-            decay_curve = np.power(np.linspace(1, sustain, end_idx - start_idx), 2)
-            envelope[start_idx:end_idx] = decay_curve
+            np.square(np.linspace(1, sustain, end_idx - start_idx), out=envelope[start_idx:end_idx])
         
         # Sustain (mantém o nível)
         sustain_start = attack_samples + decay_samples
@@ -163,78 +205,89 @@ class AudioEngine:
         release_samples = int(release * length)
         if release_samples > 0:
             start_idx = max(0, length - release_samples)
-            release_curve = np.power(np.linspace(envelope[start_idx], 0, length - start_idx), 2)
-            envelope[start_idx:] = release_curve
+            np.square(np.linspace(envelope[start_idx], 0, length - start_idx), out=envelope[start_idx:])
         
-        return wave * envelope
+        wave *= envelope
+        return wave
     
     def remove_dc_offset(self, wave):
-        """Remover DC offset (componente contínua) da onda"""
+        """Remover DC offset (componente contínua) da onda (in-place)"""
+        wave = self.work_buffer(wave)
         if len(wave) > 0:
-            dc_offset = np.mean(wave)
-            wave = wave - dc_offset
+            wave -= np.mean(wave)
         return wave
     
     def apply_noise_gate(self, wave, threshold=None):
-        """Aplicar gate de ruído para eliminar sinais muito baixos"""
+        """Aplicar gate de ruído para eliminar sinais muito baixos (in-place)"""
         if threshold is None:
             threshold = self.noise_gate_threshold
         
         # Calcular RMS (Root Mean Square) para detecção de sinal
         window_size = int(0.01 * self.sample_rate)  # 10ms window
-        gated_wave = np.copy(wave)
+        wave = self.work_buffer(wave)
+        if window_size <= 0:
+            return wave
         
-        for i in range(0, len(wave) - window_size, window_size):
-            window = wave[i:i + window_size]
-            rms = np.sqrt(np.mean(window ** 2))
-            
-            if rms < threshold:
-                # Fade suave para zero ao invés de corte abrupto
-                fade_samples = min(window_size // 4, len(gated_wave) - i)
-                if fade_samples > 0:
-                    fade = np.linspace(1, 0, fade_samples)
-                    gated_wave[i:i + fade_samples] *= fade
-                    gated_wave[i + fade_samples:i + window_size] = 0
+        # Janelas inteiras processadas de uma vez (matriz janelas x amostras)
+        num_windows = len(range(0, len(wave) - window_size, window_size))
+        if num_windows == 0:
+            return wave
+        span = num_windows * window_size
+        windows = wave[:span].reshape(num_windows, window_size)
+        squares = self.scratch.get('gate_squares', span, wave.dtype).reshape(num_windows, window_size)
+        np.square(windows, out=squares)
+        rms = np.sqrt(np.mean(squares, axis=1))
+        quiet = rms < threshold
+        
+        if np.any(quiet):
+            # Fade suave para zero ao invés de corte abrupto
+            fade_samples = window_size // 4
+            if fade_samples > 0:
+                windows[quiet, :fade_samples] *= np.linspace(1, 0, fade_samples, dtype=wave.dtype)
+            windows[quiet, fade_samples:] = 0
         
-        return gated_wave
+        return wave
     
     def apply_soft_clipping(self, wave, threshold=0.95):
-        """Aplicar soft clipping para evitar distorção digital"""
-        # Soft clipping usando tanh para transições suaves
-        clipped = np.where(np.abs(wave) > threshold,
-                          np.sign(wave) * threshold * np.tanh(np.abs(wave) / threshold),
-                          wave)
-        return clipped
+        """Aplicar soft clipping para evitar distorção digital (in-place)"""
+        wave = self.work_buffer(wave)
+        magnitude = self.scratch.get('clip_magnitude', len(wave), wave.dtype)
+        np.abs(wave, out=magnitude)
+        over = self.scratch.get('clip_mask', len(wave), np.bool_)
+        np.greater(magnitude, threshold, out=over)
+        
+        # Soft clipping usando tanh só nas amostras acima do limiar
+        if np.any(over):
+            wave[over] = np.sign(wave[over]) * threshold * np.tanh(magnitude[over] / threshold)
+        return wave
     
     def apply_dithering(self, wave):
-        """Aplicar dithering para reduzir ruído de quantização"""
-        if self.dither_amount > 0:
-            dither_noise = np.random.uniform(-self.dither_amount, self.dither_amount, len(wave))
-            wave = wave + dither_noise
+        """Aplicar dithering para reduzir ruído de quantização (in-place)"""
+        wave = self.work_buffer(wave)
+        if self.dither_amount > 0 and len(wave) > 0:
+            noise = self.scratch.get('dither', len(wave), wave.dtype)
+            self.rng.random(dtype=wave.dtype, out=noise)        # [0, 1)
+            noise *= 2 * self.dither_amount
+            noise -= self.dither_amount                          # [-a, a)
+            wave += noise
         return wave
     
+    def build_processing_chain(self):
+        """Montar a cadeia de masterização (nós nomeados do motor DSP em blocos)"""
+        chain = audio_dsp.ProcessingChain()
+        chain.add(self.remove_dc_offset, 'dc_offset')
+        chain.add(audio_dsp.OnePoleLowPass(8000, self.sample_rate), 'low_pass')
+        chain.add(lambda wave: self.apply_soft_clipping(wave, 0.9), 'soft_clip')
+        chain.add(self.apply_noise_gate, 'noise_gate')
+        chain.add(self.apply_dithering, 'dither')
+        chain.add(lambda wave: self.normalize_wave(wave, 0.7), 'normalize')
+        return chain
+    
     def apply_professional_processing(self, wave):
         """Aplicar processamento profissional completo"""
-        # 1. Remover DC offset
-        if self.dc_offset_removal:
-            wave = self.remove_dc_offset(wave)
-        
-        # 2. Aplicar filtro passa-baixa
-        wave = self.apply_low_pass_filter(wave, 8000)
-        
-        # 3. Aplicar soft clipping
-        wave = self.apply_soft_clipping(wave, 0.9)
-        
-        # 4. Aplicar gate de ruído
-        wave = self.apply_noise_gate(wave)
-        
-        # 5. Aplicar dithering
-        wave = self.apply_dithering(wave)
-        
-        # 6. Normalização final suave
-        wave = self.normalize_wave(wave, 0.7)
-        
-        return wave
+        # DC offset -> passa-baixa -> soft clipping -> gate -> dithering -> normalização
+        self.processing_chain.set_enabled('dc_offset', self.dc_offset_removal)
+        return self.processing_chain.process(wave)
     
     def apply_low_pass_filter(self, wave, cutoff_freq=8000):
         """Aplicar filtro passa-baixa profissional para remover ruídos agudos"""
@@ -242,57 +295,28 @@ class AudioEngine:
         if cutoff_freq >= nyquist:
             return wave
         
-        # Filtro Butterworth de primeira ordem simulado
-        alpha = cutoff_freq / (cutoff_freq + nyquist)
-        filtered_wave = np.zeros_like(wave)
-        
-        if len(wave) > 0:
-            filtered_wave[0] = wave[0] * alpha
-            for i in range(1, len(wave)):
-                filtered_wave[i] = alpha * wave[i] + (1 - alpha) * filtered_wave[i-1]
-        
-        return filtered_wave
+        # Filtro Butterworth de primeira ordem simulado (recorrência resolvida em blocos)
+        return audio_dsp.OnePoleLowPass(cutoff_freq, self.sample_rate)(wave)
     
     def normalize_wave(self, wave, target_amplitude=0.8):
-        """Normalizar onda com controle de amplitude"""
-        max_val = np.max(np.abs(wave))
+        """Normalizar onda com controle de amplitude (in-place)"""
+        wave = self.work_buffer(wave)
+        max_val = self.peak(wave)
         if max_val > 0:
-            wave = wave / max_val * target_amplitude
+            wave *= target_amplitude / max_val
         return wave
     
+    def peak(self, wave):
+        """Maior valor absoluto da onda (sem alocar um array de np.abs)"""
+        if len(wave) == 0:
+            return 0.0
+        return float(max(np.max(wave), -np.min(wave)))
+    
     def add_reverb(self, wave, delay=0.2, feedback=0.2, mix=0.15):
         """Adicionar reverb suave à onda"""
-        delay_samples = int(delay * self.sample_rate)
-        reverb_wave = np.zeros(len(wave) + delay_samples)
-        reverb_wave[:len(wave)] = wave
-        
-        # Adicionar ecos com feedback mais suave
-        for i in range(len(wave)):
-            if i + delay_samples < len(reverb_wave):
-                reverb_wave[i + delay_samples] += wave[i] * feedback
-        
-        # Mixar com original (menos reverb para menos ruído)
-        final_wave = np.zeros(len(reverb_wave))
-        final_wave[:len(wave)] = wave * (1 - mix)
-        final_wave += reverb_wave * mix
-        
-        return final_wave[:len(wave)]  # Manter tamanho original
-        """Adicionar reverb à onda"""
-        delay_samples = int(delay * self.sample_rate)
-        reverb_wave = np.zeros(len(wave) + delay_samples)
-        reverb_wave[:len(wave)] = wave
-        
-        # Adicionar ecos com feedback
-        for i in range(len(wave)):
-            if i + delay_samples < len(reverb_wave):
-                reverb_wave[i + delay_samples] += wave[i] * feedback
-        
-        # Mixar com original
-        final_wave = np.zeros(len(reverb_wave))
-        final_wave[:len(wave)] = wave * (1 - mix)
-        final_wave += reverb_wave * mix
-        
-        return final_wave[:len(wave)]  # Manter tamanho original
+        # Eco único (sem recirculação) mixado com o original, processado por segmentos
+        echo = audio_dsp.DelayLine(delay, feedback, self.sample_rate, mix=mix, recirculate=False)
+        return echo(wave)
     
     def create_chord(self, root_freq, chord_type='major', duration=1.0):
         """Criar acorde procedural mais suave"""
@@ -305,7 +329,7 @@ class AudioEngine:
         else:
             intervals = [1.0, 1.25, 1.5]
         
-        chord_wave = np.zeros(int(duration * self.sample_rate))
+        chord_wave = np.zeros(int(duration * self.sample_rate), dtype=self.dsp_dtype)
         
         for interval in intervals:
             freq = root_freq * interval
@@ -317,7 +341,8 @@ class AudioEngine:
         # Filtrar para suavizar
         chord_wave = self.apply_low_pass_filter(chord_wave, 4000)
         
-        return chord_wave / len(intervals)  # Normalizar
+        chord_wave /= len(intervals)  # Normalizar
+        return chord_wave
     
     def create_laser_sound(self):
         """Som de tiro laser estilo arcade mais limpo e profissional"""
@@ -325,18 +350,9 @@ class AudioEngine:
         start_freq = 500
         end_freq = 120
         
-        frames = int(duration * self.sample_rate)
-        wave = np.zeros(frames)
-        
-        for i in range(frames):
-            t = float(i) / self.sample_rate
-            progress = i / frames
-            freq = start_freq + (end_freq - start_freq) * progress
-            
-            # Onda principal mais limpa com menos harmônicos
-            wave[i] = (0.8 * np.sin(2 * np.pi * freq * t) +
-                      0.15 * np.sin(2 * np.pi * freq * 2 * t) +
-                      0.05 * np.sin(2 * np.pi * freq * 3 * t))
+        # Onda principal mais limpa com menos harmônicos
+        wave = audio_synthesis.generate_sweep(start_freq, end_freq, duration, self.sample_rate,
+                                              audio_synthesis.LASER_HARMONICS, dtype=self.dsp_dtype)
         
         # Envelope mais suave
         wave = self.apply_envelope(wave, 0.01, 0.05, 0.3, 0.7)
@@ -356,11 +372,10 @@ class AudioEngine:
         mid_freq = self.generate_wave(100, duration, 'triangle', 0.3)
         punch = self.generate_wave(80, duration * 0.1, 'square', 0.4)  # Punch inicial curto
         
-        # Criar envelope de punch
-        punch_padded = np.zeros(frames)
-        punch_padded[:len(punch)] = punch
-        
-        wave = low_freq + mid_freq + punch_padded
+        # Somar in-place (o punch cobre só o início)
+        wave = low_freq
+        wave += mid_freq
+        wave[:min(len(punch), frames)] += punch[:frames]
         
         # Envelope de explosão ultra-suave
         wave = self.apply_envelope(wave, 0.001, 0.1, 0.2, 0.8)
@@ -379,12 +394,11 @@ class AudioEngine:
         metallic2 = self.generate_wave(1200, duration, 'triangle', 0.3)
         impact = self.generate_wave(400, duration * 0.5, 'square', 0.2)  # Impacto curto
         
-        # Padding para o impacto
+        # Somar in-place (o impacto cobre só o início)
         frames = int(duration * self.sample_rate)
-        impact_padded = np.zeros(frames)
-        impact_padded[:len(impact)] = impact
-        
-        wave = metallic1 + metallic2 + impact_padded
+        wave = metallic1
+        wave += metallic2
+        wave[:min(len(impact), frames)] += impact[:frames]
         
         # Envelope de impacto rápido
         wave = self.apply_envelope(wave, 0.001, 0.02, 0.03, 0.1)
@@ -402,12 +416,12 @@ class AudioEngine:
         notes = [261.63, 329.63, 392.00, 523.25]  # C, E, G, C oitava acima
         note_duration = duration / len(notes)
         
-        full_wave = np.array([])
+        arpeggio = []
         
         for note_freq in notes:
             note_wave = self.generate_wave(note_freq, note_duration, 'sine', 0.4)
-            note_wave = self.apply_envelope(note_wave, 0.05, 0.1, 0.8, 0.2)
-            full_wave = np.concatenate([full_wave, note_wave])
+            arpeggio.append(self.apply_envelope(note_wave, 0.05, 0.1, 0.8, 0.2))
+        full_wave = np.concatenate(arpeggio)
         
         # Adicionar reverb
         full_wave = self.add_reverb(full_wave, 0.2, 0.4, 0.3)
@@ -424,10 +438,15 @@ class AudioEngine:
         harmonic2 = self.generate_wave(240, duration, 'sine', 0.1)
         
         # Pequenas variações suaves na frequência
-        vibrato = np.sin(np.linspace(0, 8 * np.pi, int(duration * self.sample_rate))) * 0.05
-        base_freq = base_freq * (1 + vibrato)
+        vibrato = np.linspace(0, 8 * np.pi, int(duration * self.sample_rate), dtype=self.dsp_dtype)
+        np.sin(vibrato, out=vibrato)
+        vibrato *= 0.05
+        vibrato += 1
         
-        wave = base_freq + harmonic1 + harmonic2
+        wave = base_freq
+        wave *= vibrato
+        wave += harmonic1
+        wave += harmonic2
         
         # Envelope muito suave para motor contínuo
         wave = self.apply_envelope(wave, 0.2, 1.6, 1.0, 0.2)
@@ -438,66 +457,149 @@ class AudioEngine:
         return self.wave_to_pygame_sound(wave)
     
     def create_background_music(self, track_number=0):
-        """Criar música de fundo estilo chiptune/8-bit clássico"""
+        """Criar música de fundo estilo chiptune/8-bit clássico (com cache em disco)"""
+        return pygame.sndarray.make_sound(self.get_music_pcm(track_number))
+    
+    def music_cache_params(self, track_number):
+        """Parâmetros que determinam o áudio de uma track (chave do cache em disco)"""
         track_info = self.chiptune_progressions[track_number % len(self.chiptune_progressions)]
-        
-        duration = 16.0  # 16 segundos por track
-        tempo = track_info['tempo']
-        chord_progression = track_info['chords']
-        melody_pattern = track_info['melody_pattern']
+        return {
+            'kind': 'music',
+            'progression': track_info,
+            'tempo': track_info['tempo'],
+            'scales': {chord: self.chiptune_scales[chord] for chord in track_info['chords']},
+            'sample_rate': self.sample_rate,
+            'channels': self.channels,
+            'chunk_seconds': self.music_chunk_seconds,
+            'chiptune_config': self.chiptune_config
+        }
+    
+    def get_music_pcm(self, track_number):
+        """PCM int16 de uma track completa: do cache em disco ou renderizado agora"""
+        name, params = self.music_cache_entry(track_number)
+        
+        if self.disk_cache is not None:
+            cached = self.disk_cache.get(name, params)
+            if cached is not None:
+                return cached
+        
+        pcm = np.concatenate(list(self.generate_music_chunks(track_number)))
+        if self.disk_cache is not None:
+            self.disk_cache.put(name, params, pcm)
+        return pcm
+    
+    def music_cache_entry(self, track_number):
+        """(nome, parâmetros) de uma track no cache em disco"""
+        track_info = self.chiptune_progressions[track_number % len(self.chiptune_progressions)]
+        return f"music_{track_info['name']}", self.music_cache_params(track_number)
+    
+    def build_streaming_chain(self):
+        """Cadeia de masterização com estado entre chunks (uma instância por track)"""
+        dc_blocker = audio_dsp.DCBlocker()
+        dc_blocker.stateful = True
+        low_pass = audio_dsp.OnePoleLowPass(8000, self.sample_rate)
+        low_pass.stateful = True
+        
+        chain = audio_dsp.ProcessingChain()
+        chain.add(dc_blocker, 'dc_offset')
+        chain.add(low_pass, 'low_pass')
+        chain.add(lambda wave: self.apply_soft_clipping(wave, 0.9), 'soft_clip')
+        chain.add(self.apply_noise_gate, 'noise_gate')
+        chain.add(self.apply_dithering, 'dither')
+        chain.set_enabled('dc_offset', self.dc_offset_removal)
+        return chain
+    
+    def music_peak_estimate(self):
+        """Pico máximo teórico da mixagem (substitui a normalização pela track inteira)"""
+        volumes = self.chiptune_config['channel_volumes']
+        melody_peak = 0.5 * (1 + self.chiptune_config['vibrato_depth'])  # Pulse + vibrato
+        harmony_peak = 0.5                                                # Pulse
+        bass_peak = 0.7                                                   # Triangle
+        return (melody_peak * volumes['pulse1'] + harmony_peak * volumes['pulse2'] +
+                bass_peak * volumes['triangle'])
+    
+    def render_chord_step(self, track_info, step, chord_duration):
+        """Sintetizar os três canais de um acorde da progressão (onda float)"""
+        chord_name = track_info['chords'][step]
+        scale = self.chiptune_scales[chord_name]
         bass_pattern = track_info['bass_pattern']
         
-        # Calcular duração de cada acorde (4 acordes por 16 segundos = 4 segundos cada)
-        chord_duration = duration / len(chord_progression)
+        # Canal 1: Melodia principal (Pulse Wave)
+        melody_wave = self.create_chiptune_melody(scale, track_info['melody_pattern'],
+                                                  chord_duration, 'pulse1')
+        
+        # Canal 2: Harmonias (Pulse Wave com duty cycle diferente)
+        harmony_wave = self.create_chiptune_harmony(scale, chord_duration, 'pulse2')
+        
+        # Canal 3: Linha de baixo (Triangle Wave)
+        bass_freq = scale[bass_pattern[step % len(bass_pattern)]]
+        bass_wave = self.create_chiptune_bass(bass_freq, chord_duration)
+        
+        # Normalizar tamanhos
+        min_length = min(len(melody_wave), len(harmony_wave), len(bass_wave))
+        
+        # Combinar canais com volumes balanceados (estilo NES), in-place sobre a melodia
+        volumes = self.chiptune_config['channel_volumes']
+        combined = melody_wave[:min_length]
+        combined *= volumes['pulse1']
+        harmony_wave = harmony_wave[:min_length]
+        harmony_wave *= volumes['pulse2']
+        combined += harmony_wave
+        bass_wave = bass_wave[:min_length]
+        bass_wave *= volumes['triangle']
+        combined += bass_wave
+        return combined
+    
+    def generate_music_chunks(self, track_number=0, chunk_seconds=None):
+        """
+        Gerar uma track como sequência de chunks PCM int16 de tamanho fixo.
+        
+        Cada acorde é sintetizado, processado por uma cadeia com estado e
+        convertido em chunks de ~chunk_seconds; a memória fica limitada a um
+        acorde, independente da duração da track.
+        """
+        track_info = self.chiptune_progressions[track_number % len(self.chiptune_progressions)]
+        chunk_frames = int((chunk_seconds or self.music_chunk_seconds) * self.sample_rate)
         
-        full_track = np.array([])
+        duration = 16.0  # 16 segundos por track
+        chord_duration = duration / len(track_info['chords'])
+        chain = self.build_streaming_chain()
+        gain = 1.0 / self.music_peak_estimate()
         
-        for i, chord_name in enumerate(chord_progression):
-            # Canal 1: Melodia principal (Pulse Wave)
-            melody_wave = self.create_chiptune_melody(
-                self.chiptune_scales[chord_name], 
-                melody_pattern, 
-                chord_duration,
-                'pulse1'
-            )
-            
-            # Canal 2: Harmonias (Pulse Wave com duty cycle diferente)
-            harmony_wave = self.create_chiptune_harmony(
-                self.chiptune_scales[chord_name], 
-                chord_duration,
-                'pulse2'
-            )
-            
-            # Canal 3: Linha de baixo (Triangle Wave)
-            bass_freq = self.chiptune_scales[chord_name][bass_pattern[i % len(bass_pattern)]]
-            bass_wave = self.create_chiptune_bass(bass_freq, chord_duration)
+        for step in range(len(track_info['chords'])):
+            combined = self.render_chord_step(track_info, step, chord_duration)
             
-            # Normalizar tamanhos
-            min_length = min(len(melody_wave), len(harmony_wave), len(bass_wave))
-            melody_wave = melody_wave[:min_length]
-            harmony_wave = harmony_wave[:min_length]
-            bass_wave = bass_wave[:min_length]
-            
-            # Combinar canais com volumes balanceados (estilo NES)
-            combined = (
-                melody_wave * self.chiptune_config['channel_volumes']['pulse1'] +
-                harmony_wave * self.chiptune_config['channel_volumes']['pulse2'] +
-                bass_wave * self.chiptune_config['channel_volumes']['triangle']
-            )
-            
-            full_track = np.concatenate([full_track, combined])
-        
-        # Aplicar processamento profissional e volume baixo para fundo
-        if np.max(np.abs(full_track)) > 0:
-            full_track = self.apply_professional_processing(full_track)
-            full_track *= 0.25  # Volume baixo para música de fundo
-        
-        return self.wave_to_pygame_sound(full_track)
+            for start in range(0, len(combined), chunk_frames):
+                chunk = chain.process(combined[start:start + chunk_frames])
+                yield self.stream_to_pcm(chunk, gain)
+    
+    def stream_to_pcm(self, chunk, gain):
+        """Converter chunk float em PCM int16 com ganho fixo (sem normalização global)"""
+        chunk = self.work_buffer(chunk)
+        chunk *= gain
+        np.clip(chunk, -1.0, 1.0, out=chunk)
+        return self.wave_to_pcm(chunk, gain=1.0)
+    
+    def music_chunk_sounds(self, track_number):
+        """Chunks de uma track como pygame.mixer.Sound (cache em disco ou streaming)"""
+        chunk_frames = int(self.music_chunk_seconds * self.sample_rate)
+        
+        cached = self.music_bank.get(track_number % len(self.chiptune_progressions))
+        if cached is None and self.disk_cache is not None:
+            cached = self.disk_cache.get(*self.music_cache_entry(track_number))
+        
+        if cached is not None:
+            # Fatiar o PCM pronto (mapeado em memória: só o chunk atual é lido)
+            for start in range(0, len(cached), chunk_frames):
+                yield pygame.sndarray.make_sound(np.ascontiguousarray(cached[start:start + chunk_frames]))
+        else:
+            for pcm in self.generate_music_chunks(track_number):
+                yield pygame.sndarray.make_sound(pcm)
     
     def create_chiptune_melody(self, scale, pattern, duration, channel):
         """Criar melodia principal estilo chiptune com pulse wave"""
         note_duration = duration / len(pattern)
-        melody = np.array([])
+        melody = []
         
         for note_index in pattern:
             freq = scale[note_index % len(scale)]
@@ -506,24 +608,26 @@ class AudioEngine:
             note_wave = self.generate_pulse_wave(freq, note_duration, 0.25)  # 25% duty cycle
             
             # Adicionar vibrato sutil (característica do chiptune)
-            vibrato = np.sin(np.linspace(0, self.chiptune_config['vibrato_rate'] * 2 * np.pi, 
-                                       int(note_duration * self.sample_rate))) 
+            vibrato = np.linspace(0, self.chiptune_config['vibrato_rate'] * 2 * np.pi,
+                                  int(note_duration * self.sample_rate), dtype=self.dsp_dtype)
+            np.sin(vibrato, out=vibrato)
             vibrato *= self.chiptune_config['vibrato_depth']
-            note_wave = note_wave * (1 + vibrato)
+            vibrato += 1
+            note_wave *= vibrato
             
             # Envelope rápido típico de chiptune
             note_wave = self.apply_envelope(note_wave, 0.001, 0.05, 0.8, 0.1)
             
-            melody = np.concatenate([melody, note_wave])
+            melody.append(note_wave)
         
-        return melody
+        return np.concatenate(melody) if melody else np.array([], dtype=self.dsp_dtype)
     
     def create_chiptune_harmony(self, scale, duration, channel):
         """Criar harmonias estilo chiptune com pulse wave diferente"""
         # Criar harmonias simples com terças e quintas
         harmony_pattern = [2, 4, 1, 3]  # Padrão harmônico
         note_duration = duration / len(harmony_pattern)
-        harmony = np.array([])
+        harmony = []
         
         for note_index in harmony_pattern:
             freq = scale[note_index % len(scale)]
@@ -534,16 +638,16 @@ class AudioEngine:
             # Envelope mais sustentado para harmonias
             note_wave = self.apply_envelope(note_wave, 0.01, 0.1, 0.6, 0.2)
             
-            harmony = np.concatenate([harmony, note_wave])
+            harmony.append(note_wave)
         
-        return harmony
+        return np.concatenate(harmony) if harmony else np.array([], dtype=self.dsp_dtype)
     
     def create_chiptune_bass(self, bass_freq, duration):
         """Criar linha de baixo estilo chiptune com triangle wave"""
         # Padrão rítmico típico de games 8-bit
         bass_pattern = [1, 0.5, 1, 0.5, 1, 0.5, 1, 1]  # Ritmo característico
         beat_duration = duration / len(bass_pattern)
-        bass_line = np.array([])
+        bass_line = []
         
         for amplitude in bass_pattern:
             if amplitude > 0:
@@ -555,104 +659,365 @@ class AudioEngine:
                 beat_wave = self.apply_envelope(beat_wave, 0.001, 0.02, 0.7, 0.1)
             else:
                 # Silêncio para criar ritmo
-                beat_wave = np.zeros(int(beat_duration * self.sample_rate))
+                beat_wave = np.zeros(int(beat_duration * self.sample_rate), dtype=self.dsp_dtype)
             
-            bass_line = np.concatenate([bass_line, beat_wave])
+            bass_line.append(beat_wave)
         
-        return bass_line
+        return np.concatenate(bass_line) if bass_line else np.array([], dtype=self.dsp_dtype)
     
     def generate_pulse_wave(self, frequency, duration, duty_cycle=0.5):
         """Gerar pulse wave autêntica estilo 8-bit"""
-        frames = int(duration * self.sample_rate)
-        wave = np.zeros(frames)
-        
-        for i in range(frames):
-            t = float(i) / self.sample_rate
-            phase = (frequency * t) % 1.0
-            wave[i] = 1.0 if phase < duty_cycle else -1.0
-        
-        return wave * 0.5  # Amplitude controlada
+        return audio_synthesis.generate_pulse_wave(frequency, duration, self.sample_rate, duty_cycle,
+                                                   dtype=self.dsp_dtype)
     
     def generate_triangle_wave(self, frequency, duration):
         """Gerar triangle wave autêntica estilo 8-bit"""
-        frames = int(duration * self.sample_rate)
-        wave = np.zeros(frames)
-        
-        for i in range(frames):
-            t = float(i) / self.sample_rate
-            phase = (frequency * t) % 1.0
-            if phase < 0.5:
-                wave[i] = 4 * phase - 1
-            else:
-                wave[i] = 3 - 4 * phase
-        
-        return wave * 0.7  # Amplitude típica do triangle
+        return audio_synthesis.generate_triangle_wave(frequency, duration, self.sample_rate,
+                                                      dtype=self.dsp_dtype)
     
-    def wave_to_pygame_sound(self, wave_array):
-        """Converter array numpy para pygame.mixer.Sound"""
-        # Normalizar e converter para int16
-        if np.max(np.abs(wave_array)) > 0:
-            wave_array = wave_array / np.max(np.abs(wave_array))
-        
-        wave_int16 = (wave_array * 32767).astype(np.int16)
-        
-        # Se mono, converter para stereo
+    def wave_to_pcm(self, wave_array, gain=None):
+        """
+        Converter array numpy para PCM int16 no formato do mixer.
+        
+        Normaliza pelo pico (ou aplica `gain` fixo) escrevendo direto no
+        buffer int16 final; no stereo o canal esquerdo é escrito e copiado
+        para o direito, sem arrays mono/float intermediários.
+        """
+        if gain is None:
+            max_val = self.peak(wave_array)
+            gain = 1.0 / max_val if max_val > 0 else 1.0
+        
+        length = len(wave_array)
         if self.channels == 2:
-            stereo_wave = np.zeros((len(wave_int16), 2), dtype=np.int16)
-            stereo_wave[:, 0] = wave_int16  # Canal esquerdo
-            stereo_wave[:, 1] = wave_int16  # Canal direito
-            wave_int16 = stereo_wave
+            pcm = np.empty((length, 2), dtype=np.int16)
+            left = pcm[:, 0]
+        else:
+            pcm = np.empty(length, dtype=np.int16)
+            left = pcm
         
-        return pygame.sndarray.make_sound(wave_int16)
+        np.multiply(wave_array, gain * 32767, out=left, casting='unsafe')
+        if self.channels == 2:
+            pcm[:, 1] = left  # Canal direito = esquerdo
+        return pcm
+    
+    def wave_to_pygame_sound(self, wave_array):
+        """Converter array numpy para pygame.mixer.Sound (PCM cru se não houver mixer)"""
+        if not self.mixer_enabled:
+            return self.wave_to_pcm(wave_array)
+        return pygame.sndarray.make_sound(self.wave_to_pcm(wave_array))
+    
+    def sfx_generators(self):
+        """Geradores de todos os efeitos sonoros tocáveis por play_sound"""
+        return {
+            'laser': self.create_laser_sound,
+            'explosion': self.create_explosion_sound,
+            'enemy_hit': self.create_enemy_hit_sound,
+            'powerup': self.create_powerup_sound,
+            'engine': self.create_engine_sound
+        }
+    
+    def sfx_cache_params(self, sound_name):
+        """Parâmetros que determinam o áudio de um efeito (chave do cache em disco)"""
+        return {'kind': 'sfx', 'sound': sound_name,
+                'sample_rate': self.sample_rate, 'channels': self.channels}
+    
+    def load_sound(self, sound_name):
+        """Obter efeito sonoro do cache em disco ou sintetizá-lo (None se desconhecido)"""
+        generators = self.sfx_generators()
+        if sound_name not in generators:
+            return None
+        
+        params = self.sfx_cache_params(sound_name)
+        if self.disk_cache is not None:
+            cached = self.disk_cache.get(sound_name, params)
+            if cached is not None:
+                return pygame.sndarray.make_sound(cached)
+        
+        sound = generators[sound_name]()
+        if self.disk_cache is not None:
+            self.disk_cache.put(sound_name, params, pygame.sndarray.array(sound))
+        return sound
+    
+    def render_asset_pcm(self, kind, key):
+        """Renderizar um asset do banco de sons como PCM int16 (sem mixer)"""
+        if kind == 'sfx':
+            return self.render_sfx_pcm(key)
+        return np.concatenate(list(self.generate_music_chunks(key)))
+    
+    def render_sfx_pcm(self, sound_name):
+        """PCM de um efeito sonoro (funciona com ou sem mixer)"""
+        sound = self.sfx_generators()[sound_name]()
+        if self.mixer_enabled:
+            return pygame.sndarray.array(sound)
+        return sound
+    
+    def warm_up(self, max_workers=None, progress_callback=None):
+        """
+        Pré-renderizar todo o banco de sons (SFX de play_sound + todas as músicas)
+        em paralelo num ProcessPoolExecutor.
+        
+        Os processos devolvem PCM cru; o processo principal cria os
+        pygame.mixer.Sound. Assets já presentes no cache em disco não são
+        renderizados de novo.
+        
+        Args:
+            max_workers: número de processos (None = número de núcleos)
+            progress_callback: chamada como callback(done, total, nome)
+        
+        Returns:
+            Dict com tempo total, workers usados e contagens
+        """
+        start = time.perf_counter()
+        tasks = [('sfx', name) for name in self.sfx_generators()]
+        tasks += [('music', track) for track in range(len(self.chiptune_progressions))]
+        
+        progress = self.warmup_progress
+        progress.update({'done': 0, 'total': len(tasks), 'running': True, 'current': '',
+                         'elapsed': 0.0, 'workers': 0})
+        from_cache = 0
+        
+        def advance(name):
+            progress['done'] += 1
+            progress['current'] = name
+            progress['elapsed'] = time.perf_counter() - start
+            if progress_callback:
+                progress_callback(progress['done'], progress['total'], name)
+        
+        # Assets já no cache em disco não precisam de processo
+        pending = []
+        for kind, key in tasks:
+            if self._warm_from_cache(kind, key):
+                from_cache += 1
+                advance(self._asset_name(kind, key))
+            else:
+                pending.append((kind, key))
+        
+        completed = set()
+        if pending:
+            workers = min(max_workers or os.cpu_count() or 1, len(pending))
+            progress['workers'] = workers
+            try:
+                # 'spawn': o warm-up roda numa thread com SDL e streaming de música ativos,
+                # e fazer fork de um processo com várias threads pode travar os filhos
+                with ProcessPoolExecutor(max_workers=workers,
+                                         mp_context=multiprocessing.get_context('spawn')) as pool:
+                    futures = {
+                        pool.submit(_render_asset_in_worker, kind, key, self.sample_rate, self.channels): (kind, key)
+                        for kind, key in pending
+                    }
+                    for future in as_completed(futures):
+                        kind, key = futures[future]
+                        self._store_warm_asset(kind, key, future.result())
+                        completed.add((kind, key))
+                        advance(self._asset_name(kind, key))
+            except (OSError, BrokenProcessPool, NotImplementedError) as e:
+                # Sem multiprocessing disponível: renderizar no próprio processo
+                print(f"⚠️ Warm-up paralelo indisponível ({e}), renderizando em série")
+                progress['workers'] = 1
+                for kind, key in pending:
+                    if (kind, key) not in completed:
+                        self._store_warm_asset(kind, key, self.render_asset_pcm(kind, key))
+                        advance(self._asset_name(kind, key))
+        
+        # Acessos ao cache durante o warm-up: um único salvamento do índice
+        if self.disk_cache is not None:
+            self.disk_cache.flush()
+        
+        progress['done'] = progress['total']
+        progress['running'] = False
+        progress['elapsed'] = time.perf_counter() - start
+        return {
+            'elapsed': progress['elapsed'],
+            'workers': progress['workers'],
+            'rendered': len(pending),
+            'from_cache': from_cache
+        }
+    
+    def warm_up_async(self, max_workers=None):
+        """Executar warm_up numa thread (progresso em self.warmup_progress)"""
+        if self.warmup_thread is None or not self.warmup_thread.is_alive():
+            self.warmup_progress['running'] = True
+            self.warmup_thread = threading.Thread(target=self.warm_up, args=(max_workers,), daemon=True)
+            self.warmup_thread.start()
+        return self.warmup_thread
+    
+    def get_warm_up_progress(self):
+        """Fração concluída do warm-up (0.0 a 1.0)"""
+        total = self.warmup_progress['total']
+        if total == 0:
+            return 0.0 if self.warmup_progress['running'] else 1.0
+        return self.warmup_progress['done'] / total
+    
+    def _asset_name(self, kind, key):
+        """Nome legível de um asset do banco de sons"""
+        if kind == 'sfx':
+            return key
+        return self.music_cache_entry(key)[0]
+    
+    def _warm_from_cache(self, kind, key):
+        """Carregar asset do cache em disco (True se encontrado)"""
+        if self.disk_cache is None:
+            return False
+        if kind == 'sfx':
+            if key not in self.sound_cache:
+                cached = self.disk_cache.get(key, self.sfx_cache_params(key))
+                if cached is None:
+                    return False
+                self.sound_cache[key] = pygame.sndarray.make_sound(cached)
+            return True
+        # Músicas em cache são lidas sob demanda pelo streaming (memory mapping)
+        return self.disk_cache.get(*self.music_cache_entry(key)) is not None
+    
+    def _store_warm_asset(self, kind, key, pcm):
+        """Guardar PCM renderizado por um worker (Sound, cache em disco e banco de músicas)"""
+        if kind == 'sfx':
+            self.sound_cache[key] = pygame.sndarray.make_sound(pcm)
+            if self.disk_cache is not None:
+                self.disk_cache.put(key, self.sfx_cache_params(key), pcm)
+        else:
+            if self.disk_cache is not None:
+                self.disk_cache.put(*self.music_cache_entry(key), pcm)
+            else:
+                self.music_bank[key] = pcm
     
     def play_sound(self, sound_name):
         """Tocar som específico"""
         if sound_name not in self.sound_cache:
-            if sound_name == 'laser':
-                self.sound_cache[sound_name] = self.create_laser_sound()
-            elif sound_name == 'explosion':
-                self.sound_cache[sound_name] = self.create_explosion_sound()
-            elif sound_name == 'enemy_hit':
-                self.sound_cache[sound_name] = self.create_enemy_hit_sound()
-            elif sound_name == 'powerup':
-                self.sound_cache[sound_name] = self.create_powerup_sound()
-            elif sound_name == 'engine':
-                self.sound_cache[sound_name] = self.create_engine_sound()
+            sound = self.load_sound(sound_name)
+            if sound is not None:
+                self.sound_cache[sound_name] = sound
         
         if sound_name in self.sound_cache:
             # Usar canal específico baseado no tipo de som
             if sound_name == 'engine':
                 self.ambient_channel.play(self.sound_cache[sound_name], loops=-1)
             else:
-                self.sfx_channel.play(self.sound_cache[sound_name])
+                sound = self.sound_cache[sound_name]
+                if sound_name in VARIANT_SOUNDS:
+                    sound = self.variant_bank.pick(sound_name, sound)
+                
+                # Pool de vozes: prioridade, roubo de voz e coalescência (~1 frame)
+                self.sfx_mixer.play(sound_name, sound)
+    
+    def begin_frame(self):
+        """Marcar início de um frame do jogo (fecha as estatísticas de SFX do frame)"""
+        self.sfx_mixer.begin_frame()
+    
+    def get_sfx_stats(self):
+        """Pedidos de SFX tocados/mesclados/descartados no último frame e acumulados"""
+        return self.sfx_mixer.get_stats()
     
     def start_background_music(self):
-        """Iniciar música de fundo em thread separada"""
+        """Iniciar música de fundo (thread de renderização + thread de reprodução)"""
         if not self.music_running:
             self.music_running = True
+            self.prepared_tracks = queue.Queue(maxsize=self.music_lookahead)
+            self.queued_track = None
+            self.music_render_thread = threading.Thread(target=self._music_render_loop, daemon=True)
+            self.music_render_thread.start()
             self.music_thread = threading.Thread(target=self._music_loop, daemon=True)
             self.music_thread.start()
     
     def stop_background_music(self):
         """Parar música de fundo"""
         self.music_running = False
-        self.music_channel.stop()
+        self.music_channel.stop()  # Também descarta a track em Channel.queue
+        self.queued_track = None
+        
+        for thread in (self.music_thread, self.music_render_thread):
+            if thread is not None and thread is not threading.current_thread():
+                thread.join(timeout=1.0)
+    
+    def _music_render_loop(self):
+        """Renderizar os próximos chunks enquanto o atual toca (lookahead)"""
+        track_number = self.current_track
+        while self.music_running:
+            chunks = self.music_chunk_sounds(track_number)
+            while self.music_running:
+                start = time.perf_counter()
+                music_sound = next(chunks, None)
+                if music_sound is None:
+                    break
+                self._record_render_time((time.perf_counter() - start) * 1000)
+                
+                # Esperar espaço na fila (com check periódico para parar)
+                while self.music_running:
+                    try:
+                        self.prepared_tracks.put((track_number, music_sound), timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+            
+            self.music_metrics['tracks_rendered'] += 1
+            track_number = (track_number + 1) % len(self.chiptune_progressions)
+    
+    def _record_render_time(self, elapsed_ms):
+        """Registrar tempo de renderização de um chunk"""
+        render_times = self.music_metrics['render_times_ms']
+        render_times.append(elapsed_ms)
+        if len(render_times) > 64:
+            del render_times[0]
+        self.music_metrics['chunks_rendered'] += 1
+    
+    def _start_music_chunk(self, track_number):
+        """Contabilizar início de um chunk (e de uma nova track)"""
+        if track_number != self.current_track or self.music_metrics['chunks_played'] == 0:
+            self.music_metrics['tracks_played'] += 1
+        self.current_track = track_number
+        self.music_metrics['chunks_played'] += 1
     
     def _music_loop(self):
-        """Loop da música de fundo"""
+        """Loop da música de fundo: entrega o próximo chunk via Channel.queue (sem pausa)"""
+        started = False
+        starving = False
         while self.music_running:
-            # Criar nova track
-            music_sound = self.create_background_music(self.current_track)
+            if not self.music_channel.get_busy():
+                # Canal parado: o próximo chunk não ficou pronto a tempo
+                if started and not starving:
+                    self.music_metrics['underruns'] += 1
+                    starving = True
+                try:
+                    track_number, music_sound = self.prepared_tracks.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                starving = False
+                self.queued_track = None
+                self.music_channel.play(music_sound)
+                self._start_music_chunk(track_number)
+                started = True
             
-            # Tocar música
-            self.music_channel.play(music_sound)
+            elif self.queued_track is not None and self.music_channel.get_queue() is None:
+                # O chunk enfileirado começou a tocar
+                self._start_music_chunk(self.queued_track)
+                self.queued_track = None
             
-            # Esperar terminar (com check periódico para parar)
-            while self.music_channel.get_busy() and self.music_running:
-                time.sleep(0.1)
+            if self.queued_track is None and self.music_channel.get_busy():
+                # Enfileirar o próximo assim que estiver pronto
+                try:
+                    track_number, music_sound = self.prepared_tracks.get_nowait()
+                except queue.Empty:
+                    pass
+                else:
+                    self.music_channel.queue(music_sound)
+                    self.queued_track = track_number
             
-            # Próxima track
-            self.current_track = (self.current_track + 1) % len(self.chiptune_progressions)
+            time.sleep(0.02)
+    
+    def get_music_metrics(self):
+        """Métricas do renderizador de música (tempo de render, fila, underruns)"""
+        render_times = self.music_metrics['render_times_ms']
+        queue_depth = self.prepared_tracks.qsize() + (1 if self.queued_track is not None else 0)
+        return {
+            'last_render_ms': render_times[-1] if render_times else 0.0,
+            'avg_render_ms': sum(render_times) / len(render_times) if render_times else 0.0,
+            'max_render_ms': max(render_times) if render_times else 0.0,
+            'queue_depth': queue_depth,
+            'chunks_rendered': self.music_metrics['chunks_rendered'],
+            'chunks_played': self.music_metrics['chunks_played'],
+            'tracks_rendered': self.music_metrics['tracks_rendered'],
+            'tracks_played': self.music_metrics['tracks_played'],
+            'underruns': self.music_metrics['underruns']
+        }
     
     def set_volume(self, volume):
         """Ajustar volume geral"""
@@ -660,13 +1025,35 @@ class AudioEngine:
         # Ajustar volume dos canais individuais com levels mais baixos
         try:
             self.music_channel.set_volume(self.volume * 0.3)  # Música bem mais baixa
-            self.sfx_channel.set_volume(self.volume * 0.7)    # SFX moderado
+            self.sfx_mixer.set_volume(self.volume * 0.7)      # SFX moderado (todas as vozes)
             self.ambient_channel.set_volume(self.volume * 0.2)  # Ambiente muito baixo
         except pygame.error:
             pass  # Ignorar se mixer não estiver inicializado
     
+    def handoff(self, volume=None):
+        """
+        Passar o áudio para outra tela (menu, jogo, game over).
+        
+        Para SFX e som ambiente da tela anterior, mas mantém a música
+        tocando sem reiniciar o mixer nem perder os sons em cache.
+        """
+        self.ambient_channel.stop()
+        self.sfx_mixer.stop_all()
+        self.sfx_mixer.begin_frame()
+        if volume is not None:
+            self.set_volume(volume)
+        self.start_background_music()
+    
+    def release(self):
+        """Tela saindo: parar SFX e ambiente (o serviço continua vivo)"""
+        self.ambient_channel.stop()
+        self.sfx_mixer.stop_all()
+    
     def cleanup(self):
-        """Limpar recursos de áudio"""
+        """Limpar recursos de áudio (apenas no fim do processo)"""
+        if self.disk_cache is not None:
+            self.disk_cache.flush()
+        
         try:
             self.stop_background_music()
         except pygame.error:
@@ -675,4 +1062,71 @@ class AudioEngine:
         try:
             pygame.mixer.quit()
         except pygame.error:
-            pass  # Ignorar se mixer já foi finalizado
\ No newline at end of file
+            pass  # Ignorar se mixer já foi finalizado
+
+
+# Serviço de áudio único do processo (menu, jogo, loja, game over e reinícios)
+_audio_service = None
+_audio_service_lock = threading.Lock()
+
+
+def get_audio_service():
+    """Obter o AudioEngine compartilhado, criando-o (e o mixer) só na primeira vez"""
+    global _audio_service
+    with _audio_service_lock:
+        if _audio_service is None:
+            _audio_service = AudioEngine()
+        return _audio_service
+
+
+# Engines de renderização reaproveitados dentro de cada processo do warm-up
+_worker_engines = {}
+
+
+def _render_asset_in_worker(kind, key, sample_rate, channels):
+    """Renderizar um asset num processo do ProcessPoolExecutor (devolve PCM cru)"""
+    engine = _worker_engines.get((sample_rate, channels))
+    if engine is None:
+        engine = AudioEngine(sample_rate, channels, use_disk_cache=False, init_mixer=False)
+        _worker_engines[(sample_rate, channels)] = engine
+    return engine.render_asset_pcm(kind, key)
+
+
+def profile_sound_bank_memory(dtype=np.float32, sample_rate=22050, channels=2):
+    """
+    Pico de memória (tracemalloc) ao renderizar todo o banco de sons.
+    
+    Returns:
+        Dict {nome_do_asset: pico em bytes} com 'total' = maior pico
+    """
+    import tracemalloc
+    
+    engine = AudioEngine(sample_rate, channels, use_disk_cache=False, init_mixer=False)
+    engine.dsp_dtype = dtype
+    assets = [('sfx', name) for name in engine.sfx_generators()]
+    assets += [('music', track) for track in range(len(engine.chiptune_progressions))]
+    
+    peaks = {}
+    tracemalloc.start()
+    try:
+        for kind, key in assets:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            pcm = engine.render_asset_pcm(kind, key)
+            peaks[engine._asset_name(kind, key)] = tracemalloc.get_traced_memory()[1] - baseline
+            del pcm
+    finally:
+        tracemalloc.stop()
+    
+    peaks['total'] = max(peaks.values())
+    return peaks
+
+
+if __name__ == "__main__":
+    # Benchmark de memória do pipeline DSP in-place: buffers float64 vs float32
+    print("🧠 Pico de memória ao renderizar o banco de sons (tracemalloc)")
+    reference = profile_sound_bank_memory(np.float64)
+    optimized = profile_sound_bank_memory(np.float32)
+    for name in optimized:
+        print(f"   {name:24s} float64: {reference[name] / 1024:8.0f} KB   "
+              f"float32: {optimized[name] / 1024:8.0f} KB")
@@ -0,0 +1,261 @@
+"""
+Síntese vetorizada de formas de onda para o AudioEngine
+- Geração de sine/square/sawtooth/triangle/pulse como operações de array inteiro
+- Implementações de referência (loop amostra a amostra) para comparação bit a bit
+- Micro-benchmark de amostras/segundo por tipo de onda
+
+Uso: python audio_synthesis.py
+"""
+
+import math
+import random
+import time
+import numpy as np
+
+WAVE_TYPES = ['sine', 'square', 'sawtooth', 'triangle', 'pulse', 'triangle_8bit', 'sweep']
+
+# Harmônicos do laser (fundamental + 2ª e 3ª harmônicas)
+LASER_HARMONICS = ((1, 0.8), (2, 0.15), (3, 0.05))
+
+
+def time_axis(frames, sample_rate):
+    """Eixo de tempo (em segundos) idêntico ao float(i) / sample_rate do loop original"""
+    return np.arange(frames, dtype=np.float64) / sample_rate
+
+
+def generate_wave(frequency, duration, sample_rate, wave_type='sine', amplitude=0.5, dtype=np.float64):
+    """
+    Gerar onda sonora procedural de uma só vez (sem loop Python).
+
+    Os cálculos são feitos em float64 in-place sobre o eixo de tempo e só o
+    resultado é convertido para `dtype` (float32 no pipeline do AudioEngine).
+    """
+    frames = int(duration * sample_rate)
+    t = time_axis(frames, sample_rate)
+
+    if wave_type == 'sine' or wave_type == 'square':
+        np.multiply(t, 2 * np.pi * frequency, out=t)
+        np.sin(t, out=t)
+        if wave_type == 'square':
+            np.sign(t, out=t)
+        np.multiply(t, amplitude, out=t)
+        return t.astype(dtype, copy=False)
+    elif wave_type == 'sawtooth' or wave_type == 'triangle':
+        ft = np.multiply(t, frequency, out=t)
+        rounded = np.add(ft, 0.5)
+        np.floor(rounded, out=rounded)
+        np.subtract(ft, rounded, out=ft)
+        np.multiply(ft, 2, out=ft)
+        if wave_type == 'triangle':
+            np.abs(ft, out=ft)
+            np.multiply(ft, 2, out=ft)
+            np.subtract(ft, 1, out=ft)
+        np.multiply(ft, amplitude, out=ft)
+        return ft.astype(dtype, copy=False)
+    elif wave_type == 'noise':
+        # Ruído usa o gerador do NumPy: não é comparável bit a bit com random.uniform
+        return (amplitude * np.random.uniform(-1, 1, frames)).astype(dtype, copy=False)
+
+    return np.zeros(frames, dtype=dtype)
+
+
+def _phase(frequency, frames, sample_rate):
+    """Fase normalizada [0, 1) calculada in-place sobre o eixo de tempo"""
+    t = time_axis(frames, sample_rate)
+    np.multiply(t, frequency, out=t)
+    return np.mod(t, 1.0, out=t)
+
+
+def generate_pulse_wave(frequency, duration, sample_rate, duty_cycle=0.5, dtype=np.float64):
+    """Gerar pulse wave estilo 8-bit de uma só vez"""
+    frames = int(duration * sample_rate)
+    phase = _phase(frequency, frames, sample_rate)
+    wave = np.full(frames, -0.5, dtype=dtype)  # Amplitude controlada (±0.5)
+    wave[phase < duty_cycle] = 0.5
+    return wave
+
+
+def generate_triangle_wave(frequency, duration, sample_rate, dtype=np.float64):
+    """Gerar triangle wave estilo 8-bit de uma só vez"""
+    frames = int(duration * sample_rate)
+    phase = _phase(frequency, frames, sample_rate)
+    rising = phase < 0.5
+    np.multiply(phase, 4, out=phase)
+    wave = np.subtract(3, phase)                     # Descida: 3 - 4 * fase
+    np.subtract(phase, 1, out=phase)
+    wave[rising] = phase[rising]                     # Subida: 4 * fase - 1
+    np.multiply(wave, 0.7, out=wave)                 # Amplitude típica do triangle
+    return wave.astype(dtype, copy=False)
+
+
+def generate_sweep(start_freq, end_freq, duration, sample_rate, harmonics=((1, 1.0),), dtype=np.float64):
+    """Gerar varredura linear de frequência com harmônicos (usado pelo laser)"""
+    frames = int(duration * sample_rate)
+    t = time_axis(frames, sample_rate)
+    progress = np.arange(frames) / frames if frames > 0 else np.zeros(0)
+    freq = start_freq + (end_freq - start_freq) * progress
+
+    wave = np.zeros(frames)
+    for multiple, gain in harmonics:
+        wave += gain * np.sin(2 * np.pi * freq * multiple * t)
+    return wave.astype(dtype, copy=False)
+
+
+# =============================================================================
+# IMPLEMENTAÇÕES DE REFERÊNCIA (loop original, usadas só para comparação)
+# =============================================================================
+
+def generate_wave_reference(frequency, duration, sample_rate, wave_type='sine', amplitude=0.5):
+    """Versão original amostra a amostra de generate_wave"""
+    frames = int(duration * sample_rate)
+    arr = np.zeros(frames)
+
+    for i in range(frames):
+        t = float(i) / sample_rate
+
+        if wave_type == 'sine':
+            arr[i] = amplitude * np.sin(2 * np.pi * frequency * t)
+        elif wave_type == 'square':
+            arr[i] = amplitude * np.sign(np.sin(2 * np.pi * frequency * t))
+        elif wave_type == 'sawtooth':
+            arr[i] = amplitude * (2 * (t * frequency - np.floor(t * frequency + 0.5)))
+        elif wave_type == 'triangle':
+            arr[i] = amplitude * (2 * np.abs(2 * (t * frequency - np.floor(t * frequency + 0.5))) - 1)
+        elif wave_type == 'noise':
+            arr[i] = amplitude * random.uniform(-1, 1)
+
+    return arr
+
+
+def generate_pulse_wave_reference(frequency, duration, sample_rate, duty_cycle=0.5):
+    """Versão original amostra a amostra de generate_pulse_wave"""
+    frames = int(duration * sample_rate)
+    wave = np.zeros(frames)
+
+    for i in range(frames):
+        t = float(i) / sample_rate
+        phase = (frequency * t) % 1.0
+        wave[i] = 1.0 if phase < duty_cycle else -1.0
+
+    return wave * 0.5
+
+
+def generate_triangle_wave_reference(frequency, duration, sample_rate):
+    """Versão original amostra a amostra de generate_triangle_wave"""
+    frames = int(duration * sample_rate)
+    wave = np.zeros(frames)
+
+    for i in range(frames):
+        t = float(i) / sample_rate
+        phase = (frequency * t) % 1.0
+        if phase < 0.5:
+            wave[i] = 4 * phase - 1
+        else:
+            wave[i] = 3 - 4 * phase
+
+    return wave * 0.7
+
+
+def generate_sweep_reference(start_freq, end_freq, duration, sample_rate, harmonics=((1, 1.0),)):
+    """Versão original amostra a amostra da varredura do laser"""
+    frames = int(duration * sample_rate)
+    wave = np.zeros(frames)
+
+    for i in range(frames):
+        t = float(i) / sample_rate
+        progress = i / frames
+        freq = start_freq + (end_freq - start_freq) * progress
+        wave[i] = sum(gain * np.sin(2 * np.pi * freq * multiple * t) for multiple, gain in harmonics)
+
+    return wave
+
+
+def _render_pair(wave_type, frequency, duration, sample_rate):
+    """Renderizar (vetorizado, referência) para um tipo de onda"""
+    if wave_type == 'pulse':
+        return (generate_pulse_wave(frequency, duration, sample_rate, 0.25),
+                generate_pulse_wave_reference(frequency, duration, sample_rate, 0.25))
+    if wave_type == 'triangle_8bit':
+        return (generate_triangle_wave(frequency, duration, sample_rate),
+                generate_triangle_wave_reference(frequency, duration, sample_rate))
+    if wave_type == 'sweep':
+        return (generate_sweep(frequency * 4, frequency, duration, sample_rate, LASER_HARMONICS),
+                generate_sweep_reference(frequency * 4, frequency, duration, sample_rate, LASER_HARMONICS))
+    return (generate_wave(frequency, duration, sample_rate, wave_type, 0.5),
+            generate_wave_reference(frequency, duration, sample_rate, wave_type, 0.5))
+
+
+def compare_with_reference(sample_rate=22050, frequencies=(50, 261.63, 1200), duration=0.5):
+    """
+    Comparar a síntese vetorizada com o loop original.
+
+    Returns:
+        Dict {wave_type: {'bit_exact': bool, 'max_error': float}}
+    """
+    report = {}
+    for wave_type in WAVE_TYPES:
+        bit_exact = True
+        max_error = 0.0
+        for frequency in frequencies:
+            fast, reference = _render_pair(wave_type, frequency, duration, sample_rate)
+            if fast.shape != reference.shape:
+                bit_exact = False
+                max_error = math.inf
+                continue
+            bit_exact = bit_exact and np.array_equal(fast, reference)
+            if len(fast) > 0:
+                max_error = max(max_error, float(np.max(np.abs(fast - reference))))
+        report[wave_type] = {'bit_exact': bit_exact, 'max_error': max_error}
+    return report
+
+
+def benchmark(sample_rate=22050, duration=1.0, repeats=5, include_reference=True):
+    """
+    Medir amostras/segundo de cada tipo de onda.
+
+    Returns:
+        Dict {wave_type: {'vectorized': sps, 'reference': sps}}
+    """
+    results = {}
+    frames = int(duration * sample_rate)
+
+    for wave_type in WAVE_TYPES:
+        if wave_type == 'pulse':
+            fast = lambda: generate_pulse_wave(440.0, duration, sample_rate, 0.25)
+            slow = lambda: generate_pulse_wave_reference(440.0, duration, sample_rate, 0.25)
+        elif wave_type == 'triangle_8bit':
+            fast = lambda: generate_triangle_wave(440.0, duration, sample_rate)
+            slow = lambda: generate_triangle_wave_reference(440.0, duration, sample_rate)
+        elif wave_type == 'sweep':
+            fast = lambda: generate_sweep(500, 120, duration, sample_rate, LASER_HARMONICS)
+            slow = lambda: generate_sweep_reference(500, 120, duration, sample_rate, LASER_HARMONICS)
+        else:
+            fast = lambda wt=wave_type: generate_wave(440.0, duration, sample_rate, wt)
+            slow = lambda wt=wave_type: generate_wave_reference(440.0, duration, sample_rate, wt)
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            fast()
+        elapsed = time.perf_counter() - start
+        results[wave_type] = {'vectorized': frames * repeats / max(elapsed, 1e-9)}
+
+        if include_reference:
+            start = time.perf_counter()
+            slow()
+            elapsed = time.perf_counter() - start
+            results[wave_type]['reference'] = frames / max(elapsed, 1e-9)
+
+    return results
+
+
+if __name__ == "__main__":
+    print("🎵 Síntese vetorizada - comparação com o loop original")
+    for wave_type, result in compare_with_reference().items():
+        status = "✅ bit a bit" if result['bit_exact'] else f"⚠️ erro máx {result['max_error']:.3e}"
+        print(f"   {wave_type:14s} {status}")
+
+    print("\n⏱️ Benchmark (amostras/segundo)")
+    for wave_type, result in benchmark().items():
+        speedup = result['vectorized'] / result['reference']
+        print(f"   {wave_type:14s} {result['vectorized']:>14,.0f}  "
+              f"(loop: {result['reference']:>10,.0f}, {speedup:.0f}x)")
@@ -1,5 +1,6 @@
 import pygame
-import colorsys
+from color_lut import hsv_color
+from particle_budget import get_particle_budget
 
 class Bullet(pygame.sprite.Sprite):
     def __init__(self, x, y, direction=-1, color=(255, 255, 0), speed=8, damage=1):
@@ -49,7 +50,7 @@ class Bullet(pygame.sprite.Sprite):
         
         # Adicionar posição atual ao rastro
         self.trail.append((self.x, self.y))
-        if len(self.trail) > 5:
+        while len(self.trail) > get_particle_budget().get('bullet_trail'):
             self.trail.pop(0)
         
         # Remover se saiu da tela
@@ -70,8 +71,7 @@ class Bullet(pygame.sprite.Sprite):
         # Desenhar projétil principal
         time_factor = self.animation_frame * 0.2
         hue = (time_factor) % 1.0
-        rgb = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-        bullet_color = tuple(int(c * 255) for c in rgb)
+        bullet_color = hsv_color(hue)
         
         pygame.draw.circle(screen, bullet_color, (int(self.x), int(self.y)), 3)
         pygame.draw.circle(screen, (255, 255, 255), (int(self.x), int(self.y)), 1)
\ No newline at end of file
@@ -1,9 +1,16 @@
 import pygame
 import math
+import numpy as np
+from particle_system import ParticleSystem, LAYER_EFFECTS
+from particle_budget import get_particle_budget
 
 class CollisionManager:
-    def __init__(self):
+    def __init__(self, particle_system=None):
         self.collision_history = []  # Para debug
+        # Partículas de colisão vão para o sistema compartilhado (ou um próprio)
+        if particle_system is None:
+            particle_system = ParticleSystem(capacity=1024)
+        self.particle_system = particle_system
     
     def check_circle_collision(self, pos1, radius1, pos2, radius2):
         """Verificar colisão entre dois círculos"""
@@ -91,28 +98,25 @@ class CollisionManager:
         return collisions
     
     def check_terrain_collision(self, entity, level_generator):
-        """Verificar colisão com o terreno"""
+        """Verificar colisão com o terreno (paredes e obstáculos via índice por faixas de y)"""
         entity_rect = pygame.Rect(entity.x - entity.width//2, 
                                 entity.y - entity.height//2,
                                 entity.width, entity.height)
         
-        collision_rects = level_generator.get_collision_rects()
-        
-        for rect in collision_rects:
-            if self.check_rect_collision(entity_rect, rect):
-                return True
-        
-        return False
+        # Índice em coordenadas de mundo; o scroll leva os retângulos para a tela
+        return level_generator.collision_index.collides(entity_rect.left, entity_rect.top,
+                                                        entity_rect.right, entity_rect.bottom,
+                                                        level_generator.scroll)
     
-    def check_powerup_collision(self, player, powerups):
-        """Verificar colisão entre jogador e power-ups"""
+    def check_powerup_collision(self, player, powerups, scroll=0):
+        """Verificar colisão entre jogador e power-ups (y dos power-ups + scroll = y de tela)"""
         collisions = []
         player_pos = (player.x, player.y)
         player_radius = player.width // 2
         
         for powerup in powerups:
             if not powerup.get('collected', False):
-                powerup_pos = (powerup['x'], powerup['y'])
+                powerup_pos = (powerup['x'], powerup['y'] + scroll)
                 powerup_radius = 15
                 
                 if self.check_circle_collision(player_pos, player_radius,
@@ -177,58 +181,26 @@ class CollisionManager:
         })
     
     def create_collision_particles(self, position, effect_data):
-        """Criar partículas de efeito de colisão"""
-        import random
-        
-        particles = []
-        
-        for _ in range(effect_data.get('particles', 5)):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(*effect_data.get('speed_range', (2, 5)))
-            size = random.uniform(*effect_data.get('size_range', (1, 3)))
-            color = random.choice(effect_data.get('colors', [(255, 255, 255)]))
-            
-            particle = {
-                'x': position[0],
-                'y': position[1],
-                'vel_x': math.cos(angle) * speed,
-                'vel_y': math.sin(angle) * speed,
-                'size': size,
-                'color': color,
-                'life': random.randint(20, 40),
-                'max_life': 40
-            }
-            
-            particles.append(particle)
-        
-        
-        return particles
-    
-    def update_collision_particles(self, particles):
-        """Atualizar partículas de colisão"""
-        for particle in particles[:]:  # Iterar sobre cópia
-            particle['x'] += particle['vel_x']
-            particle['y'] += particle['vel_y']
-            particle['life'] -= 1
-            
-            # Reduzir velocidade por atrito
-            particle['vel_x'] *= 0.98
-            particle['vel_y'] *= 0.98
-            
-            if particle['life'] <= 0:
-                particles.remove(particle)
-    
-    def draw_collision_particles(self, screen, particles):
-        """Desenhar partículas de colisão"""
-        for particle in particles:
-            alpha = particle['life'] / particle['max_life']
-            size = max(1, int(particle['size'] * alpha))
-            
-            # Aplicar transparência à cor
-            color = [int(c * alpha) for c in particle['color']]
-            
-            pygame.draw.circle(screen, color,
-                             (int(particle['x']), int(particle['y'])), size)
+        """
+        Criar partículas de efeito de colisão no sistema de partículas.
+        
+        Returns:
+            número de partículas emitidas
+        """
+        count = get_particle_budget().scaled(effect_data.get('particles', 5))
+        size_range = effect_data.get('size_range', (1, 3))
+        colors = np.array(effect_data.get('colors', [(255, 255, 255)]))
+        
+        return self.particle_system.emit_burst(
+            position[0], position[1], count,
+            effect_data.get('speed_range', (2, 5)),
+            (20, 40),
+            color=colors[np.random.randint(0, len(colors), count)],
+            max_life=40,
+            size=np.random.uniform(size_range[0], size_range[1], count),
+            drag=0.98,  # Atrito
+            layer=LAYER_EFFECTS
+        )
     
     def debug_draw_collision_boxes(self, screen, entities):
         """Desenhar caixas de colisão para debug"""
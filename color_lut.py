@@ -0,0 +1,134 @@
+"""
+Cores psicodélicas: tabela HSV→RGB pré-calculada (LUT) compartilhada
+- hsv_color: uma cor (tupla RGB 0-255) por consulta na tabela, sem colorsys
+- hsv_colors: versão em lote para arrays de tons (indexação NumPy na mesma tabela)
+- hsv_to_rgb_array: conversão exata vetorizada (paletas, gradientes suaves)
+- A tabela é quantizada em (tom, saturação, brilho) e criada na primeira consulta
+
+Uso: python color_lut.py  (micro-benchmark: chamadas/segundo vs colorsys)
+"""
+
+import numpy as np
+
+# Níveis de quantização: 256 tons, saturação em passos de 0.1, brilho em 32 níveis
+HUE_LEVELS = 256
+SATURATION_LEVELS = 11
+VALUE_LEVELS = 32
+
+_lut_array = None   # (HUE_LEVELS, SATURATION_LEVELS, VALUE_LEVELS, 3) uint8
+_lut_tuples = None  # mesma tabela achatada como tuplas (consulta escalar rápida)
+
+
+def hsv_to_rgb_array(hue, saturation=1.0, value=1.0):
+    """
+    Converter arrays HSV (0-1) para RGB (0-255) de uma vez, sem quantização.
+
+    Returns:
+        array (..., 3) float32
+    """
+    hue = np.asarray(hue, dtype=np.float32)
+    h6 = (hue % 1.0) * 6.0
+    sector = h6.astype(np.int32) % 6
+    f = h6 - np.floor(h6)
+    v = np.broadcast_to(np.float32(value), hue.shape)
+    s = np.float32(saturation)
+    p = v * (1 - s)
+    q = v * (1 - s * f)
+    t = v * (1 - s * (1 - f))
+
+    # (r, g, b) de cada um dos 6 setores do círculo de cores
+    r = np.choose(sector, [v, q, p, p, t, v])
+    g = np.choose(sector, [t, v, v, q, p, p])
+    b = np.choose(sector, [p, p, t, v, v, q])
+    return np.stack([r, g, b], axis=-1) * 255
+
+
+def build_lut():
+    """Calcular a tabela inteira (uma vez por processo)"""
+    global _lut_array, _lut_tuples
+    hues = np.arange(HUE_LEVELS) / HUE_LEVELS
+    saturations = np.linspace(0, 1, SATURATION_LEVELS)
+    values = np.linspace(0, 1, VALUE_LEVELS)
+
+    full = hsv_to_rgb_array(hues)[:, None, None, :]  # Saturação e brilho máximos
+    s = saturations[None, :, None, None]
+    v = values[None, None, :, None]
+    lut = v * (255 - s * (255 - full))
+    _lut_array = np.clip(lut, 0, 255).astype(np.uint8)
+    _lut_tuples = [tuple(color) for color in _lut_array.reshape(-1, 3).tolist()]
+    return _lut_array
+
+
+def hsv_color(hue, saturation=1.0, value=1.0):
+    """
+    Cor RGB (tupla de ints 0-255) de um tom/saturação/brilho, via tabela.
+
+    O tom dá a volta (qualquer valor real); saturação e brilho são limitados a 0-1.
+    """
+    if _lut_tuples is None:
+        build_lut()
+    h = int(hue * HUE_LEVELS) % HUE_LEVELS
+    s = int(saturation * (SATURATION_LEVELS - 1) + 0.5)
+    v = int(value * (VALUE_LEVELS - 1) + 0.5)
+    if not 0 <= s < SATURATION_LEVELS:
+        s = 0 if s < 0 else SATURATION_LEVELS - 1
+    if not 0 <= v < VALUE_LEVELS:
+        v = 0 if v < 0 else VALUE_LEVELS - 1
+    return _lut_tuples[(h * SATURATION_LEVELS + s) * VALUE_LEVELS + v]
+
+
+def hsv_colors(hues, saturation=1.0, value=1.0):
+    """
+    Cores de vários tons de uma vez (saturação/brilho escalares ou arrays).
+
+    Returns:
+        array (N, 3) uint8
+    """
+    lut = _lut_array if _lut_array is not None else build_lut()
+    h = (np.asarray(hues, dtype=np.float64) * HUE_LEVELS).astype(np.int64) % HUE_LEVELS
+    s = np.clip(np.rint(np.asarray(saturation) * (SATURATION_LEVELS - 1)), 0,
+                SATURATION_LEVELS - 1).astype(np.int64)
+    v = np.clip(np.rint(np.asarray(value) * (VALUE_LEVELS - 1)), 0,
+                VALUE_LEVELS - 1).astype(np.int64)
+    return lut[h, s, v]
+
+
+def benchmark(calls=200000):
+    """Comparar chamadas/segundo: colorsys + int() vs tabela (escalar e em lote)"""
+    import colorsys
+    import random
+    import time
+
+    hues = [random.random() for _ in range(calls)]
+    values = [random.uniform(0.3, 1.0) for _ in range(calls)]
+
+    start = time.perf_counter()
+    for hue, value in zip(hues, values):
+        rgb = colorsys.hsv_to_rgb(hue % 1.0, 1.0, value)
+        tuple(int(c * 255) for c in rgb)
+    colorsys_time = time.perf_counter() - start
+
+    build_start = time.perf_counter()
+    build_lut()
+    build_time = time.perf_counter() - build_start
+
+    start = time.perf_counter()
+    for hue, value in zip(hues, values):
+        hsv_color(hue, 1.0, value)
+    lut_time = time.perf_counter() - start
+
+    hue_array = np.array(hues)
+    value_array = np.array(values)
+    start = time.perf_counter()
+    hsv_colors(hue_array, 1.0, value_array)
+    batch_time = time.perf_counter() - start
+
+    print(f"🎨 HSV→RGB ({calls} cores)")
+    print(f"   colorsys:        {calls / colorsys_time:12,.0f} chamadas/s")
+    print(f"   hsv_color (LUT): {calls / lut_time:12,.0f} chamadas/s ({colorsys_time / lut_time:.1f}x)")
+    print(f"   hsv_colors lote: {calls / batch_time:12,.0f} cores/s ({colorsys_time / batch_time:.0f}x)")
+    print(f"   Tabela: {_lut_array.nbytes / 1024:.0f} KB, criada em {build_time * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    benchmark()
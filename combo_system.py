@@ -1,5 +1,6 @@
 import pygame
 import math
+from text_cache import get_text_cache
 
 class ComboSystem:
     """Sistema de combo com feedback visual"""
@@ -11,6 +12,8 @@ class ComboSystem:
         self.font_large = pygame.font.Font(None, 80)
         self.font_medium = pygame.font.Font(None, 50)
         self.font_small = pygame.font.Font(None, 30)
+        self.font_tiny = pygame.font.Font(None, 20)
+        self.text_cache = get_text_cache()
         
         # Floating text
         self.floating_texts = []
@@ -183,17 +186,17 @@ class ComboSystem:
             
             # Texto menor
             color = self.get_combo_color()
-            text_surf = self.font_medium.render(combo_text, True, color)  # font_medium em vez de large
+            text_surf = self.text_cache.render(self.font_medium, combo_text, color)  # font_medium em vez de large
             text_rect = text_surf.get_rect(center=(screen_width // 2, combo_y))
             
             # Sombra sutil
-            shadow_surf = self.font_medium.render(combo_text, True, (0, 0, 0))
+            shadow_surf = self.text_cache.render(self.font_medium, combo_text, (0, 0, 0))
             shadow_rect = shadow_surf.get_rect(center=(screen_width // 2 + 2, combo_y + 2))
             screen.blit(shadow_surf, shadow_rect)
             screen.blit(text_surf, text_rect)
             
             # Multiplicador menor
-            mult_surf = self.font_small.render(multiplier_text, True, (255, 215, 0))
+            mult_surf = self.text_cache.render(self.font_small, multiplier_text, (255, 215, 0))
             mult_rect = mult_surf.get_rect(center=(screen_width // 2, combo_y + 35))
             screen.blit(mult_surf, mult_rect)
             
@@ -220,26 +223,22 @@ class ComboSystem:
             if text_obj['size'] == 'large':
                 font = self.font_medium  # Reduzido
             elif text_obj['size'] == 'small':
-                font = pygame.font.Font(None, 20)  # Ainda menor
+                font = self.font_tiny  # Ainda menor
             else:
                 font = self.font_small
             
-            text_surf = font.render(text_obj['text'], True, text_obj['color'])
+            # Texto já escalado vem do cache; o alpha é ajustado antes de cada blit
+            text_surf = self.text_cache.render(font, text_obj['text'], text_obj['color'],
+                                               scale=text_obj['scale'])
             text_surf.set_alpha(max(0, int(text_obj['alpha'])))
             
-            # Aplicar escala
-            if text_obj['scale'] != 1.0:
-                width = int(text_surf.get_width() * text_obj['scale'])
-                height = int(text_surf.get_height() * text_obj['scale'])
-                text_surf = pygame.transform.scale(text_surf, (width, height))
-            
             text_rect = text_surf.get_rect(center=(int(text_obj['x']), int(text_obj['y'])))
             screen.blit(text_surf, text_rect)
         
         # Indicador de slow motion COMPACTO (canto inferior direito)
         if self.is_slow_motion():
             slow_text = "⏱️ SLOW-MO"
-            slow_surf = self.font_small.render(slow_text, True, (0, 255, 255))
+            slow_surf = self.text_cache.render(self.font_small, slow_text, (0, 255, 255))
             slow_rect = slow_surf.get_rect(bottomright=(screen_width - 20, screen_height - 20))
             
             # Efeito piscante sutil
@@ -1,7 +1,14 @@
 import pygame
 import math
 import random
-import colorsys
+import numpy as np
+from particle_system import ExplosionParticles
+from color_lut import hsv_color, hsv_colors, hsv_to_rgb_array
+from particle_budget import get_particle_budget, MAX_EXPLOSION_PARTICLES
+
+# Entradas da paleta do gradiente de fundo (uma volta completa no círculo de cores)
+BACKGROUND_PALETTE_SIZE = 256
+BACKGROUND_BAND_HEIGHT = 4
 
 class PsychedelicEffects:
     def __init__(self, width, height):
@@ -21,6 +28,17 @@ class PsychedelicEffects:
             }
             self.wave_patterns.append(pattern)
         
+        # Parâmetros das ondas em arrays (uma linha por padrão) e eixo x das ondas
+        self.wave_params = {
+            key: np.array([[pattern[key]] for pattern in self.wave_patterns])
+            for key in ('amplitude', 'frequency', 'phase', 'speed', 'hue_base')
+        }
+        self.wave_x = np.arange(0, width, 8)
+        
+        # Gradiente de fundo em cache (superfície 8-bit; só a paleta muda por frame)
+        self.background = None
+        self.background_hues = np.arange(BACKGROUND_PALETTE_SIZE) / BACKGROUND_PALETTE_SIZE
+        
         # Partículas flutuantes
         self.floating_particles = []
         for _ in range(30):
@@ -41,6 +59,11 @@ class PsychedelicEffects:
                 'hue_offset': i * 0.1
             }
             self.tunnel_rings.append(ring)
+        
+        # Explosões gigantes (arrays NumPy; teto definido pelo nível de qualidade)
+        self.particle_budget = get_particle_budget()
+        self.explosions = ExplosionParticles(capacity=MAX_EXPLOSION_PARTICLES)
+        self.particle_budget.register(self.explosions, 'max_explosion_particles')
     
     def create_floating_particle(self):
         """Criar partícula flutuante"""
@@ -105,44 +128,59 @@ class PsychedelicEffects:
                 ring['z'] = 400
                 ring['radius'] = random.uniform(30, 80)
     
+    def build_background(self):
+        """
+        Criar a superfície 8-bit do gradiente (uma vez).
+        
+        Cada faixa de 4 px guarda o índice do seu tom na paleta; o color_shift
+        só gira a paleta, então a superfície nunca precisa ser redesenhada.
+        """
+        band_top = np.arange(self.height) // BACKGROUND_BAND_HEIGHT * BACKGROUND_BAND_HEIGHT
+        progress = band_top / self.height
+        indices = (progress * 0.5 * BACKGROUND_PALETTE_SIZE).astype(np.uint8)
+        
+        background = pygame.Surface((self.width, self.height), depth=8)
+        pygame.surfarray.blit_array(background, np.broadcast_to(indices, (self.width, self.height)))
+        return background
+    
+    def get_background(self):
+        """Superfície 8-bit do gradiente (criada no primeiro uso)"""
+        if self.background is None:
+            self.background = self.build_background()
+        return self.background
+    
     def draw_background(self, screen, color_shift):
         """Desenhar fundo psicodélico"""
-        # Gradiente de fundo animado
-        for y in range(0, self.height, 4):
-            progress = y / self.height
-            hue = (color_shift + progress * 0.5) % 1.0
-            rgb = colorsys.hsv_to_rgb(hue, 0.8, 0.3)
-            color = tuple(int(c * 255) for c in rgb)
-            
-            pygame.draw.rect(screen, color, (0, y, self.width, 4))
+        # Gradiente de fundo animado: girar a paleta e um único blit
+        background = self.get_background()
+        hues = (color_shift + self.background_hues) % 1.0
+        palette = hsv_to_rgb_array(hues, 0.8, 0.3).astype(np.int32)
+        background.set_palette([tuple(color) for color in palette.tolist()])
+        screen.blit(background, (0, 0))
         
         # Ondas de fundo
-        for pattern in self.wave_patterns:
-            self.draw_wave_pattern(screen, pattern, color_shift)
+        self.draw_wave_patterns(screen, color_shift)
     
-    def draw_wave_pattern(self, screen, pattern, color_shift):
-        """Desenhar padrão de ondas"""
-        points = []
+    def draw_wave_patterns(self, screen, color_shift, colors=None):
+        """
+        Desenhar padrões de ondas (todas as ondas calculadas de uma vez).
         
-        for x in range(0, self.width, 8):
-            wave_y = (self.height // 2 + 
-                     pattern['amplitude'] * math.sin(
-                         x * pattern['frequency'] + 
-                         self.time * pattern['speed'] + 
-                         pattern['phase']
-                     ))
-            points.append((x, wave_y))
+        `colors` substitui as cores calculadas (ex.: índices de paleta no modo 8-bit).
+        """
+        params = self.wave_params
+        wave_y = (self.height // 2 +
+                  params['amplitude'] * np.sin(self.wave_x * params['frequency'] +
+                                               self.time * params['speed'] +
+                                               params['phase']))
         
-        if len(points) > 1:
-            hue = (pattern['hue_base'] + color_shift * 0.5) % 1.0
-            rgb = colorsys.hsv_to_rgb(hue, 1.0, 0.6)
-            color = tuple(int(c * 255) for c in rgb)
-            
-            # Desenhar linha espessa com transparência
-            try:
+        if colors is None:
+            hues = (params['hue_base'][:, 0] + color_shift * 0.5) % 1.0
+            colors = hsv_colors(hues, 1.0, 0.6).tolist()
+        
+        if len(self.wave_x) > 1:
+            for ys, color in zip(wave_y.tolist(), colors):
+                points = list(zip(self.wave_x.tolist(), ys))
                 pygame.draw.lines(screen, color, False, points, 3)
-            except:
-                pass  # Evitar erro se pontos inválidos
     
     def draw_effects(self, screen, color_shift):
         """Desenhar efeitos visuais principais"""
@@ -172,8 +210,7 @@ class PsychedelicEffects:
                     # Cor baseada na profundidade
                     depth_factor = ring['z'] / 400
                     hue = (color_shift + ring['hue_offset'] + depth_factor) % 1.0
-                    rgb = colorsys.hsv_to_rgb(hue, 1.0, 0.8 * (1 - depth_factor))
-                    color = tuple(int(c * 255) for c in rgb)
+                    color = hsv_color(hue, 1.0, 0.8 * (1 - depth_factor))
                     
                     # Desenhar anel rotacionado
                     points = []
@@ -199,8 +236,7 @@ class PsychedelicEffects:
             # Cor psicodélica
             hue = (particle['hue'] + color_shift * 0.3) % 1.0
             brightness = 0.7 + 0.3 * pulse
-            rgb = colorsys.hsv_to_rgb(hue, 1.0, brightness)
-            color = tuple(int(c * 255) for c in rgb)
+            color = hsv_color(hue, 1.0, brightness)
             
             # Desenhar partícula com halo
             pygame.draw.circle(screen, color, 
@@ -230,8 +266,7 @@ class PsychedelicEffects:
             
             # Cor baseada no índice e tempo
             hue = (point['index'] / 100 + color_shift) % 1.0
-            rgb = colorsys.hsv_to_rgb(hue, 1.0, 0.8)
-            color = tuple(int(c * 255) for c in rgb)
+            color = hsv_color(hue, 1.0, 0.8)
             
             if 0 <= x < self.width and 0 <= y < self.height:
                 size = max(1, int(3 + 2 * math.sin(self.time * 0.05 + point['index'])))
@@ -253,8 +288,7 @@ class PsychedelicEffects:
             
             # Cor do raio
             hue = (color_shift + i * 0.125) % 1.0
-            rgb = colorsys.hsv_to_rgb(hue, 1.0, 0.6)
-            color = tuple(int(c * 255) for c in rgb)
+            color = hsv_color(hue, 1.0, 0.6)
             
             # Desenhar raio com múltiplas linhas para espessura
             for thickness in range(3):
@@ -267,114 +301,112 @@ class PsychedelicEffects:
                 except:
                     pass
     
-    def create_giant_explosion(self, x, y, size_multiplier=1.0):
-        """Criar explosão GIGANTE e espetacular com muitas partículas psicodélicas"""
-        particles = []
-        num_particles = int(200 * size_multiplier)  # Muitas partículas!
+    def giant_explosion_counts(self, size_multiplier=1.0):
+        """(fagulhas, secundárias, anéis) de uma explosão gigante no nível atual"""
+        scale = self.particle_budget.get('explosion_scale')
+        return (int(200 * size_multiplier * scale), int(50 * size_multiplier * scale),
+                int(5 * size_multiplier))
+    
+    def giant_explosion_count(self, size_multiplier=1.0):
+        """Total de partículas que create_giant_explosion criaria no nível atual"""
+        return sum(self.giant_explosion_counts(size_multiplier))
+    
+    @staticmethod
+    def interleave_counts(counts):
+        """
+        Ordem dos itens de uma explosão fatiada: tipo (0, 1, 2...) de cada posição.
         
-        # Partículas principais (explosão radial)
-        for i in range(num_particles):
-            angle = (i / num_particles) * 2 * math.pi
-            speed = random.uniform(3, 12) * size_multiplier
-            
-            particle = {
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': random.uniform(0.8, 1.5),
-                'max_life': random.uniform(0.8, 1.5),
-                'size': random.uniform(4, 12) * size_multiplier,
-                'color': colorsys.hsv_to_rgb(random.uniform(0, 1), 1.0, 1.0),
-                'gravity': random.uniform(0.05, 0.2),
-                'trail': []
-            }
-            particles.append(particle)
+        O j-ésimo item de um tipo com n itens fica perto de (j + 0.5) / n da
+        explosão, então qualquer trecho tem todos os tipos na proporção certa.
+        """
+        positions = np.concatenate([(np.arange(n) + 0.5) / n for n in counts])
+        types = np.repeat(np.arange(len(counts)), counts)
+        return types[np.argsort(positions, kind='stable')]
+    
+    def create_giant_explosion(self, x, y, size_multiplier=1.0, start=0, stop=None):
+        """
+        Criar explosão GIGANTE e espetacular com muitas partículas psicodélicas.
+        
+        Tudo é gerado de uma vez (ângulos, velocidades e cores em arrays). A
+        quantidade segue o nível de qualidade e, se o orçamento estiver quase
+        cheio, a explosão é reduzida proporcionalmente em vez de estourar o frame.
+        `start`/`stop` criam só os itens [start, stop) da explosão (fatias do
+        EmissionScheduler), na ordem de interleave_counts: cada fatia cria
+        exatamente stop - start itens, com fagulhas, secundárias e anéis
+        divididos proporcionalmente, e as fatias somam a explosão inteira.
+        
+        Returns:
+            número de partículas criadas
+        """
+        explosions = self.explosions
+        counts = self.giant_explosion_counts(size_multiplier)
+        if start == 0 and stop is None:
+            first_particle = first_ring = 0
+            num_particles, num_secondary, num_rings = counts  # Muitas partículas!
+        else:
+            order = self.interleave_counts(counts)
+            first_particle, _, first_ring = np.bincount(order[:start], minlength=3).tolist()
+            num_particles, num_secondary, num_rings = np.bincount(order[start:stop], minlength=3).tolist()
+        
+        # Anéis têm prioridade (poucos e baratos); fagulhas dividem o que sobrar
+        num_rings = min(num_rings, explosions.limit - explosions.count)
+        available = explosions.limit - explosions.count - num_rings
+        requested = num_particles + num_secondary
+        if requested > available:
+            scale = max(0, available) / requested
+            explosions.dropped += requested - int(num_particles * scale) - int(num_secondary * scale)
+            num_particles = int(num_particles * scale)
+            num_secondary = int(num_secondary * scale)
+        
+        created = 0
+        
+        # Partículas principais (explosão radial; ângulos da explosão inteira)
+        if num_particles:
+            angles = (first_particle + np.arange(num_particles)) / counts[0] * 2 * np.pi
+            speeds = np.random.uniform(3, 12, num_particles) * size_multiplier
+            created += explosions.emit_sparks(
+                x, y, np.cos(angles) * speeds, np.sin(angles) * speeds,
+                life=np.random.uniform(0.8, 1.5, num_particles),
+                max_life=np.random.uniform(0.8, 1.5, num_particles),
+                size=np.random.uniform(4, 12, num_particles) * size_multiplier,
+                color=hsv_colors(np.random.uniform(0, 1, num_particles)),
+                gravity=np.random.uniform(0.05, 0.2, num_particles)
+            )
         
         # Partículas secundárias (mais lentas, maiores)
-        for i in range(int(50 * size_multiplier)):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 4) * size_multiplier
-            
-            particle = {
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': random.uniform(1.0, 2.0),
-                'max_life': random.uniform(1.0, 2.0),
-                'size': random.uniform(8, 20) * size_multiplier,
-                'color': colorsys.hsv_to_rgb(random.uniform(0, 1), 0.8, 1.0),
-                'gravity': 0.05,
-                'trail': []
-            }
-            particles.append(particle)
+        if num_secondary:
+            angles = np.random.uniform(0, 2 * np.pi, num_secondary)
+            speeds = np.random.uniform(1, 4, num_secondary) * size_multiplier
+            created += explosions.emit_sparks(
+                x, y, np.cos(angles) * speeds, np.sin(angles) * speeds,
+                life=np.random.uniform(1.0, 2.0, num_secondary),
+                max_life=np.random.uniform(1.0, 2.0, num_secondary),
+                size=np.random.uniform(8, 20, num_secondary) * size_multiplier,
+                color=hsv_colors(np.random.uniform(0, 1, num_secondary), saturation=0.8),
+                gravity=0.05
+            )
         
         # Anéis de energia
-        for i in range(int(5 * size_multiplier)):
-            particle = {
-                'x': x,
-                'y': y,
-                'radius': 10 + i * 20,
-                'expand_speed': random.uniform(8, 15) * size_multiplier,
-                'life': 0.5,
-                'max_life': 0.5,
-                'color': colorsys.hsv_to_rgb(i * 0.2, 1.0, 1.0),
-                'type': 'ring'
-            }
-            particles.append(particle)
+        if num_rings > 0:
+            ring_index = first_ring + np.arange(num_rings)
+            created += explosions.emit_rings(
+                x, y,
+                radius=10 + ring_index * 20.0,
+                expand_speed=np.random.uniform(8, 15, num_rings) * size_multiplier,
+                life=0.5,
+                color=hsv_colors(ring_index * 0.2)
+            )
         
-        return particles
+        return created
     
-    def update_explosion_particles(self, particles, dt):
+    def update_explosion_particles(self, dt):
         """Atualizar partículas de explosão espetaculares"""
-        for particle in particles[:]:  # Iterar sobre cópia
-            if particle['life'] <= 0:
-                particles.remove(particle)
-                continue
+        self.explosions.update(dt, self.width, self.height)
     
-    def draw_explosion_particles(self, screen, particles):
+    def draw_explosion_particles(self, screen):
         """Desenhar partículas de explosão"""
-        for particle in particles:
-            if 'type' not in particle:
-                # Partículas normais
-                alpha_factor = particle['life'] / particle['max_life']
-                size = int(particle['size'] * alpha_factor)
-                
-                if size > 0:
-                    # Cor com alpha
-                    color = tuple(int(c * 255) for c in particle['color'])
-                    
-                    # Desenhar trilha
-                    if 'trail' in particle and len(particle['trail']) > 1:
-                        for i in range(len(particle['trail']) - 1):
-                            trail_alpha = (i / len(particle['trail'])) * alpha_factor
-                            if trail_alpha > 0:
-                                start = particle['trail'][i]
-                                end = particle['trail'][i + 1]
-                                try:
-                                    pygame.draw.line(screen, color, start, end, 1)
-                                except:
-                                    pass
-                    
-                    # Desenhar partícula
-                    try:
-                        pygame.draw.circle(screen, color, (int(particle['x']), int(particle['y'])), size)
-                        # Brilho interno
-                        if size > 2:
-                            pygame.draw.circle(screen, (255, 255, 255), 
-                                             (int(particle['x']), int(particle['y'])), size // 2)
-                    except:
-                        pass
-            
-            elif particle['type'] == 'ring':
-                # Anéis de energia
-                alpha_factor = particle['life'] / particle['max_life']
-                color = tuple(int(c * 255 * alpha_factor) for c in particle['color'])
-                
-                try:
-                    pygame.draw.circle(screen, color, 
-                                     (int(particle['x']), int(particle['y'])), 
-                                     int(particle['radius']), 3)
-                except:
-                    pass
\ No newline at end of file
+        self.explosions.draw(screen)
+    
+    def clear_explosions(self):
+        """Remover todas as explosões em andamento"""
+        self.explosions.clear()
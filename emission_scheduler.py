@@ -0,0 +1,84 @@
+"""
+Agendador de emissões de partículas distribuídas em vários frames
+- Rajadas entram numa fila com atraso inicial (em segundos)
+- Cada frame cria no máximo `spawn_budget` partículas; o resto fica para os próximos
+- Rajadas grandes são fatiadas (cada fatia chama o emissor com uma parte da contagem)
+- Ordem FIFO: a explosão agendada primeiro é concluída primeiro
+"""
+
+from particle_budget import get_particle_budget
+
+
+class EmissionScheduler:
+    def __init__(self, spawn_budget=None):
+        """Fila de rajadas (spawn_budget=None usa o valor do nível de qualidade)"""
+        self.spawn_budget = spawn_budget
+        self.jobs = []
+
+        # Estatísticas
+        self.spawned_last_frame = 0
+        self.max_spawned_per_frame = 0
+        self.total_spawned = 0
+
+    def schedule(self, emit, count, delay=0.0, name=None):
+        """
+        Agendar uma rajada.
+
+        Args:
+            emit: função emit(amount, offset) que cria `amount` partículas da
+                  rajada, sendo `offset` quantas já foram criadas antes
+            count: total de partículas da rajada
+            delay: segundos até a rajada começar
+        """
+        if count <= 0:
+            return
+        self.jobs.append({
+            'emit': emit,
+            'count': count,
+            'offset': 0,
+            'delay': delay,
+            'name': name
+        })
+
+    def update(self, dt):
+        """Avançar atrasos e emitir as rajadas prontas dentro do orçamento do frame"""
+        budget = self.spawn_budget
+        if budget is None:
+            budget = get_particle_budget().get('spawn_budget')
+
+        spawned = 0
+        for job in self.jobs:
+            if job['delay'] > 0:
+                job['delay'] -= dt
+                continue
+            if spawned >= budget:
+                continue
+
+            amount = min(job['count'] - job['offset'], budget - spawned)
+            job['emit'](amount, job['offset'])
+            job['offset'] += amount
+            spawned += amount
+
+        self.jobs = [job for job in self.jobs if job['offset'] < job['count']]
+
+        self.spawned_last_frame = spawned
+        self.max_spawned_per_frame = max(self.max_spawned_per_frame, spawned)
+        self.total_spawned += spawned
+
+    def pending(self):
+        """Partículas ainda por criar"""
+        return sum(job['count'] - job['offset'] for job in self.jobs)
+
+    def clear(self):
+        """Cancelar todas as rajadas pendentes"""
+        self.jobs.clear()
+
+    def get_stats(self):
+        """Estatísticas do agendador"""
+        return {
+            'jobs': len(self.jobs),
+            'pending': self.pending(),
+            'spawned_last_frame': self.spawned_last_frame,
+            'max_spawned_per_frame': self.max_spawned_per_frame,
+            'total_spawned': self.total_spawned
+        }
@@ -1,8 +1,15 @@
 import pygame
 import math
 import random
-import colorsys
+from particle_budget import get_particle_budget
 from bullet import Bullet
+from color_lut import hsv_color
+from surface_cache import get_surface_cache
+from enemy_sprites import get_enemy_sprites
+
+# Os doze tipos de inimigo (um método draw_<tipo> para cada)
+ENEMY_TYPES = ('basic', 'fast', 'shooter', 'kamikaze', 'tank', 'sniper',
+               'splitter', 'bomber', 'healer', 'shield', 'giant', 'elite')
 
 class Enemy(pygame.sprite.Sprite):
     def __init__(self, x, y, enemy_type='basic'):
@@ -298,7 +305,7 @@ class Enemy(pygame.sprite.Sprite):
         
         # Adicionar posição ao rastro
         self.trail.append((self.x, self.y))
-        if len(self.trail) > 8:
+        while len(self.trail) > get_particle_budget().get('enemy_trail'):
             self.trail.pop(0)
     
     def heal_nearby_enemies(self, enemies_group):
@@ -399,18 +406,20 @@ class Enemy(pygame.sprite.Sprite):
     def get_psychedelic_color(self, hue_offset=0.0, brightness=1.0):
         """Gerar cor psicodélica"""
         hue = (self.color_base + hue_offset + self.animation_frame * 0.02) % 1.0
-        rgb = colorsys.hsv_to_rgb(hue, 1.0, brightness)
-        return tuple(int(c * 255) for c in rgb)
+        return hsv_color(hue, 1.0, brightness)
     
     def draw(self, screen):
         """Desenhar inimigo com efeitos psicodélicos"""
-        # Desenhar rastro
+        surfaces = get_surface_cache()
+        blits = []
+        
+        # Desenhar rastro (discos do cache)
         for i, pos in enumerate(self.trail):
             if i > 0:
                 alpha = i / len(self.trail)
                 size = max(1, int(alpha * 4))
                 trail_color = self.get_psychedelic_color(0.5, alpha * 0.5)
-                pygame.draw.circle(screen, trail_color, (int(pos[0]), int(pos[1])), size)
+                blits.append((surfaces.disc(size, trail_color), (int(pos[0]) - size, int(pos[1]) - size)))
         
         # Desenhar campo de energia ao redor
         energy_radius = 15 + int(math.sin(self.energy_field) * 3)
@@ -420,15 +429,36 @@ class Enemy(pygame.sprite.Sprite):
         for i in range(3):
             radius = energy_radius + i * 5
             alpha = 100 - i * 30
-            
-            energy_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-            energy_with_alpha = (energy_color[0], energy_color[1], energy_color[2], alpha)  # RGBA correto
-            pygame.draw.circle(energy_surface, energy_with_alpha, 
-                             (radius, radius), radius, 1)
-            screen.blit(energy_surface, 
-                       (self.x - radius, self.y - radius))
-        
-        # Desenhar corpo principal do inimigo
+            blits.append((surfaces.ring(radius, energy_color, alpha),
+                          (self.x - radius, self.y - radius)))
+        
+        screen.blits(blits, doreturn=False)
+        
+        # Corpo principal: quadro pré-renderizado da sprite sheet (ou desenho ao vivo)
+        sprites = get_enemy_sprites()
+        if sprites.enabled:
+            if self.enemy_type == 'giant':
+                self.advance_giant_animation()
+            frame, (dx, dy) = sprites.get_frame(self)
+            screen.blit(frame, (int(self.x) + dx, int(self.y) + dy))
+            # Barra de vida muda com o dano: desenhada por cima do quadro (vida cheia)
+            if self.enemy_type in ('tank', 'giant', 'elite') and self.health < self.max_health:
+                self.draw_health_bar(screen)
+        else:
+            self.draw_body(screen)
+    
+    def sprite_variant(self):
+        """Estado visual que muda o corpo do inimigo (entra na chave da sprite sheet)"""
+        if self.enemy_type == 'kamikaze':
+            return int(self.kamikaze_mode)
+        if self.enemy_type == 'sniper':
+            return int(self.sniper_locked)
+        if self.enemy_type == 'shield' and self.shield_health > 0 and self.max_shield > 0:
+            return int(255 * (self.shield_health / self.max_shield))  # Alpha do escudo
+        return 0
+    
+    def draw_body(self, screen):
+        """Desenhar o corpo do inimigo ao vivo (usado também para criar as sprite sheets)"""
         if self.enemy_type == 'basic':
             self.draw_basic(screen)
         elif self.enemy_type == 'fast':
@@ -581,22 +611,7 @@ class Enemy(pygame.sprite.Sprite):
         pygame.draw.circle(screen, (200, 200, 200), 
                          (int(self.x), int(self.y)), turret_size, 2)
         
-        # Barra de vida
-        bar_width = self.width
-        bar_height = 4
-        bar_x = self.x - bar_width // 2
-        bar_y = self.y - self.height // 2 - 8
-        
-        # Fundo
-        pygame.draw.rect(screen, (50, 50, 50), 
-                        (bar_x, bar_y, bar_width, bar_height))
-        
-        # Vida atual
-        health_ratio = self.health / self.max_health if self.max_health > 0 else 0
-        health_width = int(bar_width * health_ratio)
-        health_color = (0, 255, 0) if health_ratio > 0.5 else (255, 255, 0) if health_ratio > 0.25 else (255, 0, 0)
-        pygame.draw.rect(screen, health_color, 
-                        (bar_x, bar_y, health_width, bar_height))
+        self.draw_health_bar(screen)
     
     def draw_sniper(self, screen):
         """Desenhar sniper - losango com mira"""
@@ -720,19 +735,15 @@ class Enemy(pygame.sprite.Sprite):
             shield_size = self.width // 2 + 8
             
             # Escudo semitransparente
-            shield_surface = pygame.Surface((shield_size * 2, shield_size * 2), pygame.SRCALPHA)
-            shield_color = (100, 200, 255, shield_alpha)
-            pygame.draw.circle(shield_surface, shield_color, 
-                             (shield_size, shield_size), shield_size)
+            shield_surface = get_surface_cache().disc(shield_size, (100, 200, 255), shield_alpha)
             screen.blit(shield_surface, 
                        (self.x - shield_size, self.y - self.height // 2 - shield_size))
         
         # Contorno
         pygame.draw.polygon(screen, (100, 200, 255), points, 2)
 
-    def draw_giant(self, screen):
-        """Desenhar inimigo GIGANTE - Grande e ameaçador"""
-        # Atualizar animação
+    def advance_giant_animation(self):
+        """Avançar a rotação dos espinhos e a pulsação do gigante (um passo por frame)"""
         if not hasattr(self, 'rotation'):
             self.rotation = 0
         if not hasattr(self, 'pulse'):
@@ -740,6 +751,10 @@ class Enemy(pygame.sprite.Sprite):
             
         self.rotation += 2
         self.pulse += 0.1
+    
+    def draw_giant(self, screen):
+        """Desenhar inimigo GIGANTE - Grande e ameaçador"""
+        self.advance_giant_animation()
         
         main_color = self.get_psychedelic_color()
         
@@ -751,9 +766,7 @@ class Enemy(pygame.sprite.Sprite):
             ring_size = pulse_size - i * 8
             if ring_size > 0:
                 alpha = 100 - i * 20
-                ring_surface = pygame.Surface((ring_size * 2, ring_size * 2), pygame.SRCALPHA)
-                ring_color = (*main_color, alpha)
-                pygame.draw.circle(ring_surface, ring_color, (ring_size, ring_size), ring_size, 3)
+                ring_surface = get_surface_cache().ring(ring_size, main_color, alpha, 3)
                 screen.blit(ring_surface, (self.x - ring_size, self.y - ring_size))
         
         # Corpo principal - círculo grande
@@ -774,21 +787,7 @@ class Enemy(pygame.sprite.Sprite):
             pygame.draw.line(screen, main_color, (int(self.x), int(self.y)), 
                            (int(end_x), int(end_y)), 4)
         
-        # Barra de vida
-        bar_width = self.width
-        bar_height = 6
-        health_ratio = self.health / self.max_health if self.max_health > 0 else 0
-        
-        # Fundo da barra
-        pygame.draw.rect(screen, (50, 50, 50),
-                        (self.x - bar_width // 2, self.y - self.height // 2 - 12,
-                         bar_width, bar_height))
-        
-        # Barra de vida colorida
-        health_color = (255, 50, 50) if health_ratio < 0.3 else (255, 200, 0) if health_ratio < 0.7 else (0, 255, 0)
-        pygame.draw.rect(screen, health_color,
-                        (self.x - bar_width // 2, self.y - self.height // 2 - 12,
-                         int(bar_width * health_ratio), bar_height))
+        self.draw_health_bar(screen)
     
     def draw_elite(self, screen):
         """Desenhar inimigo ELITE - Rápido e perigoso"""
@@ -798,12 +797,10 @@ class Enemy(pygame.sprite.Sprite):
         trail_length = 5
         for i in range(trail_length):
             alpha = int(150 * (1 - i / trail_length))
-            trail_color = (*main_color, alpha)
             trail_y = self.y + i * 8
             trail_size = int(self.width * (1 - i / trail_length * 0.3))
             
-            trail_surf = pygame.Surface((trail_size, trail_size), pygame.SRCALPHA)
-            pygame.draw.circle(trail_surf, trail_color, (trail_size // 2, trail_size // 2), trail_size // 2)
+            trail_surf = get_surface_cache().disc(trail_size // 2, main_color, alpha)
             screen.blit(trail_surf, (self.x - trail_size // 2, trail_y - trail_size // 2))
         
         # Corpo principal - diamante duplo
@@ -830,18 +827,30 @@ class Enemy(pygame.sprite.Sprite):
         # Núcleo central
         pygame.draw.circle(screen, (255, 255, 255), (int(self.x), int(self.y)), 5)
         
-        # Barra de vida
+        self.draw_health_bar(screen)
+    
+    def draw_health_bar(self, screen):
+        """Desenhar a barra de vida (tanque, gigante e elite)"""
         bar_width = self.width
-        bar_height = 5
         health_ratio = self.health / self.max_health if self.max_health > 0 else 0
         
+        if self.enemy_type == 'tank':
+            bar_height = 4
+            bar_y = self.y - self.height // 2 - 8
+            health_color = (0, 255, 0) if health_ratio > 0.5 else (255, 255, 0) if health_ratio > 0.25 else (255, 0, 0)
+        elif self.enemy_type == 'giant':
+            bar_height = 6
+            bar_y = self.y - self.height // 2 - 12
+            health_color = (255, 50, 50) if health_ratio < 0.3 else (255, 200, 0) if health_ratio < 0.7 else (0, 255, 0)
+        else:
+            bar_height = 5
+            bar_y = self.y - self.height // 2 - 10
+            health_color = (200, 0, 255) if health_ratio > 0.5 else (255, 0, 150)
+        
         # Fundo da barra
         pygame.draw.rect(screen, (50, 50, 50),
-                        (self.x - bar_width // 2, self.y - self.height // 2 - 10,
-                         bar_width, bar_height))
+                        (self.x - bar_width // 2, bar_y, bar_width, bar_height))
         
-        # Barra de vida com gradiente
-        health_color = (200, 0, 255) if health_ratio > 0.5 else (255, 0, 150)
+        # Vida atual
         pygame.draw.rect(screen, health_color,
-                        (self.x - bar_width // 2, self.y - self.height // 2 - 10,
-                         int(bar_width * health_ratio), bar_height))
+                        (self.x - bar_width // 2, bar_y, int(bar_width * health_ratio), bar_height))
@@ -0,0 +1,377 @@
+"""
+Sprite sheets pré-renderizadas dos doze tipos de inimigo
+- As próprias funções draw_<tipo> do Enemy são executadas fora da tela
+- Cada folha (tipo, variante) tem N fases de animação x M tons (ciclo de cor)
+- Enemy.draw passa a fazer um único blit do quadro certo (recortado ao conteúdo)
+- Folhas sem translucidez viram superfícies com colorkey + RLE (blit mais barato)
+- Folhas salvas em PNG no disco; a chave inclui o código de desenho (mudou, recria)
+- Barras de vida (tanque, gigante, elite) continuam ao vivo por cima do quadro
+
+Uso: python enemy_sprites.py           (compara ao vivo vs pré-renderizado lado a lado)
+     python enemy_sprites.py --bench   (tempo de desenho e memória das folhas)
+"""
+
+import hashlib
+import inspect
+import json
+import math
+import os
+import numpy as np
+import pygame
+from particle_stamps import STAMP_COLORKEY
+
+# Incrementar quando a criação das folhas mudar de forma que invalide o cache em disco
+SPRITE_CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~/.psychedelic_river_raid"), "sprite_cache")
+
+DEFAULT_PHASES = 8
+DEFAULT_HUE_STEPS = 24
+
+# Tipos com animação além do ciclo de cor: período em unidades de animation_frame
+# (gigante: período da pulsação, que avança 0.1 por frame) e número de fases
+ANIMATED_TYPES = {
+    'shooter': {'period': 4 * math.pi, 'phases': DEFAULT_PHASES},        # sin(frame * 0.5)
+    'healer': {'period': 2 * math.pi / 0.3, 'phases': DEFAULT_PHASES},   # sin(frame * 0.3)
+    'giant': {'period': 2 * math.pi, 'phases': DEFAULT_PHASES}           # sin(pulse)
+}
+
+# Giro dos espinhos do gigante por ciclo de pulsação (múltiplo de 45°: o ciclo fecha sem salto)
+GIANT_SPIN_PER_CYCLE = 135
+
+# Escudo do tipo shield: 5 pontos, perdidos de 1 em 1
+SHIELD_MAX = 5
+
+# Variantes conhecidas de cada tipo (outras são criadas quando aparecem, só em memória)
+KNOWN_VARIANTS = {
+    'kamikaze': (0, 1),  # Modo kamikaze (chamas)
+    'sniper': (0, 1),    # Mira travada (laser)
+    # Alpha do escudo, como em Enemy.sprite_variant: 0, 51, 102, 153, 204, 255
+    'shield': tuple(int(255 * (health / SHIELD_MAX)) for health in range(SHIELD_MAX + 1))
+}
+
+# Margem além do tamanho do inimigo (auras, chamas, rastro do elite e barras de vida)
+FRAME_MARGIN = 28
+FRAME_MARGINS = {'giant': 14}  # Espinhos e anéis do gigante: até 12 px além do corpo
+
+
+class EnemySpriteBaker:
+    def __init__(self, hue_steps=DEFAULT_HUE_STEPS, cache_dir=None):
+        """Folhas criadas sob demanda (ou carregadas do disco) por (tipo, variante)"""
+        self.hue_steps = hue_steps
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.enabled = True
+        self.source_hash = None  # Hash do código de desenho (calculado uma vez)
+        self.sheets = {}  # (tipo, variante) -> {'surface', 'frames': [[(Surface, deslocamento)]]}
+
+        # Estatísticas
+        self.baked = 0
+        self.loaded = 0
+        self.bake_time = 0.0
+
+        self.disk_cache = True
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError as e:
+            print(f"⚠️ Cache de sprites desativado: {e}")
+            self.disk_cache = False
+
+    @staticmethod
+    def phase_count(enemy_type):
+        """Número de fases de animação de um tipo"""
+        animated = ANIMATED_TYPES.get(enemy_type)
+        return animated['phases'] if animated else 1
+
+    @staticmethod
+    def half_size(enemy):
+        """Metade do lado do quadro (centro do inimigo no meio do quadro)"""
+        return max(enemy.width, enemy.height) // 2 + FRAME_MARGINS.get(enemy.enemy_type, FRAME_MARGIN)
+
+    def frame_index(self, enemy):
+        """(fase, tom) do quadro que corresponde ao estado atual do inimigo"""
+        hue = (enemy.color_base + enemy.animation_frame * 0.02) % 1.0
+        hue_index = int(hue * self.hue_steps + 0.5) % self.hue_steps
+
+        animated = ANIMATED_TYPES.get(enemy.enemy_type)
+        if animated is None:
+            return 0, hue_index
+        clock = enemy.pulse if enemy.enemy_type == 'giant' else enemy.animation_frame
+        phases = animated['phases']
+        phase = int((clock % animated['period']) / animated['period'] * phases + 0.5) % phases
+        return phase, hue_index
+
+    def get_frame(self, enemy):
+        """(Surface, (dx, dy)) do quadro atual: canto do quadro = centro do inimigo + (dx, dy)"""
+        key = (enemy.enemy_type, enemy.sprite_variant())
+        sheet = self.sheets.get(key)
+        if sheet is None:
+            # Variante inesperada durante o jogo: criar só em memória (sem PNG no meio do combate)
+            sheet = self.load_or_bake(*key, save=False)
+        phase, hue_index = self.frame_index(enemy)
+        return sheet['frames'][phase][hue_index]
+
+    def cache_key(self, enemy_type, variant):
+        """Hash dos parâmetros da folha e do código de desenho dos inimigos"""
+        if self.source_hash is None:
+            from enemy import Enemy
+            source = "".join(inspect.getsource(getattr(Enemy, name)) for name in sorted(vars(Enemy))
+                             if name.startswith('draw_') or name in ('get_psychedelic_color',
+                                                                     'advance_giant_animation'))
+            self.source_hash = hashlib.sha256(source.encode('utf-8')).hexdigest()
+        payload = json.dumps({
+            'version': SPRITE_CACHE_VERSION,
+            'type': enemy_type,
+            'variant': variant,
+            'phases': self.phase_count(enemy_type),
+            'hue_steps': self.hue_steps,
+            'animated': ANIMATED_TYPES.get(enemy_type),
+            'source': self.source_hash
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def load_or_bake(self, enemy_type, variant, save=True):
+        """Carregar a folha do disco ou criá-la (e salvar, se save)"""
+        import time
+        start = time.perf_counter()
+
+        path = None
+        surface = None
+        if self.disk_cache:
+            path = os.path.join(self.cache_dir, f"{enemy_type}_{variant}_"
+                                                f"{self.cache_key(enemy_type, variant)[:16]}.png")
+            if os.path.exists(path):
+                try:
+                    surface = pygame.image.load(path)
+                    self.loaded += 1
+                except pygame.error as e:
+                    print(f"⚠️ Sprite sheet corrompida, recriando: {e}")
+
+        if surface is None:
+            surface = self.bake_sheet(enemy_type, variant)
+            self.baked += 1
+            if path is not None and save:
+                try:
+                    pygame.image.save(surface, path)
+                except (pygame.error, OSError) as e:
+                    print(f"⚠️ Não foi possível salvar a sprite sheet: {e}")
+
+        sheet = self.slice_sheet(self.prepare_surface(surface), enemy_type)
+        self.sheets[(enemy_type, variant)] = sheet
+        self.bake_time += time.perf_counter() - start
+        return sheet
+
+    def make_proxy(self, enemy_type, variant):
+        """Inimigo fora da tela, com vida cheia e no estado da variante"""
+        from enemy import Enemy
+        proxy = Enemy(0, 0, enemy_type)
+        proxy.health = proxy.max_health
+        if enemy_type == 'kamikaze':
+            proxy.kamikaze_mode = bool(variant)
+        elif enemy_type == 'sniper':
+            proxy.sniper_locked = bool(variant)
+        elif enemy_type == 'shield':
+            # Variante = alpha do escudo
+            proxy.shield_health = variant
+            proxy.max_shield = 255 if variant else 0
+        return proxy
+
+    def bake_sheet(self, enemy_type, variant):
+        """Desenhar todos os quadros de uma folha (linhas = fases, colunas = tons)"""
+        proxy = self.make_proxy(enemy_type, variant)
+        half_size = self.half_size(proxy)
+        size = half_size * 2
+        phases = self.phase_count(enemy_type)
+        animated = ANIMATED_TYPES.get(enemy_type)
+
+        sheet = pygame.Surface((size * self.hue_steps, size * phases), pygame.SRCALPHA)
+        frame = pygame.Surface((size, size), pygame.SRCALPHA)
+        proxy.x = proxy.y = half_size
+
+        for phase in range(phases):
+            clock = animated['period'] * phase / phases if animated else 0.0
+            for hue_index in range(self.hue_steps):
+                if enemy_type == 'giant':
+                    # draw_giant avança a animação antes de desenhar
+                    proxy.pulse = clock - 0.1
+                    proxy.rotation = GIANT_SPIN_PER_CYCLE * phase / phases - 2
+                    proxy.animation_frame = 0.0
+                else:
+                    proxy.animation_frame = clock
+                # Cor base escolhida para o tom desejado neste animation_frame
+                proxy.color_base = hue_index / self.hue_steps - proxy.animation_frame * 0.02
+
+                frame.fill((0, 0, 0, 0))
+                proxy.draw_body(frame)
+                sheet.blit(frame, (hue_index * size, phase * size))
+
+        return sheet
+
+    @staticmethod
+    def prepare_surface(surface):
+        """
+        Formato de blit mais rápido para a folha.
+
+        Se todo pixel é totalmente opaco ou totalmente transparente (o caso de
+        quase todos os tipos), vira uma superfície sem alpha com colorkey + RLE;
+        senão (anéis translúcidos do gigante, escudo) fica com alpha por pixel.
+        """
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        alpha = pygame.surfarray.array_alpha(surface)
+        if np.any((alpha > 0) & (alpha < 255)):
+            return surface
+
+        keyed = pygame.Surface(surface.get_size())
+        keyed.fill(STAMP_COLORKEY)
+        keyed.blit(surface, (0, 0))
+        if pygame.display.get_surface() is not None:
+            keyed = keyed.convert()
+        keyed.set_colorkey(STAMP_COLORKEY, pygame.RLEACCEL)
+        return keyed
+
+    def slice_sheet(self, surface, enemy_type):
+        """Quadros da folha como subsuperfícies recortadas ao conteúdo (sem cópia)"""
+        phases = self.phase_count(enemy_type)
+        size = surface.get_height() // phases
+        half_size = size // 2
+        frames = []
+        for phase in range(phases):
+            row = []
+            for hue_index in range(self.hue_steps):
+                cell = surface.subsurface((hue_index * size, phase * size, size, size))
+                bounds = cell.get_bounding_rect()
+                row.append((cell.subsurface(bounds),
+                            (bounds.x - half_size, bounds.y - half_size)))
+            frames.append(row)
+        return {'surface': surface, 'frames': frames}
+
+    def bake_all(self):
+        """Preparar as folhas de todos os tipos (variantes conhecidas) de uma vez"""
+        from enemy import ENEMY_TYPES
+        for enemy_type in ENEMY_TYPES:
+            for variant in KNOWN_VARIANTS.get(enemy_type, (0,)):
+                if (enemy_type, variant) not in self.sheets:
+                    self.load_or_bake(enemy_type, variant)
+
+    def clear(self):
+        """Descartar as folhas em memória"""
+        self.sheets.clear()
+
+    def get_stats(self):
+        """Estatísticas das folhas"""
+        memory = sum(sheet['surface'].get_bytesize() * sheet['surface'].get_width() *
+                     sheet['surface'].get_height() for sheet in self.sheets.values())
+        return {
+            'sheets': len(self.sheets),
+            'baked': self.baked,
+            'loaded': self.loaded,
+            'bake_time': self.bake_time,
+            'memory_mb': memory / (1024 * 1024)
+        }
+
+
+_sprites = None
+
+
+def get_enemy_sprites():
+    """Folhas compartilhadas por todos os inimigos"""
+    global _sprites
+    if _sprites is None:
+        _sprites = EnemySpriteBaker()
+    return _sprites
+
+
+def compare(output=None, frames=600):
+    """
+    Modo de comparação: cada tipo ao vivo (esquerda) e pré-renderizado (direita).
+
+    Com output, salva um único quadro em PNG em vez de abrir a janela animada.
+    """
+    import enemy_sprites
+    from enemy import Enemy, ENEMY_TYPES
+
+    columns = 4
+    cell_width, cell_height = 220, 150
+    rows = math.ceil(len(ENEMY_TYPES) / columns)
+    screen = pygame.display.set_mode((cell_width * columns, cell_height * rows))
+    pygame.display.set_caption("Inimigos: ao vivo (esq.) x sprite sheet (dir.)")
+    font = pygame.font.Font(None, 20)
+    sprites = enemy_sprites.get_enemy_sprites()  # A mesma instância usada por enemy.py
+    sprites.bake_all()
+
+    pairs = []
+    for index, enemy_type in enumerate(ENEMY_TYPES):
+        cell_x = (index % columns) * cell_width
+        cell_y = (index // columns) * cell_height
+        live = Enemy(cell_x + cell_width // 4, cell_y + cell_height // 2 + 10, enemy_type)
+        baked = Enemy(cell_x + cell_width * 3 // 4, cell_y + cell_height // 2 + 10, enemy_type)
+        baked.color_base = live.color_base
+        pairs.append((enemy_type, cell_x, cell_y, live, baked))
+
+    clock = pygame.time.Clock()
+    for frame in range(frames):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and
+                                             event.key == pygame.K_ESCAPE):
+                return
+
+        screen.fill((10, 0, 20))
+        for enemy_type, cell_x, cell_y, live, baked in pairs:
+            for enemy in (live, baked):
+                enemy.animation_frame += 0.15
+            live.draw_body(screen)
+            if enemy_type == 'giant':
+                baked.advance_giant_animation()
+            image, (dx, dy) = sprites.get_frame(baked)
+            screen.blit(image, (int(baked.x) + dx, int(baked.y) + dy))
+            screen.blit(font.render(enemy_type, True, (255, 255, 255)), (cell_x + 6, cell_y + 4))
+            pygame.draw.rect(screen, (60, 60, 60), (cell_x, cell_y, cell_width, cell_height), 1)
+
+        if output:
+            pygame.image.save(screen, output)
+            print(f"📸 Comparação salva em {output}")
+            return
+        pygame.display.flip()
+        clock.tick(60)
+
+
+def benchmark(enemies=30, frames=300):
+    """Tempo de desenho de inimigos: funções draw_<tipo> ao vivo vs blit do quadro"""
+    import random
+    import time
+    import enemy_sprites
+    from enemy import Enemy, ENEMY_TYPES
+
+    screen = pygame.Surface((800, 600))
+    group = [Enemy(random.randint(50, 750), random.randint(50, 550), random.choice(ENEMY_TYPES))
+             for _ in range(enemies)]
+    sprites = enemy_sprites.get_enemy_sprites()  # A mesma instância usada por enemy.py
+    sprites.bake_all()
+
+    print(f"👾 Corpo de {enemies} inimigos ({frames} frames)")
+    for label, enabled in (("ao vivo", False), ("sprite sheet", True)):
+        sprites.enabled = enabled
+        start = time.perf_counter()
+        for _ in range(frames):
+            screen.fill((0, 0, 0))
+            for enemy in group:
+                enemy.animation_frame += 0.15
+                enemy.draw(screen)
+        elapsed = (time.perf_counter() - start) / frames
+        print(f"   {label:12s}: {elapsed * 1000:6.2f} ms/frame")
+
+    sprites.enabled = True
+    stats = sprites.get_stats()
+    print(f"   Folhas: {stats['sheets']} ({stats['baked']} criadas, {stats['loaded']} do disco) "
+          f"em {stats['bake_time'] * 1000:.0f} ms | {stats['memory_mb']:.1f} MB")
+
+
+if __name__ == "__main__":
+    import sys
+    pygame.init()
+    if "--bench" in sys.argv:
+        pygame.display.set_mode((1, 1))
+        benchmark()
+    else:
+        output = sys.argv[sys.argv.index("--output") + 1] if "--output" in sys.argv else None
+        compare(output)
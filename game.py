@@ -1,17 +1,23 @@
 import pygame
 import math
 import random
-import colorsys
 import time
 import json
+import numpy as np
 from player import Player
 from enemy import Enemy
+from enemy_sprites import get_enemy_sprites
 from bullet import Bullet
 from boss import Boss
 from level_generator import LevelGenerator
 from effects import PsychedelicEffects
 from collision import CollisionManager
-from audio_engine import AudioEngine
+from particle_system import ParticleSystem, LAYER_EFFECTS
+from color_lut import hsv_color, hsv_colors
+from particle_budget import get_particle_budget, MAX_PARTICLES
+from emission_scheduler import EmissionScheduler
+from palette_renderer import PaletteRenderer
+from audio_engine import get_audio_service
 from professional_hud import ProfessionalHUD
 from save_system import SaveSystem
 from game_over_screen import GameOverScreen
@@ -28,7 +34,7 @@ from scenario_system import ScenarioType, ScenarioRenderer
 from name_input import NameInputDialog
 
 class Game:
-    def __init__(self, width, height, save_system=None, mode=GameMode.ARCADE, leaderboard=None):
+    def __init__(self, width, height, save_system=None, mode=GameMode.ARCADE, leaderboard=None, audio=None):
         self.width = width
         self.height = height
         self.screen = pygame.display.set_mode((width, height))
@@ -68,15 +74,20 @@ class Game:
         self.game_start_time = time.time()
         self.coins_earned_this_game = 0  # Moedas ganhas nesta partida
         
-        # Inicializar sistema de áudio (sem print)
-        self.audio = AudioEngine()
+        # Serviço de áudio compartilhado (mixer e sons em cache sobrevivem a reinícios)
+        self.audio = audio if audio is not None else get_audio_service()
         
         # Carregar configurações de volume
         music_volume = self.save_system.get_setting('music_volume', 0.3)
         self.audio.set_volume(music_volume)
         
         # Inicializar componentes do jogo
-        self.player = Player(width // 2, height - 100)
+        # Partículas compartilhadas (teto e escala de emissão vêm do nível de qualidade)
+        self.particle_budget = get_particle_budget()
+        self.particle_budget.set_tier(self.save_system.get_setting('particle_quality', 'alta'))
+        self.particle_system = self.particle_budget.register(ParticleSystem(capacity=MAX_PARTICLES))
+        self.emission_scheduler = EmissionScheduler()  # Rajadas grandes espalhadas em vários frames
+        self.player = Player(width // 2, height - 100, self.particle_system)
         
         # Aplicar vidas iniciais baseado no modo (AUMENTADO PARA MAIS BALANCEADO)
         self.player.max_health = self.mode_manager.get_starting_lives() * 100  # Era 3 vidas de 100 = 300
@@ -84,9 +95,17 @@ class Game:
         
         self.level_generator = LevelGenerator(width, height)
         self.effects = PsychedelicEffects(width, height)
-        self.collision_manager = CollisionManager()
+        
+        # Modo 8-bit opcional: fundo, ondas e paredes compostos por índices numa paleta só
+        self.palette_renderer = None
+        if self.save_system.get_setting('palette_mode', False):
+            self.palette_renderer = PaletteRenderer(self.effects, self.level_generator)
+        self.collision_manager = CollisionManager(self.particle_system)
+        
+        # Sprite sheets dos inimigos (do disco, ou criadas uma vez e salvas)
+        get_enemy_sprites().bake_all()
         self.hud = ProfessionalHUD(width, height)
-        self.game_over_screen = GameOverScreen(width, height, self.save_system)
+        self.game_over_screen = GameOverScreen(width, height, self.save_system, self.audio)
         self.shop = Shop(width, height, self.save_system)
         self.gamepad = GamepadManager()
         
@@ -126,10 +145,6 @@ class Game:
         self.boss = None  # Boss atual (se houver)
         self.boss_active = False
         
-        # Sistema de partículas
-        self.particles = []
-        self.explosion_particles = []  # Partículas de explosões espetaculares
-        
         # ⚛️ SISTEMA DE BOMBA ATÔMICA
         self.atomic_bombs = 0  # Número de bombas disponíveis (máximo 2)
         self.max_atomic_bombs = 2  # Limite máximo
@@ -162,8 +177,8 @@ class Game:
     # Sistema de invencibilidade desabilitado
     # (removido)
         
-        # Iniciar música de fundo (sem print)
-        self.audio.start_background_music()
+        # Assumir o áudio: limpa SFX da tela anterior, música continua sem pausa
+        self.audio.handoff()
         
     def handle_events(self):
         """Gerenciar eventos do jogo"""
@@ -209,6 +224,9 @@ class Game:
                         self.audio.set_volume(0.0)
                     else:
                         self.audio.set_volume(0.3)
+                elif event.key == pygame.K_F3:
+                    # Overlay de debug: custo do HUD
+                    self.hud.toggle_debug()
         
         # Botões do gamepad (detectar single press)
         if self.gamepad.is_connected():
@@ -229,6 +247,9 @@ class Game:
     
     def update(self):
         """Atualizar lógica do jogo"""
+        # Novo frame de áudio (estatísticas de SFX por frame)
+        self.audio.begin_frame()
+        
         # Não atualizar se estiver pausado
         if self.paused:
             return
@@ -339,9 +360,10 @@ class Game:
         # Verificar missões diárias
         self.daily_missions.check_mission_completion(self.session_stats)
         
-        # Atualizar partículas normais e explosões espetaculares
+        # Emitir rajadas agendadas e atualizar partículas normais e explosões espetaculares
+        self.emission_scheduler.update(dt)
         self.update_particles()
-        self.effects.update_explosion_particles(self.explosion_particles, dt)
+        self.effects.update_explosion_particles(dt)
         
         # Aumentar pontuação baseada na sobrevivência (com multiplicador)
         self.add_score(1)
@@ -486,45 +508,33 @@ class Game:
         
         # 💥💥💥 EXPLOSÃO FENOMENAL DO BOSS!!!
         
-        # Criar MÚLTIPLAS explosões gigantes ao redor do boss
+        # Explosão central GIGANTESCA (ABSOLUTAMENTE MASSIVA!!!) primeiro, depois
+        # MÚLTIPLAS explosões gigantes ao redor do boss, espalhadas pelos próximos frames
+        boss_x, boss_y = self.boss.x, self.boss.y
+        self.schedule_giant_explosion(boss_x, boss_y, 15.0)
         for i in range(8):
             angle = (i / 8) * 2 * math.pi
             offset_x = math.cos(angle) * 50
             offset_y = math.sin(angle) * 50
             
-            self.effects.create_giant_explosion(
-                self.boss.x + offset_x,
-                self.boss.y + offset_y,
-                size_multiplier=6.0  # ENORME!!!
+            self.schedule_giant_explosion(
+                boss_x + offset_x,
+                boss_y + offset_y,
+                6.0,  # ENORME!!!
+                delay=i * 0.03
             )
         
-        # Explosão central GIGANTESCA
-        self.effects.create_giant_explosion(
-            self.boss.x,
-            self.boss.y,
-            size_multiplier=15.0  # ABSOLUTAMENTE MASSIVA!!!
-        )
-        
         # Som de explosão épica
         self.audio.play_sound('explosion')
         self.audio.play_sound('powerup')  # Som adicional
         
         # Partículas extras para o efeito
-        for _ in range(100):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(3, 20)
-            vel_x = math.cos(angle) * speed
-            vel_y = math.sin(angle) * speed
-            
-            particle = {
-                'x': self.boss.x,
-                'y': self.boss.y,
-                'vel_x': vel_x,
-                'vel_y': vel_y,
-                'life': 60,
-                'color': (random.randint(100, 255), random.randint(100, 255), random.randint(100, 255))
-            }
-            self.particles.append(particle)
+        self.schedule_burst(
+            lambda amount: self.particle_system.emit_burst(
+                boss_x, boss_y, amount, (3, 20), 60,
+                color=np.random.randint(100, 256, (amount, 3)), max_life=30),
+            self.particle_budget.scaled(100)
+        )
         
         # Sons de vitória
         self.audio.play_sound('explosion')
@@ -639,7 +649,7 @@ class Game:
         self.powerups_collected += 1
         
         # Efeito de partículas
-        self.create_explosion((powerup['x'], powerup['y']), (255, 255, 100))
+        self.create_explosion((powerup['x'], self.level_generator.to_screen_y(powerup['y'])), (255, 255, 100))
         
         # Aplicar efeito baseado no tipo
         if powerup_type == 'health':
@@ -721,15 +731,13 @@ class Game:
         # Explosões baseadas no tipo de inimigo
         if enemy_type in ['giant', 'elite']:
             size_mult = 3.0 if enemy_type == 'giant' else 2.0
-            giant_particles = self.effects.create_giant_explosion(
+            self.effects.create_giant_explosion(
                 enemy_pos[0], enemy_pos[1], size_mult
             )
-            self.explosion_particles.extend(giant_particles)
         elif enemy_type == 'tank':
-            tank_particles = self.effects.create_giant_explosion(
+            self.effects.create_giant_explosion(
                 enemy_pos[0], enemy_pos[1], 1.5
             )
-            self.explosion_particles.extend(tank_particles)
         else:
             self.create_explosion(enemy_pos, (255, 100, 0))
         
@@ -783,7 +791,7 @@ class Game:
         
         # Verificar colisão com power-ups
         powerup_collisions = self.collision_manager.check_powerup_collision(
-            self.player, self.level_generator.powerups
+            self.player, self.level_generator.powerups, self.level_generator.scroll
         )
         for powerup in powerup_collisions:
             self.collect_powerup(powerup)
@@ -849,12 +857,8 @@ class Game:
         explosion_y = max(50, min(self.height - 50, self.atomic_bomb_y))  # Centralizar na tela
         
         # 🌟 EXPLOSÃO ÉPICA PRINCIPAL (GIGANTESCA!)
-        giant_particles = self.effects.create_giant_explosion(
-            self.atomic_bomb_x, 
-            explosion_y, 
-            size_multiplier=12.0  # MEGA explosão
-        )
-        self.explosion_particles.extend(giant_particles)
+        # Tudo é agendado: o EmissionScheduler espalha as partículas pelos próximos frames
+        self.schedule_giant_explosion(self.atomic_bomb_x, explosion_y, 12.0)  # MEGA explosão
         
         # 💥 CRIAR 8 EXPLOSÕES ORBITAIS (como no boss)
         for i in range(8):
@@ -863,22 +867,13 @@ class Game:
             orbit_x = self.atomic_bomb_x + math.cos(angle) * orbit_distance
             orbit_y = explosion_y + math.sin(angle) * orbit_distance
             
-            orbital_particles = self.effects.create_giant_explosion(
-                orbit_x,
-                orbit_y,
-                size_multiplier=8.0  # Explosões grandes orbitais
-            )
-            self.explosion_particles.extend(orbital_particles)
+            self.schedule_giant_explosion(orbit_x, orbit_y, 8.0)  # Explosões grandes orbitais
         
         # 🎆 CRIAR ONDAS DE CHOQUE EXPANDINDO
         for wave in range(5):
             delay = wave * 0.05  # Ondas sequenciais
             wave_size = 5.0 + wave * 2
-            self.effects.create_giant_explosion(
-                self.atomic_bomb_x,
-                explosion_y,
-                size_multiplier=wave_size
-            )
+            self.schedule_giant_explosion(self.atomic_bomb_x, explosion_y, wave_size, delay=delay)
         
         # ⚠️ DESTRUIR TODOS OS INIMIGOS NA TELA (mas NÃO o jogador!)
         enemies_destroyed = 0
@@ -886,11 +881,7 @@ class Game:
         
         for enemy in list(self.enemies):
             # Criar explosão em cada inimigo
-            self.effects.create_giant_explosion(
-                enemy.rect.centerx,
-                enemy.rect.centery,
-                size_multiplier=2.0
-            )
+            self.schedule_giant_explosion(enemy.rect.centerx, enemy.rect.centery, 2.0)
             
             # Ganhar pontos e moedas
             self.add_score(enemy.points * 2)  # Bomba atômica
@@ -909,85 +900,50 @@ class Game:
             self.boss.take_damage(damage)
             
             # Criar explosão no boss
-            self.effects.create_giant_explosion(
-                self.boss.x,
-                self.boss.y,
-                size_multiplier=5.0
-            )
+            self.schedule_giant_explosion(self.boss.x, self.boss.y, 5.0)
         
         
         # 🎆 PARTÍCULAS EXTRAS ÉPICAS (200+ partículas voando pela tela)
-        for _ in range(250):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(5, 25)  # Muito rápido!
-            vel_x = math.cos(angle) * speed
-            vel_y = math.sin(angle) * speed
-            
-            # Cores psicodélicas variadas (garantir valores válidos)
-            hue = random.uniform(0, 1.0)
-            rgb = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-            color = (
-                max(0, min(255, int(rgb[0] * 255))),
-                max(0, min(255, int(rgb[1] * 255))),
-                max(0, min(255, int(rgb[2] * 255)))
-            )
-            
-            particle = {
-                'x': self.atomic_bomb_x,
-                'y': explosion_y,
-                'vel_x': vel_x,
-                'vel_y': vel_y,
-                'life': random.randint(40, 80),  # Vida longa
-                'color': color
-            }
-            self.particles.append(particle)
+        bomb_x = self.atomic_bomb_x
+        self.schedule_burst(
+            lambda amount: self.particle_system.emit_burst(
+                bomb_x, explosion_y, amount, (5, 25),  # Muito rápido!
+                (40, 80),  # Vida longa
+                color=hsv_colors(np.random.uniform(0, 1.0, amount)), max_life=30),
+            self.particle_budget.scaled(250)
+        )
         
         # Adicionar ao combo (múltiplas mortes)
         current_time = time.time()
         for _ in range(enemies_destroyed):
             self.combo.add_kill(current_time)
     
+    def schedule_giant_explosion(self, x, y, size_multiplier, delay=0.0):
+        """Agendar explosão gigante (fatiada em vários frames se passar do orçamento)"""
+        total = self.effects.giant_explosion_count(size_multiplier)
+        
+        def emit(amount, offset):
+            self.effects.create_giant_explosion(x, y, size_multiplier, start=offset, stop=offset + amount)
+        
+        self.emission_scheduler.schedule(emit, total, delay, name='giant_explosion')
+    
+    def schedule_burst(self, emit_burst, count, delay=0.0):
+        """Agendar rajada de partículas simples (emit_burst recebe a quantidade da fatia)"""
+        self.emission_scheduler.schedule(lambda amount, offset: emit_burst(amount),
+                                         count, delay, name='burst')
+    
     def create_explosion(self, position, color):
         """Criar efeito de explosão com partículas"""
-        for _ in range(15):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 8)
-            vel_x = math.cos(angle) * speed
-            vel_y = math.sin(angle) * speed
-            
-            particle = {
-                'x': position[0],
-                'y': position[1],
-                'vel_x': vel_x,
-                'vel_y': vel_y,
-                'life': 30,
-                'color': color
-            }
-            self.particles.append(particle)
+        self.particle_system.emit_burst(position[0], position[1], self.particle_budget.scaled(15),
+                                        (2, 8), 30, color=color)
     
     def update_particles(self):
         """Atualizar sistema de partículas"""
-        for particle in self.particles[:]:
-            particle['x'] += particle['vel_x']
-            particle['y'] += particle['vel_y']
-            particle['life'] -= 1
-            
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+        self.particle_system.update(LAYER_EFFECTS)
     
     def draw_particles(self):
         """Desenhar partículas"""
-        for particle in self.particles:
-            alpha = max(0, min(1.0, particle['life'] / 30.0))
-            size = max(1, int(alpha * 4))
-            # Garantir que cores sejam válidas (0-255)
-            color = (
-                max(0, min(255, int(particle['color'][0] * alpha))),
-                max(0, min(255, int(particle['color'][1] * alpha))),
-                max(0, min(255, int(particle['color'][2] * alpha)))
-            )
-            pygame.draw.circle(self.screen, color, 
-                             (int(particle['x']), int(particle['y'])), size)
+        self.particle_system.draw(self.screen, LAYER_EFFECTS)
     
     def draw_atomic_missile(self):
         """Desenhar míssil atômico com todos os efeitos visuais"""
@@ -1149,9 +1105,7 @@ class Game:
     
     def get_psychedelic_color(self, hue_shift):
         """Gerar cor psicodélica baseada no tempo"""
-        hue = (hue_shift % 1.0)
-        rgb = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-        return tuple(int(c * 255) for c in rgb)
+        return hsv_color(hue_shift)
     
     def game_over(self):
         """Mostrar tela de game over profissional"""
@@ -1296,7 +1250,7 @@ class Game:
         }
         
         # Resetar entidades
-        self.player = Player(self.width // 2, self.height - 100)
+        self.player = Player(self.width // 2, self.height - 100, self.particle_system)
         
         # Aplicar upgrades permanentes ao jogador
         self.apply_upgrades_to_player()
@@ -1304,7 +1258,9 @@ class Game:
         self.enemies.empty()
         self.bullets.empty()
         self.enemy_bullets.empty()
-        self.particles.clear()
+        self.particle_system.clear()
+        self.effects.clear_explosions()
+        self.emission_scheduler.clear()
         self.enemy_spawn_timer = 0
         self.enemy_spawn_interval = 120
         self.is_game_over = False
@@ -1385,7 +1341,11 @@ class Game:
         self.scenario_renderer.render(self.screen)
         
         # Fundo psicodélico (agora com transparência)
-        self.effects.draw_background(self.screen, self.color_shift)
+        if self.palette_renderer is not None:
+            # Modo 8-bit: fundo, ondas e paredes num único blit (o nível pula o terreno)
+            self.palette_renderer.draw(self.screen, self.color_shift)
+        else:
+            self.effects.draw_background(self.screen, self.color_shift)
         
         # Desenhar nível (terreno e obstáculos)
         self.level_generator.draw(self.screen, self.color_shift)
@@ -1415,7 +1375,7 @@ class Game:
             self.draw_atomic_missile()
         
         # 🎆 DESENHAR EXPLOSÕES ESPETACULARES! 🎆
-        self.effects.draw_explosion_particles(self.screen, self.explosion_particles)
+        self.effects.draw_explosion_particles(self.screen)
         
         # Desenhar efeitos psicodélicos
         self.effects.draw_effects(self.screen, self.color_shift)
@@ -1448,10 +1408,10 @@ class Game:
                 pass
     
     def cleanup(self):
-        """Limpar recursos do jogo"""
+        """Limpar recursos do jogo (o serviço de áudio compartilhado continua ativo)"""
         if hasattr(self, 'audio'):
             try:
-                self.audio.cleanup()
+                self.audio.release()
             except Exception as e:
                 pass
     
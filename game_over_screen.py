@@ -1,12 +1,13 @@
 import pygame
 import math
-import colorsys
+from color_lut import hsv_color
 
 class GameOverScreen:
-    def __init__(self, width, height, save_system):
+    def __init__(self, width, height, save_system, audio=None):
         self.width = width
         self.height = height
         self.save_system = save_system
+        self.audio = audio  # Serviço de áudio compartilhado (opcional)
         
         # Fontes
         pygame.font.init()
@@ -56,6 +57,10 @@ class GameOverScreen:
     
     def reset(self, score, level, kills, powerups, time_played):
         """Resetar tela de game over com novos dados"""
+        # Silenciar motor/SFX da partida; a música continua
+        if self.audio:
+            self.audio.handoff()
+        
         self.alpha = 0
         self.pulse = 0
         self.show_high_scores = False
@@ -346,5 +351,4 @@ class GameOverScreen:
     def get_pulse_color(self):
         """Obter cor pulsante"""
         hue = (pygame.time.get_ticks() % 3000) / 3000
-        rgb = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-        return tuple(int(c * 255) for c in rgb)
+        return hsv_color(hue)
@@ -0,0 +1,130 @@
+"""
+HUD em camadas, redesenhado só quando algo muda
+- Cada widget (score, vidas, barra de energia...) tem sua própria superfície
+- A superfície só é redesenhada quando o estado do widget muda
+  (valor exibido, posição ou fase da animação)
+- O HUD inteiro é composto na tela com um único Surface.blits
+- Custo do HUD (tempo e camadas redesenhadas) medido a cada frame para o overlay de debug
+
+Os widgets desenham em coordenadas de tela em duas telas auxiliares opacas (como
+a tela real), uma com fundo preto e outra branca, recortadas pelo retângulo do
+widget. A diferença entre as duas dá o alpha de cada pixel e a versão sobre o
+preto é a cor já multiplicada pelo alpha; a composição usa BLEND_PREMULTIPLIED.
+Assim painéis translúcidos, brilhos e bordas suavizadas ficam iguais ao desenho
+direto na tela (sem misturar duas vezes).
+"""
+
+import time
+import numpy as np
+import pygame
+
+# Média móvel do custo do HUD (fração do frame atual)
+COST_SMOOTHING = 0.1
+
+
+class HUDLayer:
+    def __init__(self, name):
+        """Widget do HUD com superfície em cache"""
+        self.name = name
+        self.state = None
+        self.rect = None
+        self.surface = None
+        self.redraws = 0
+
+
+class LayeredHUD:
+    def __init__(self, width, height):
+        """Camadas do HUD e telas auxiliares onde os widgets são redesenhados"""
+        self.canvas_black = pygame.Surface((width, height))
+        self.canvas_white = pygame.Surface((width, height))
+        self.bounds = self.canvas_black.get_rect()
+        self.layers = {}
+        self.queue = []  # (superfície, posição, área, flags) dos widgets visíveis neste frame
+
+        # Custo do HUD (para o overlay de debug)
+        self.frame_start = 0.0
+        self.redraws_this_frame = 0
+        self.last_cost_ms = 0.0
+        self.average_cost_ms = 0.0
+        self.last_layer_count = 0
+        self.last_redraws = 0
+
+    def begin(self):
+        """Começar o HUD do frame"""
+        self.frame_start = time.perf_counter()
+        self.queue.clear()
+        self.redraws_this_frame = 0
+
+    def layer(self, name, rect, state, draw):
+        """
+        Incluir um widget no frame.
+
+        Args:
+            name: identificador do widget
+            rect: retângulo de tela que o widget ocupa
+            state: tupla com tudo que muda o desenho (valores e fase da animação)
+            draw: função draw(surface) que desenha o widget em coordenadas de tela
+        """
+        layer = self.layers.get(name)
+        if layer is None:
+            layer = self.layers[name] = HUDLayer(name)
+
+        rect = pygame.Rect(rect).clip(self.bounds)  # Widgets junto à borda da tela
+        if layer.surface is None or state != layer.state or rect != layer.rect:
+            for canvas, background in ((self.canvas_black, (0, 0, 0)), (self.canvas_white, (255, 255, 255))):
+                canvas.set_clip(rect)
+                canvas.fill(background, rect)
+                draw(canvas)
+                canvas.set_clip(None)
+            layer.surface = self.extract(rect)
+            layer.state = state
+            layer.rect = rect
+            layer.redraws += 1
+            self.redraws_this_frame += 1
+
+        self.queue.append((layer.surface, rect.topleft, None, pygame.BLEND_PREMULTIPLIED))
+
+    def extract(self, rect):
+        """Superfície do widget com alpha pré-multiplicado (a partir dos fundos preto e branco)"""
+        surface = pygame.Surface(rect.size, pygame.SRCALPHA)
+        blue_shift = surface.get_shifts()[2]
+        alpha_shift = surface.get_shifts()[3]
+        rgb_mask = surface.get_masks()[0] | surface.get_masks()[1] | surface.get_masks()[2]
+
+        # Pixels 32-bit (mesmo layout RGB das telas auxiliares): sem separar canais.
+        # Recorte de uma vista da tela inteira (array2d de subsuperfície é ~10x mais lento);
+        # as vistas são liberadas ao sair da função, destravando as telas
+        area = (slice(rect.left, rect.right), slice(rect.top, rect.bottom))
+        black = pygame.surfarray.pixels2d(self.canvas_black)[area]
+        white = pygame.surfarray.pixels2d(self.canvas_white)[area]
+        # Sobre o branco o canal sobe 255 * (1 - alpha): alpha = 255 - (branco - preto)
+        alpha = 255 - ((white >> blue_shift) & 255) + ((black >> blue_shift) & 255)
+        np.minimum(alpha, 255, out=alpha)
+
+        pygame.surfarray.pixels2d(surface)[...] = (black & rgb_mask) | (alpha << alpha_shift)
+        return surface
+
+    def compose(self, screen):
+        """Desenhar todas as camadas do frame com um único blits e medir o custo"""
+        screen.blits(self.queue, doreturn=False)
+
+        self.last_cost_ms = (time.perf_counter() - self.frame_start) * 1000
+        self.average_cost_ms += (self.last_cost_ms - self.average_cost_ms) * COST_SMOOTHING
+        self.last_layer_count = len(self.queue)
+        self.last_redraws = self.redraws_this_frame
+
+    def invalidate(self, name=None):
+        """Forçar o redesenho de um widget (ou de todos)"""
+        for layer in ([self.layers[name]] if name in self.layers else
+                      self.layers.values() if name is None else []):
+            layer.surface = None
+
+    def get_stats(self):
+        """Custo do HUD no último frame"""
+        return {
+            'layers': self.last_layer_count,
+            'redraws': self.last_redraws,
+            'cost_ms': self.last_cost_ms,
+            'average_cost_ms': self.average_cost_ms,
+            'total_redraws': {name: layer.redraws for name, layer in self.layers.items()}
+        }
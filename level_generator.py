@@ -1,27 +1,47 @@
 import pygame
 import random
 import math
-import colorsys
+from collections import deque
+from color_lut import hsv_color
+from terrain_strip import TerrainStrip
+from terrain_collision import TerrainCollisionIndex
 
 class LevelGenerator:
     def __init__(self, width, height):
         self.width = width
         self.height = height
         self.current_level = 1
-        self.obstacles = []
-        self.powerups = []
         self.terrain_points = []
         
+        # Coordenadas de mundo: y_tela = y_mundo + scroll. Rolar o nível só muda
+        # self.scroll; nenhum ponto, obstáculo ou power-up é reescrito por frame.
+        self.scroll = 0
+        
+        # Filas ordenadas por y de mundo: itens novos entram no topo (appendleft)
+        # e os que saem por baixo da tela são descartados em O(1) (pop)
+        self.obstacles = deque()
+        self.powerups = deque()
+        
         # Configurações do terreno
-        self.left_wall = []
-        self.right_wall = []
+        self.left_wall = deque()
+        self.right_wall = deque()
         self.wall_width = 100  # Largura das paredes laterais
         
         # Geração procedural
-        self.noise_offset = 0
         self.terrain_complexity = 1
         
+        # Paredes rasterizadas uma vez numa faixa circular (cores via paleta)
+        self.terrain_strip = TerrainStrip(width, height)
+        
+        # Paredes e obstáculos indexados por faixa de y (colisão do jogador)
+        self.collision_index = TerrainCollisionIndex(width)
+        
+        # Modo 8-bit: o terreno é desenhado pelo PaletteRenderer junto com o fundo
+        self.palette_mode = False
+        
         self.generate_initial_terrain()
+        self.terrain_strip.rebuild(self.left_wall, self.right_wall)
+        self.collision_index.rebuild(self.left_wall, self.right_wall)
     
     def generate_initial_terrain(self):
         """Gerar terreno inicial"""
@@ -35,10 +55,8 @@ class LevelGenerator:
     
     def update(self, scroll_speed):
         """Atualizar geração de nível"""
-        self.noise_offset += scroll_speed
-        
-        # Mover terreno para baixo
-        self.move_terrain(scroll_speed)
+        # Rolar a câmera (o terreno desce na tela)
+        self.scroll += scroll_speed
         
         # Gerar novo terreno na parte superior
         self.generate_new_terrain()
@@ -46,33 +64,16 @@ class LevelGenerator:
         # Limpar terreno que saiu da tela
         self.cleanup_terrain()
     
-    def move_terrain(self, speed):
-        """Mover todo o terreno para baixo"""
-        # Mover paredes
-        for i in range(len(self.left_wall)):
-            x, y = self.left_wall[i]
-            self.left_wall[i] = (x, y + speed)
-        
-        for i in range(len(self.right_wall)):
-            x, y = self.right_wall[i]
-            self.right_wall[i] = (x, y + speed)
-        
-        # Mover obstáculos
-        for obstacle in self.obstacles[:]:
-            obstacle['y'] += speed
-            if obstacle['y'] > self.height + 50:
-                self.obstacles.remove(obstacle)
-        
-        # Mover power-ups
-        for powerup in self.powerups[:]:
-            powerup['y'] += speed
-            if powerup['y'] > self.height + 50:
-                self.powerups.remove(powerup)
+    def to_screen_y(self, world_y):
+        """Converter y de mundo em y de tela"""
+        return world_y + self.scroll
     
     def generate_new_terrain(self):
         """Gerar novo terreno na parte superior"""
+        top_y = -20 - self.scroll  # y de mundo da borda de geração (20px acima da tela)
+        
         # Adicionar novos pontos de parede
-        if self.left_wall and self.left_wall[0][1] > -100:
+        if self.left_wall and self.to_screen_y(self.left_wall[0][1]) > -100:
             # Terreno procedural com ruído
             complexity = self.terrain_complexity + (self.current_level - 1) * 0.5
             
@@ -81,13 +82,20 @@ class LevelGenerator:
             variation = int(complexity * 30)
             new_left_x = max(50, min(self.width // 3, 
                            last_left_x + random.randint(-variation, variation)))
-            self.left_wall.insert(0, (new_left_x, -20))
+            self.left_wall.appendleft((new_left_x, top_y))
             
             # Parede direita  
             last_right_x = self.right_wall[0][0] if self.right_wall else self.width - self.wall_width
             new_right_x = max(self.width * 2 // 3, min(self.width - 50,
                             last_right_x + random.randint(-variation, variation)))
-            self.right_wall.insert(0, (new_right_x, -20))
+            self.right_wall.appendleft((new_right_x, top_y))
+            
+            # Rasterizar e indexar só o trecho novo
+            if len(self.left_wall) > 1:
+                self.terrain_strip.add_segment(self.left_wall[0], self.left_wall[1],
+                                               self.right_wall[0], self.right_wall[1])
+                self.collision_index.add_wall_segment('left', self.left_wall[0], self.left_wall[1])
+                self.collision_index.add_wall_segment('right', self.right_wall[0], self.right_wall[1])
         
         # Gerar obstáculos ocasionais
         if random.randint(1, 100) <= 3:  # 3% de chance
@@ -108,7 +116,7 @@ class LevelGenerator:
             if channel_width > 100:  # Canal suficientemente largo
                 # Obstáculo no meio do canal
                 obstacle_x = left_x + random.randint(20, int(channel_width - 20))
-                obstacle_y = -50
+                obstacle_y = -50 - self.scroll  # Mundo
                 
                 obstacle_type = random.choice(['rock', 'crystal', 'energy_field'])
                 
@@ -122,7 +130,8 @@ class LevelGenerator:
                     'pulse_phase': random.uniform(0, 2 * math.pi)
                 }
                 
-                self.obstacles.append(obstacle)
+                self.obstacles.appendleft(obstacle)
+                self.collision_index.add_obstacle(obstacle)
     
     def generate_powerup(self):
         """Gerar power-up"""
@@ -133,7 +142,7 @@ class LevelGenerator:
             
             if channel_width > 80:
                 powerup_x = left_x + random.randint(20, int(channel_width - 20))
-                powerup_y = -30
+                powerup_y = -30 - self.scroll  # Mundo
                 
                 powerup_type = random.choice(['health', 'speed', 'multishot', 'shield'])
                 
@@ -146,42 +155,24 @@ class LevelGenerator:
                     'collected': False
                 }
                 
-                self.powerups.append(powerup)
+                self.powerups.appendleft(powerup)
     
     def cleanup_terrain(self):
-        """Limpar terreno que saiu da tela"""
+        """Limpar terreno que saiu da tela (itens mais antigos ficam no fim das filas)"""
         # Remover pontos de parede muito abaixo da tela
-        self.left_wall = [(x, y) for x, y in self.left_wall if y < self.height + 100]
-        self.right_wall = [(x, y) for x, y in self.right_wall if y < self.height + 100]
-    
-    def get_collision_rects(self):
-        """Obter retângulos de colisão para paredes e obstáculos"""
-        collision_rects = []
-        
-        # Paredes laterais
-        for i in range(len(self.left_wall) - 1):
-            x1, y1 = self.left_wall[i]
-            x2, y2 = self.left_wall[i + 1]
-            
-            # Criar retângulo para segmento da parede
-            wall_rect = pygame.Rect(0, min(y1, y2), x1, abs(y2 - y1) + 10)
-            collision_rects.append(wall_rect)
-        
-        for i in range(len(self.right_wall) - 1):
-            x1, y1 = self.right_wall[i]
-            x2, y2 = self.right_wall[i + 1]
-            
-            wall_rect = pygame.Rect(x1, min(y1, y2), self.width - x1, abs(y2 - y1) + 10)
-            collision_rects.append(wall_rect)
-        
-        # Obstáculos
-        for obstacle in self.obstacles:
-            size = obstacle['size']
-            obstacle_rect = pygame.Rect(obstacle['x'] - size//2, obstacle['y'] - size//2, 
-                                      size, size)
-            collision_rects.append(obstacle_rect)
+        wall_limit = self.height + 100 - self.scroll
+        while self.left_wall and self.left_wall[-1][1] >= wall_limit:
+            self.left_wall.pop()
+        while self.right_wall and self.right_wall[-1][1] >= wall_limit:
+            self.right_wall.pop()
+        self.collision_index.evict_below(wall_limit)
         
-        return collision_rects
+        # Obstáculos e power-ups que passaram da tela
+        item_limit = self.height + 50 - self.scroll
+        while self.obstacles and self.obstacles[-1]['y'] > item_limit:
+            self.obstacles.pop()
+        while self.powerups and self.powerups[-1]['y'] > item_limit:
+            self.powerups.pop()
     
     def increase_difficulty(self):
         """Aumentar dificuldade do nível"""
@@ -189,53 +180,22 @@ class LevelGenerator:
         self.terrain_complexity += 0.3
         self.wall_width = max(80, self.wall_width - 5)  # Estreitar passagem
     
+    def set_palette_mode(self, wall_indices):
+        """Rasterizar as paredes com os índices da paleta compartilhada do modo 8-bit"""
+        self.palette_mode = True
+        self.terrain_strip.set_indices(wall_indices)
+        self.terrain_strip.rebuild(self.left_wall, self.right_wall)
+    
     def draw(self, screen, color_shift):
         """Desenhar o nível"""
-        self.draw_terrain(screen, color_shift)
+        if not self.palette_mode:
+            self.draw_terrain(screen, color_shift)
         self.draw_obstacles(screen, color_shift)
         self.draw_powerups(screen, color_shift)
     
     def draw_terrain(self, screen, color_shift):
-        """Desenhar terreno das paredes"""
-        
-        # Desenhar paredes laterais
-        if len(self.left_wall) > 1:
-            # Parede esquerda
-            wall_color = colorsys.hsv_to_rgb((color_shift + 0.7) % 1.0, 0.8, 0.6)
-            wall_color = tuple(int(c * 255) for c in wall_color)
-            
-            try:
-                pygame.draw.polygon(screen, wall_color, 
-                                  [(0, 0), (0, self.height)] + 
-                                  [(x, y) for x, y in reversed(self.left_wall) if 0 <= y <= self.height])
-            except:
-                pass
-        
-        if len(self.right_wall) > 1:
-            # Parede direita
-            wall_color = colorsys.hsv_to_rgb((color_shift + 0.3) % 1.0, 0.8, 0.6)
-            wall_color = tuple(int(c * 255) for c in wall_color)
-            
-            try:
-                pygame.draw.polygon(screen, wall_color,
-                                  [(self.width, 0), (self.width, self.height)] +
-                                  [(x, y) for x, y in reversed(self.right_wall) if 0 <= y <= self.height])
-            except:
-                pass
-        
-        # Desenhar bordas das paredes com brilho
-        edge_color = colorsys.hsv_to_rgb((color_shift + 0.1) % 1.0, 1.0, 1.0)
-        edge_color = tuple(int(c * 255) for c in edge_color)
-        
-        if len(self.left_wall) > 1:
-            wall_points = [(x, y) for x, y in self.left_wall if 0 <= y <= self.height]
-            if len(wall_points) > 1:
-                pygame.draw.lines(screen, edge_color, False, wall_points, 3)
-        
-        if len(self.right_wall) > 1:
-            wall_points = [(x, y) for x, y in self.right_wall if 0 <= y <= self.height]
-            if len(wall_points) > 1:
-                pygame.draw.lines(screen, edge_color, False, wall_points, 3)
+        """Desenhar terreno das paredes (janela visível da faixa já rasterizada)"""
+        self.terrain_strip.draw(screen, self.scroll, color_shift)
     
     def draw_obstacles(self, screen, color_shift):
         """Desenhar obstáculos"""
@@ -246,10 +206,9 @@ class LevelGenerator:
             if obstacle['type'] == 'rock':
                 # Desenhar rocha (círculo)
                 hue = (color_shift + 0.1) % 1.0
-                color = colorsys.hsv_to_rgb(hue, 0.7, 0.8)
-                color = (int(c * 255) for c in color)
-                pygame.draw.circle(screen, tuple(color), 
-                                 (int(obstacle['x']), int(obstacle['y'])), 
+                color = hsv_color(hue, 0.7, 0.8)
+                pygame.draw.circle(screen, color, 
+                                 (int(obstacle['x']), int(self.to_screen_y(obstacle['y']))), 
                                  obstacle['size'])
             
             elif obstacle['type'] == 'crystal':
@@ -264,7 +223,7 @@ class LevelGenerator:
         """Desenhar obstáculo de cristal"""
         points = []
         size = obstacle['size']
-        x, y = obstacle['x'], obstacle['y']
+        x, y = obstacle['x'], self.to_screen_y(obstacle['y'])
         rotation = obstacle['rotation']
         
         for i in range(6):
@@ -274,15 +233,14 @@ class LevelGenerator:
             points.append((px, py))
             
         hue = (color_shift + 0.6) % 1.0
-        color = colorsys.hsv_to_rgb(hue, 0.8, 1.0)
-        color = (int(color[0] * 255), int(color[1] * 255), int(color[2] * 255))
+        color = hsv_color(hue, 0.8, 1.0)
         
         pygame.draw.polygon(screen, color, points)
         pygame.draw.polygon(screen, (255, 255, 255), points, 2)
 
     def draw_energy_field(self, screen, obstacle, color_shift):
         """Desenhar obstáculo de campo de energia"""
-        x, y = obstacle['x'], obstacle['y']
+        x, y = obstacle['x'], self.to_screen_y(obstacle['y'])
         size = obstacle['size']
         pulse_phase = obstacle['pulse_phase']
         
@@ -292,8 +250,7 @@ class LevelGenerator:
         
         # Cor base
         hue = (color_shift + 0.3) % 1.0
-        base_color = colorsys.hsv_to_rgb(hue, 0.9, 1.0)
-        base_color = (int(base_color[0] * 255), int(base_color[1] * 255), int(base_color[2] * 255))
+        base_color = hsv_color(hue, 0.9, 1.0)
 
         # Círculo interno (sólido)
         center_color = (255, 255, 255)
@@ -318,6 +275,7 @@ class LevelGenerator:
         for powerup in self.powerups:
             if not powerup['collected']:
                 powerup['rotation'] += 0.05
+                x, y = powerup['x'], self.to_screen_y(powerup['y'])
                 
                 # Cor baseada no tipo
                 type_colors = {
@@ -331,8 +289,7 @@ class LevelGenerator:
                 pulse = math.sin(pygame.time.get_ticks() * 0.008 + powerup['pulse_phase'])
                 brightness = 0.8 + 0.2 * pulse
                 
-                rgb = colorsys.hsv_to_rgb(hue, 1.0, brightness)
-                color = tuple(int(c * 255) for c in rgb)
+                color = hsv_color(hue, 1.0, brightness)
                 
                 # Desenhar ícone baseado no tipo
                 size = 12 + int(3 * pulse)
@@ -340,18 +297,18 @@ class LevelGenerator:
                 if powerup['type'] == 'health':
                     # Cruz de vida
                     pygame.draw.rect(screen, color,
-                                   (powerup['x'] - size//4, powerup['y'] - size,
+                                   (x - size//4, y - size,
                                     size//2, size*2))
                     pygame.draw.rect(screen, color,
-                                   (powerup['x'] - size, powerup['y'] - size//4,
+                                   (x - size, y - size//4,
                                     size*2, size//2))
                 
                 elif powerup['type'] == 'speed':
                     # Seta para frente
                     points = [
-                        (powerup['x'], powerup['y'] - size),
-                        (powerup['x'] + size, powerup['y'] + size),
-                        (powerup['x'] - size, powerup['y'] + size)
+                        (x, y - size),
+                        (x + size, y + size),
+                        (x - size, y + size)
                     ]
                     pygame.draw.polygon(screen, color, points)
                 
@@ -360,18 +317,18 @@ class LevelGenerator:
                     for i in range(3):
                         y_offset = (i - 1) * size // 2
                         pygame.draw.rect(screen, color,
-                                       (powerup['x'] - size, powerup['y'] + y_offset - 2,
+                                       (x - size, y + y_offset - 2,
                                         size * 2, 4))
                 
                 else:  # shield
                     # Escudo
                     points = [
-                        (powerup['x'], powerup['y'] - size),
-                        (powerup['x'] + size*0.7, powerup['y'] - size*0.3),
-                        (powerup['x'] + size*0.7, powerup['y'] + size*0.3),
-                        (powerup['x'], powerup['y'] + size),
-                        (powerup['x'] - size*0.7, powerup['y'] + size*0.3),
-                        (powerup['x'] - size*0.7, powerup['y'] - size*0.3)
+                        (x, y - size),
+                        (x + size*0.7, y - size*0.3),
+                        (x + size*0.7, y + size*0.3),
+                        (x, y + size),
+                        (x - size*0.7, y + size*0.3),
+                        (x - size*0.7, y - size*0.3)
                     ]
                     pygame.draw.polygon(screen, color, points)
                 
@@ -381,4 +338,28 @@ class LevelGenerator:
                 pygame.draw.circle(halo_surface, halo_color, 
                                  (size * 2, size * 2), size * 2)
                 screen.blit(halo_surface, 
-                           (powerup['x'] - size * 2, powerup['y'] - size * 2))
\ No newline at end of file
+                           (x - size * 2, y - size * 2))
+
+
+def benchmark(frames=600):
+    """Custo de update() por frame com poucas e muitas paredes (rolagem rápida e lenta)"""
+    import time
+
+    print(f"🌊 LevelGenerator.update ({frames} frames)")
+    for speed in (8, 3, 1, 0.5):  # Rolagem mais lenta = mais pontos nas paredes
+        random.seed(1)
+        level = LevelGenerator(800, 600)
+        for _ in range(int(800 / speed)):
+            level.update(speed)
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            level.update(speed)
+        elapsed = (time.perf_counter() - start) / frames
+        points = len(level.left_wall) + len(level.right_wall)
+        print(f"   velocidade {speed:3}: {points:5d} pontos | {elapsed * 1000:6.3f} ms/frame")
+
+
+if __name__ == "__main__":
+    pygame.init()
+    benchmark()
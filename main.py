@@ -7,6 +7,7 @@ e geração procedural de níveis.
 import pygame
 import sys
 from game import Game
+from audio_engine import get_audio_service
 from menu_system import MenuSystem
 from save_system import SaveSystem
 from settings_menu import SettingsMenu
@@ -39,8 +40,11 @@ class GameManager:
         # Estados do jogo
         self.state = "menu"  # menu, mode_select, game, leaderboard, achievements
         
+        # Serviço de áudio único (criado uma vez, compartilhado por todas as telas)
+        self.audio = get_audio_service()
+        
         # Sistemas
-        self.menu = MenuSystem(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
+        self.menu = MenuSystem(self.SCREEN_WIDTH, self.SCREEN_HEIGHT, self.audio)
         self.mode_menu = ModeSelectionMenu(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
         self.game = None
         self.settings_menu = SettingsMenu(self.SCREEN_WIDTH, self.SCREEN_HEIGHT, self.save_system)
@@ -72,9 +76,8 @@ class GameManager:
                         if self.game:
                             self.game.cleanup()
                             self.game = None
-                        if hasattr(self.menu, 'audio'):
-                            self.menu.audio.start_background_music()
-                            self.menu.apply_volume_setting()
+                        self.audio.handoff()
+                        self.menu.apply_volume_setting()
                     elif self.state in ["leaderboard", "achievements", "mode_select"]:
                         self.state = "menu"
                 
@@ -121,7 +124,8 @@ class GameManager:
         self.game = Game(
             self.SCREEN_WIDTH, 
             self.SCREEN_HEIGHT, 
-            self.save_system
+            self.save_system,
+            audio=self.audio
         )
         
         # TODO: Integrar modo de jogo quando game.py estiver atualizado
@@ -181,12 +185,9 @@ class GameManager:
                 if self.game:
                     self.game.cleanup()
                     self.game = None
-                # Reativar música do menu
-                if hasattr(self.menu, 'audio'):
-                    self.menu.audio.start_background_music()
-                    volume = self.menu.get_volume_setting()
-                    self.menu.apply_volume_setting()
-                    self.game = None
+                # Devolver o áudio ao menu (música continua, sem reiniciar o mixer)
+                self.audio.handoff()
+                self.menu.apply_volume_setting()
     
     def render(self):
         """Renderizar o frame atual"""
@@ -1,10 +1,10 @@
 import pygame
 import math
 import time
-from audio_engine import AudioEngine
+from audio_engine import get_audio_service
 
 class MenuSystem:
-    def __init__(self, width, height):
+    def __init__(self, width, height, audio=None):
         self.width = width
         self.height = height
         self.current_menu = "main"  # main, settings, credits, leaderboard, mode_select
@@ -37,9 +37,12 @@ class MenuSystem:
         
         # Sistema de áudio para o menu
         print("🎵 Inicializando áudio do menu...")
-        self.audio = AudioEngine()
+        self.audio = audio if audio is not None else get_audio_service()
         self.audio.set_volume(0.25)  # Volume menor para o menu
         
+        # Pré-renderizar SFX e músicas em paralelo (barra de carregamento no menu)
+        self.audio.warm_up_async()
+        
         # Iniciar música de fundo do menu
         print("🎶 Iniciando música no menu...")
         self.audio.start_background_music()
@@ -337,6 +340,25 @@ class MenuSystem:
             self.draw_settings_menu(screen)
         elif self.current_menu == "credits":
             self.draw_credits_menu(screen)
+        
+        if self.audio.warmup_progress['running']:
+            self.draw_loading_bar(screen)
+    
+    def draw_loading_bar(self, screen):
+        """Desenhar barra de carregamento do warm-up de áudio"""
+        progress = self.audio.get_warm_up_progress()
+        bar_width = self.width // 3
+        bar_height = 8
+        bar_x = (self.width - bar_width) // 2
+        bar_y = self.height - 90
+        
+        pygame.draw.rect(screen, (60, 30, 90), (bar_x, bar_y, bar_width, bar_height))
+        pygame.draw.rect(screen, self.secondary_color, (bar_x, bar_y, int(bar_width * progress), bar_height))
+        pygame.draw.rect(screen, self.primary_color, (bar_x, bar_y, bar_width, bar_height), 1)
+        
+        label = self.subtitle_font.render(f"Carregando áudio... {int(progress * 100)}%", True, (150, 150, 150))
+        label_rect = label.get_rect(center=(self.width // 2, bar_y - 15))
+        screen.blit(label, label_rect)
     
     def get_volume_setting(self):
         """Obter configuração de volume como float"""
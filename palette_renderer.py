@@ -0,0 +1,131 @@
+"""
+Modo de renderização 8-bit com ciclo de paleta para a geometria estática (opcional)
+- Fundo (gradiente), ondas e paredes do terreno são compostos por índices numa única
+  superfície 8-bit do tamanho da tela
+- O gradiente e a faixa do terreno já estão rasterizados em 8 bits: compor o frame é
+  copiar índices (blits 8→8 com a mesma paleta, sem conversão de cor)
+- A animação psicodélica vira uma única paleta de 256 entradas por frame (uma
+  conversão HSV vetorizada), no lugar das cores por objeto
+- Um único blit 8→32 bits para a tela, em vez de um para o fundo e outro para o terreno
+
+Ativado pela configuração 'palette_mode' (Modo 8-bit no menu de configurações).
+
+Uso: python palette_renderer.py  (fundo + terreno: caminho normal vs modo 8-bit)
+"""
+
+import numpy as np
+import pygame
+from color_lut import hsv_to_rgb_array
+from effects import BACKGROUND_PALETTE_SIZE
+from terrain_strip import WALL_COLORS
+
+PALETTE_SIZE = 256
+
+# Slots da paleta: gradiente do fundo (só a primeira metade do círculo aparece na tela),
+# depois as ondas e as paredes
+BACKGROUND_SLOTS = BACKGROUND_PALETTE_SIZE // 2
+WAVE_SLOT = BACKGROUND_SLOTS
+
+
+class PaletteRenderer:
+    def __init__(self, effects, level_generator):
+        """Cenário estático (fundo, ondas e paredes) de effects e level_generator em 8 bits"""
+        self.effects = effects
+        self.level_generator = level_generator
+        self.surface = pygame.Surface((effects.width, effects.height), depth=8)
+
+        # Cada slot: cor = hsv((color_shift * rate + tom) % 1, saturação, brilho)
+        self.hue_offsets = np.zeros(PALETTE_SIZE, dtype=np.float32)
+        self.rates = np.zeros(PALETTE_SIZE, dtype=np.float32)
+        self.saturations = np.zeros(PALETTE_SIZE, dtype=np.float32)
+        self.values = np.zeros(PALETTE_SIZE, dtype=np.float32)
+
+        # Gradiente: mesmos tons de draw_background
+        background = slice(0, BACKGROUND_SLOTS)
+        self.hue_offsets[background] = np.arange(BACKGROUND_SLOTS) / BACKGROUND_PALETTE_SIZE
+        self.rates[background] = 1.0
+        self.saturations[background] = 0.8
+        self.values[background] = 0.3
+
+        # Ondas: tom base de cada padrão, ciclo na metade da velocidade
+        wave_hues = effects.wave_params['hue_base'][:, 0]
+        self.wave_indices = list(range(WAVE_SLOT, WAVE_SLOT + len(wave_hues)))
+        self.hue_offsets[self.wave_indices] = wave_hues
+        self.rates[self.wave_indices] = 0.5
+        self.saturations[self.wave_indices] = 1.0
+        self.values[self.wave_indices] = 0.6
+
+        # Paredes, bordas: tons relativos da faixa do terreno
+        wall_indices = {}
+        for index, (name, (hue, saturation, value)) in enumerate(WALL_COLORS.items(),
+                                                                 WAVE_SLOT + len(wave_hues)):
+            wall_indices[name] = index
+            self.hue_offsets[index] = hue
+            self.rates[index] = 1.0
+            self.saturations[index] = saturation
+            self.values[index] = value
+        level_generator.set_palette_mode(wall_indices)
+
+        # Superfícies que compartilham a paleta (índices copiados sem conversão)
+        self.layers = [self.surface, effects.get_background(), level_generator.terrain_strip.surface]
+        self.color_shift = None
+
+    def update_palette(self, color_shift):
+        """Calcular a paleta do frame (uma conversão HSV vetorizada) e aplicá-la às camadas"""
+        if color_shift == self.color_shift:
+            return
+        self.color_shift = color_shift
+
+        hues = (color_shift * self.rates + self.hue_offsets) % 1.0
+        colors = hsv_to_rgb_array(hues)
+        # Saturação e brilho por slot: v * (255 - s * (255 - rgb))
+        colors = self.values[:, None] * (255 - self.saturations[:, None] * (255 - colors))
+        palette = [tuple(color) for color in colors.astype(np.int32).tolist()]
+        for layer in self.layers:
+            layer.set_palette(palette)
+
+    def draw(self, screen, color_shift):
+        """Compor fundo, ondas e paredes por índices e desenhar com um único blit"""
+        self.update_palette(color_shift)
+
+        surface = self.surface
+        surface.blit(self.effects.get_background(), (0, 0))
+        self.effects.draw_wave_patterns(surface, color_shift, colors=self.wave_indices)
+        self.level_generator.draw_terrain(surface, color_shift)
+        screen.blit(surface, (0, 0))
+
+
+def benchmark(frames=300):
+    """Comparar fundo + terreno: caminho normal vs modo 8-bit (cenário composto por índices)"""
+    import time
+    from effects import PsychedelicEffects
+    from level_generator import LevelGenerator
+
+    screen = pygame.display.set_mode((800, 600))
+    effects = PsychedelicEffects(800, 600)
+    normal_level = LevelGenerator(800, 600)
+    palette_level = LevelGenerator(800, 600)
+    for _ in range(200):
+        normal_level.update(3)
+        palette_level.update(3)
+    renderer = PaletteRenderer(effects, palette_level)
+
+    def draw_normal(color_shift):
+        effects.draw_background(screen, color_shift)
+        normal_level.draw_terrain(screen, color_shift)
+
+    def draw_palette(color_shift):
+        renderer.draw(screen, color_shift)
+
+    print(f"🎨 Fundo + terreno ({frames} frames, 800x600)")
+    for label, draw in (("normal", draw_normal), ("8-bit", draw_palette)):
+        start = time.perf_counter()
+        for frame in range(frames):
+            draw(frame * 0.01)
+        elapsed = (time.perf_counter() - start) / frames
+        print(f"   {label:7s} {elapsed * 1000:5.2f} ms/frame")
+
+
+if __name__ == "__main__":
+    pygame.init()
+    benchmark()
@@ -0,0 +1,180 @@
+"""
+Orçamento global de partículas por nível de qualidade
+- Níveis ligados à configuração 'particle_quality' (baixa, média, alta, ultra)
+- Cada nível define tetos de partículas vivas, escala de emissão e tamanho dos rastros
+- Troca de nível em tempo de execução (menu de configurações), sem reiniciar o jogo
+- Sistemas de partículas registrados recebem o novo teto na hora
+
+Uso: python particle_budget.py  (soak benchmark: tempo de frame por nível)
+"""
+
+import threading
+import weakref
+
+DEFAULT_TIER = 'alta'
+
+PARTICLE_TIERS = {
+    'baixa': {
+        'max_particles': 512,            # Partículas do jogo (explosões simples, propulsão, colisões)
+        'max_explosion_particles': 800,  # Partículas das explosões gigantes
+        'explosion_scale': 0.25,         # Escala de emissão de create_giant_explosion
+        'emission_scale': 0.5,           # Escala de emissão de create_explosion e rajadas
+        'thrust_particles': 1,           # Partículas de propulsão por frame
+        'ambient_scale': 0.5,            # Partículas ambientais dos cenários
+        'bullet_trail': 0,               # Comprimento do rastro dos projéteis
+        'enemy_trail': 3,                # Comprimento do rastro dos inimigos
+        'spawn_budget': 300              # Partículas agendadas criadas por frame
+    },
+    'média': {
+        'max_particles': 1536,
+        'max_explosion_particles': 2000,
+        'explosion_scale': 0.5,
+        'emission_scale': 0.75,
+        'thrust_particles': 2,
+        'ambient_scale': 0.75,
+        'bullet_trail': 3,
+        'enemy_trail': 5,
+        'spawn_budget': 600
+    },
+    'alta': {
+        'max_particles': 4096,
+        'max_explosion_particles': 4000,
+        'explosion_scale': 1.0,
+        'emission_scale': 1.0,
+        'thrust_particles': 2,
+        'ambient_scale': 1.0,
+        'bullet_trail': 5,
+        'enemy_trail': 8,
+        'spawn_budget': 1200
+    },
+    'ultra': {
+        'max_particles': 8192,
+        'max_explosion_particles': 8000,
+        'explosion_scale': 1.0,
+        'emission_scale': 1.5,
+        'thrust_particles': 3,
+        'ambient_scale': 1.5,
+        'bullet_trail': 8,
+        'enemy_trail': 12,
+        'spawn_budget': 2400
+    }
+}
+
+# Capacidade dos arrays: o maior teto de todos os níveis (trocar de nível não realoca)
+MAX_PARTICLES = max(tier['max_particles'] for tier in PARTICLE_TIERS.values())
+MAX_EXPLOSION_PARTICLES = max(tier['max_explosion_particles'] for tier in PARTICLE_TIERS.values())
+
+
+class ParticleBudget:
+    def __init__(self, tier=DEFAULT_TIER):
+        """Orçamento de partículas com nível de qualidade trocável"""
+        self.tier_name = tier if tier in PARTICLE_TIERS else DEFAULT_TIER
+        self.tier = PARTICLE_TIERS[self.tier_name]
+        # Sistema de partículas -> chave do teto no nível (some junto com o sistema)
+        self.systems = weakref.WeakKeyDictionary()
+
+    def set_tier(self, tier):
+        """Trocar o nível de qualidade e aplicar os tetos aos sistemas registrados"""
+        if tier not in PARTICLE_TIERS:
+            print(f"⚠️ Qualidade de partículas desconhecida: {tier}")
+            return
+        self.tier_name = tier
+        self.tier = PARTICLE_TIERS[tier]
+        for system, limit_key in list(self.systems.items()):
+            system.set_limit(self.tier[limit_key])
+
+    def register(self, system, limit_key='max_particles'):
+        """Registrar um sistema de partículas para receber o teto do nível atual"""
+        self.systems[system] = limit_key
+        system.set_limit(self.tier[limit_key])
+        return system
+
+    def unregister(self, system):
+        """Deixar de controlar um sistema"""
+        self.systems.pop(system, None)
+
+    def get(self, key):
+        """Valor de um parâmetro do nível atual"""
+        return self.tier[key]
+
+    def scaled(self, count, key='emission_scale'):
+        """Quantidade de partículas de uma emissão escalada pelo nível (mínimo 1)"""
+        if count <= 0:
+            return 0
+        return max(1, int(count * self.tier[key]))
+
+
+_budget = None
+_budget_lock = threading.Lock()
+
+
+def get_particle_budget():
+    """Orçamento de partículas único do processo"""
+    global _budget
+    with _budget_lock:
+        if _budget is None:
+            _budget = ParticleBudget()
+        return _budget
+
+
+def soak_benchmark(frames=300, width=800, height=600):
+    """
+    Simular combate pesado em cada nível e medir o tempo de frame.
+
+    Explosões gigantes periódicas, explosões simples e propulsão contínua,
+    com update + draw numa superfície fora da tela.
+    """
+    import time
+    import numpy as np
+    import pygame
+    from effects import PsychedelicEffects
+    from particle_system import ParticleSystem, LAYER_THRUST
+
+    budget = get_particle_budget()
+    previous_tier = budget.tier_name
+    screen = pygame.Surface((width, height))
+
+    print(f"🔥 Soak de partículas ({frames} frames por nível)")
+    for tier in PARTICLE_TIERS:
+        budget.set_tier(tier)
+        effects = PsychedelicEffects(width, height)
+        particles = budget.register(ParticleSystem(capacity=MAX_PARTICLES))
+
+        frame_times = []
+        for frame in range(frames):
+            start = time.perf_counter()
+
+            if frame % 60 == 0:
+                effects.create_giant_explosion(width / 2, height / 2, size_multiplier=8.0)
+            if frame % 10 == 0:
+                for _ in range(4):
+                    particles.emit_burst(np.random.uniform(0, width), np.random.uniform(0, height),
+                                         budget.scaled(15), (2, 8), 30, color=(255, 100, 0))
+            thrust = budget.get('thrust_particles')
+            particles.emit(width / 2 + np.random.uniform(-5, 5, thrust), height - 80,
+                           np.random.uniform(-1, 1, thrust), np.random.uniform(2, 5, thrust),
+                           20, max_life=25, size=8, hue=0.2, layer=LAYER_THRUST)
+
+            particles.update()
+            effects.update_explosion_particles(1 / 60)
+            screen.fill((0, 0, 0))
+            particles.draw(screen)
+            effects.draw_explosion_particles(screen)
+
+            frame_times.append(time.perf_counter() - start)
+
+        budget.unregister(particles)
+        budget.unregister(effects.explosions)
+        frame_times.sort()
+        average = sum(frame_times) / frames
+        p95 = frame_times[int(frames * 0.95)]
+        print(f"   {tier:6s} média {average * 1000:6.2f} ms | p95 {p95 * 1000:6.2f} ms | "
+              f"máx {frame_times[-1] * 1000:6.2f} ms")
+
+    budget.set_tier(previous_tier)
+
+
+if __name__ == "__main__":
+    import pygame
+    pygame.init()
+    soak_benchmark()
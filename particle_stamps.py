@@ -0,0 +1,227 @@
+"""
+Atlas de "carimbos" pré-renderizados para desenhar partículas em lote
+- Cada carimbo é um círculo (opcionalmente com brilho interno) já desenhado
+- Chave: (raio em bucket, cor quantizada, brilho) -> Surface com colorkey
+- Um único Surface.blits por chamada em vez de um pygame.draw.circle por partícula
+- Raios fora do atlas (tamanhos exóticos) caem no pygame.draw.circle normal
+- Limite em bytes: acima dele os carimbos mais antigos são descartados
+
+Uso: python particle_stamps.py  (compara draw.circle vs atlas com 1k/10k partículas)
+"""
+
+import numpy as np
+import pygame
+
+# Cor transparente dos carimbos (nunca é produzida pela quantização de cores)
+STAMP_COLORKEY = (1, 2, 3)
+
+# Quantização de cor: 64 níveis por canal (0, 4, 8, ..., 255), sem faixas visíveis
+# nos gradientes de propulsão e no escurecimento das fagulhas
+COLOR_LEVELS = 64
+LARGE_COLOR_STEP = 9  # Carimbos grandes: 8 níveis por canal (0, 36, 73, ..., 255)
+
+# Raios até EXACT_RADIUS são exatos; até MAX_STAMP_RADIUS vão para buckets de RADIUS_STEP
+EXACT_RADIUS = 16
+RADIUS_STEP = 4
+MAX_STAMP_RADIUS = 64
+
+DEFAULT_MAX_BYTES = 48 * 1024 * 1024  # 48 MB
+
+
+class StampAtlas:
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        """Atlas preenchido sob demanda (cada carimbo é renderizado uma única vez)"""
+        self.max_bytes = max_bytes
+        self.stamps = {}  # código (raio, cor, brilho) -> Surface, em ordem de criação
+        self.bytes = 0
+
+        # Estatísticas
+        self.hits = 0
+        self.misses = 0
+        self.fallbacks = 0
+        self.evictions = 0
+
+    @staticmethod
+    def radius_buckets(radii):
+        """Raio do carimbo usado para cada raio pedido (0 = fora do atlas)"""
+        radii = np.asarray(radii, dtype=np.int32)
+        rounded = (radii + RADIUS_STEP // 2) // RADIUS_STEP * RADIUS_STEP
+        buckets = np.where(radii <= EXACT_RADIUS, radii, rounded)
+        return np.where(radii > MAX_STAMP_RADIUS, 0, buckets)
+
+    @staticmethod
+    def quantize_colors(colors, buckets=None):
+        """
+        Nível (0 a COLOR_LEVELS-1) de cada canal das cores (N, 3).
+
+        Carimbos grandes (raio > EXACT_RADIUS) usam níveis de LARGE_COLOR_STEP em
+        LARGE_COLOR_STEP: são poucos por frame e ocupam a maior parte da memória.
+        """
+        levels = np.rint(np.asarray(colors, dtype=np.float32) * ((COLOR_LEVELS - 1) / 255))
+        levels = np.clip(levels, 0, COLOR_LEVELS - 1).astype(np.int32)
+        if buckets is not None:
+            large = np.asarray(buckets) > EXACT_RADIUS
+            if large.any():
+                coarse = (levels[large] + LARGE_COLOR_STEP // 2) // LARGE_COLOR_STEP * LARGE_COLOR_STEP
+                levels[large] = np.minimum(coarse, COLOR_LEVELS - 1)
+        return levels
+
+    @staticmethod
+    def stamp_codes(buckets, levels, glow):
+        """Código inteiro único de cada (raio, cor quantizada, brilho)"""
+        color_code = (levels[:, 0] * COLOR_LEVELS + levels[:, 1]) * COLOR_LEVELS + levels[:, 2]
+        return (buckets * COLOR_LEVELS ** 3 + color_code) * 2 + int(glow)
+
+    @staticmethod
+    def stamp_bytes(code):
+        """Memória (bytes) do carimbo de um código"""
+        size = (code >> 1) // COLOR_LEVELS ** 3 * 2 + 1
+        return size * size * 4
+
+    @staticmethod
+    def render_stamp(code):
+        """Renderizar o carimbo de um código (raio, cor quantizada, brilho)"""
+        glow = bool(code & 1)
+        radius, color_code = divmod(code >> 1, COLOR_LEVELS ** 3)
+        color = []
+        for _ in range(3):
+            color_code, level = divmod(color_code, COLOR_LEVELS)
+            color.insert(0, level * 255 // (COLOR_LEVELS - 1))
+
+        size = radius * 2 + 1
+        stamp = pygame.Surface((size, size))
+        stamp.fill(STAMP_COLORKEY)
+        pygame.draw.circle(stamp, color, (radius, radius), radius)
+        if glow and radius > 2:
+            # Brilho interno branco (mesmo visual do círculo duplo das explosões)
+            pygame.draw.circle(stamp, (255, 255, 255), (radius, radius), radius // 2)
+        stamp.set_colorkey(STAMP_COLORKEY, pygame.RLEACCEL)
+        return stamp
+
+    def draw(self, screen, xs, ys, radii, colors, glow=False):
+        """
+        Desenhar círculos em lote.
+
+        Args:
+            xs, ys, radii: arrays inteiros (N,)
+            colors: array (N, 3) com cores 0-255
+            glow: adicionar brilho interno branco (raio > 2)
+        """
+        if len(xs) == 0:
+            return
+
+        buckets = self.radius_buckets(radii)
+        xs = np.asarray(xs, dtype=np.int32)
+        ys = np.asarray(ys, dtype=np.int32)
+
+        # Carimbos: canto superior esquerdo = centro - raio do bucket
+        in_atlas = buckets > 0
+        levels = self.quantize_colors(np.asarray(colors)[in_atlas], buckets[in_atlas])
+        codes = self.stamp_codes(buckets[in_atlas], levels, glow)
+        left = (xs - buckets)[in_atlas].tolist()
+        top = (ys - buckets)[in_atlas].tolist()
+
+        # Renderizar só os carimbos que ainda não existem
+        stamps = self.stamps
+        codes = codes.tolist()
+        missing = set(codes).difference(stamps)
+        if missing:
+            for code in missing:
+                stamps[code] = self.render_stamp(code)
+                self.bytes += self.stamp_bytes(code)
+            self.misses += len(missing)
+            if self.bytes > self.max_bytes:
+                self.evict(keep=set(codes))
+        self.hits += len(codes) - len(missing)
+
+        # Pares (carimbo, posição) montados em C (map/zip), sem laço Python por partícula
+        screen.blits(zip(map(stamps.__getitem__, codes), zip(left, top)), doreturn=False)
+
+        # Tamanhos exóticos: desenho direto
+        outside = np.flatnonzero(~in_atlas)
+        if len(outside):
+            self.fallbacks += len(outside)
+            for x, y, radius, color in zip(xs[outside].tolist(), ys[outside].tolist(),
+                                           np.asarray(radii)[outside].tolist(),
+                                           np.asarray(colors, dtype=np.int32)[outside].tolist()):
+                pygame.draw.circle(screen, color, (x, y), radius)
+                if glow and radius > 2:
+                    pygame.draw.circle(screen, (255, 255, 255), (x, y), radius // 2)
+
+    def evict(self, keep=()):
+        """Descartar os carimbos mais antigos (exceto os do lote atual) até caber no limite"""
+        for code in list(self.stamps):
+            if self.bytes <= self.max_bytes:
+                break
+            if code in keep:
+                continue
+            del self.stamps[code]
+            self.bytes -= self.stamp_bytes(code)
+            self.evictions += 1
+
+    def clear(self):
+        """Descartar todos os carimbos"""
+        self.stamps.clear()
+        self.bytes = 0
+
+    def get_stats(self):
+        """Estatísticas do atlas"""
+        return {
+            'stamps': len(self.stamps),
+            'memory_kb': self.bytes // 1024,
+            'hits': self.hits,
+            'misses': self.misses,
+            'fallbacks': self.fallbacks,
+            'evictions': self.evictions
+        }
+
+
+_atlas = None
+
+
+def get_stamp_atlas():
+    """Atlas compartilhado por todos os sistemas de partículas"""
+    global _atlas
+    if _atlas is None:
+        _atlas = StampAtlas()
+    return _atlas
+
+
+def benchmark(counts=(1000, 10000), frames=30, max_radius=8):
+    """Comparar pygame.draw.circle por partícula vs atlas + Surface.blits"""
+    import time
+
+    screen = pygame.Surface((800, 600))
+    atlas = StampAtlas()
+
+    print(f"🎨 Desenho de partículas ({frames} frames, raio 1-{max_radius})")
+    for count in counts:
+        xs = np.random.randint(0, 800, count)
+        ys = np.random.randint(0, 600, count)
+        radii = np.random.randint(1, max_radius + 1, count)
+        colors = np.random.randint(0, 256, (count, 3))
+
+        # Código antigo: um draw.circle por partícula (+ brilho interno)
+        start = time.perf_counter()
+        for _ in range(frames):
+            for x, y, radius, color in zip(xs.tolist(), ys.tolist(), radii.tolist(), colors.tolist()):
+                pygame.draw.circle(screen, color, (x, y), radius)
+                if radius > 2:
+                    pygame.draw.circle(screen, (255, 255, 255), (x, y), radius // 2)
+        circle_time = (time.perf_counter() - start) / frames
+
+        atlas.draw(screen, xs, ys, radii, colors, glow=True)  # Aquecer o atlas
+        start = time.perf_counter()
+        for _ in range(frames):
+            atlas.draw(screen, xs, ys, radii, colors, glow=True)
+        atlas_time = (time.perf_counter() - start) / frames
+
+        print(f"   {count:6d} partículas: draw.circle {circle_time * 1000:7.2f} ms | "
+              f"atlas {atlas_time * 1000:7.2f} ms ({circle_time / atlas_time:.1f}x)")
+
+    print(f"   Atlas: {atlas.get_stats()}")
+
+
+if __name__ == "__main__":
+    pygame.init()
+    benchmark()
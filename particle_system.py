@@ -0,0 +1,314 @@
+"""
+Sistema de partículas em structure-of-arrays (NumPy)
+- Arrays pré-alocados (x, y, vx, vy, vida, cor...) com capacidade fixa
+- Integração vetorizada: um passo de física para todas as partículas de uma vez
+- Compactação por swap-remove: partículas vivas do fim ocupam os buracos dos mortos
+- Camadas: quem emite também atualiza/desenha só a sua camada (ex.: propulsão da nave)
+"""
+
+import numpy as np
+import pygame
+from particle_stamps import get_stamp_atlas
+from color_lut import hsv_colors
+
+# Camadas de partículas
+LAYER_EFFECTS = 0  # Explosões, colisões, bomba atômica (Game)
+LAYER_THRUST = 1   # Propulsão da nave (Player)
+
+
+class ParticleSystem:
+    # Campos por partícula (nome -> dtype); 'color' é (N, 3)
+    FIELDS = {
+        'x': np.float32,
+        'y': np.float32,
+        'vx': np.float32,
+        'vy': np.float32,
+        'life': np.float32,
+        'max_life': np.float32,
+        'size': np.float32,
+        'drag': np.float32,
+        'hue': np.float32,  # >= 0: cor por HSV que esfria com a idade (propulsão)
+        'layer': np.int8
+    }
+
+    def __init__(self, capacity=4096, stamps=None):
+        """Sistema com capacidade fixa (emissões além dela são descartadas)"""
+        self.capacity = capacity
+        self.limit = capacity  # Teto atual (nível de qualidade), nunca acima da capacidade
+        self.count = 0
+        self.stamps = stamps if stamps is not None else get_stamp_atlas()
+        for name, dtype in self.FIELDS.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+        self.color = np.zeros((capacity, 3), dtype=np.float32)
+
+        # Estatísticas
+        self.emitted = 0
+        self.dropped = 0
+
+    def __len__(self):
+        return self.count
+
+    def set_limit(self, limit):
+        """Mudar o teto de partículas vivas (as excedentes são descartadas)"""
+        self.limit = max(0, min(limit, self.capacity))
+        if self.count > self.limit:
+            self.count = self.limit
+
+    def emit(self, x, y, vx, vy, life, color=(255, 255, 255), max_life=None,
+             size=4, drag=1.0, hue=-1.0, layer=LAYER_EFFECTS):
+        """
+        Emitir partículas (escalares ou arrays de mesmo tamanho).
+
+        Returns:
+            número de partículas realmente emitidas
+        """
+        x, y, vx, vy, life = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(x, dtype=np.float32)),
+            np.asarray(y, dtype=np.float32), np.asarray(vx, dtype=np.float32),
+            np.asarray(vy, dtype=np.float32), np.asarray(life, dtype=np.float32))
+        requested = len(x)
+        amount = min(requested, self.limit - self.count)
+        self.dropped += requested - amount
+        if amount <= 0:
+            return 0
+
+        start, end = self.count, self.count + amount
+        self.x[start:end] = x[:amount]
+        self.y[start:end] = y[:amount]
+        self.vx[start:end] = vx[:amount]
+        self.vy[start:end] = vy[:amount]
+        self.life[start:end] = life[:amount]
+        self.max_life[start:end] = life[:amount] if max_life is None else self._take(max_life, requested, amount)
+        self.size[start:end] = self._take(size, requested, amount)
+        self.drag[start:end] = self._take(drag, requested, amount)
+        self.hue[start:end] = self._take(hue, requested, amount)
+        self.layer[start:end] = layer
+
+        color = np.asarray(color, dtype=np.float32)
+        self.color[start:end] = color[:amount] if color.ndim == 2 else color
+
+        self.count = end
+        self.emitted += amount
+        return amount
+
+    @staticmethod
+    def _take(value, requested, amount):
+        """Primeiros `amount` valores de um escalar ou array de `requested` itens"""
+        value = np.asarray(value, dtype=np.float32)
+        if value.ndim == 0:
+            return value
+        return np.broadcast_to(value, (requested,))[:amount]
+
+    def emit_burst(self, x, y, count, speed_range, life, color=(255, 255, 255),
+                   max_life=None, size=4, drag=1.0, layer=LAYER_EFFECTS):
+        """
+        Explosão radial: `count` partículas com ângulo e velocidade aleatórios.
+
+        `life` pode ser um número ou um intervalo (min, max) inteiro inclusivo;
+        `color` pode ser uma cor ou um array (count, 3) com uma cor por partícula.
+        """
+        angles = np.random.uniform(0, 2 * np.pi, count)
+        speeds = np.random.uniform(speed_range[0], speed_range[1], count)
+        if isinstance(life, tuple):
+            life = np.random.randint(life[0], life[1] + 1, count)
+        return self.emit(x, y, np.cos(angles) * speeds, np.sin(angles) * speeds, life,
+                         color=color, max_life=max_life, size=size, drag=drag, layer=layer)
+
+    def update(self, layer=None):
+        """Um passo de física (todas as camadas ou só uma) e remoção dos mortos"""
+        n = self.count
+        if n == 0:
+            return
+
+        x, y, vx, vy, life = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n], self.life[:n]
+        if layer is None:
+            x += vx
+            y += vy
+            life -= 1
+            vx *= self.drag[:n]
+            vy *= self.drag[:n]
+        else:
+            mask = self.layer[:n] == layer
+            np.add(x, vx, out=x, where=mask)
+            np.add(y, vy, out=y, where=mask)
+            np.subtract(life, 1, out=life, where=mask)
+            np.multiply(vx, self.drag[:n], out=vx, where=mask)
+            np.multiply(vy, self.drag[:n], out=vy, where=mask)
+
+        self.compact()
+
+    def compact(self):
+        """Swap-remove: mover as vivas do fim para os buracos das mortas (ordem não preservada)"""
+        n = self.count
+        dead = self.life[:n] <= 0
+        dead_count = int(np.count_nonzero(dead))
+        if dead_count == 0:
+            return
+
+        new_count = n - dead_count
+        holes = np.flatnonzero(dead[:new_count])
+        movers = np.flatnonzero(~dead[new_count:n]) + new_count
+        if len(holes):
+            for name in self.FIELDS:
+                array = getattr(self, name)
+                array[holes] = array[movers]
+            self.color[holes] = self.color[movers]
+        self.count = new_count
+
+    def draw(self, screen, layer=None):
+        """Desenhar partículas (todas as camadas ou só uma)"""
+        n = self.count
+        if n == 0:
+            return
+
+        indices = np.arange(n) if layer is None else np.flatnonzero(self.layer[:n] == layer)
+        if len(indices) == 0:
+            return
+
+        ratio = np.clip(self.life[indices] / self.max_life[indices], 0.0, 1.0)
+        radii = np.maximum(1, (self.size[indices] * ratio).astype(np.int32))
+
+        # Cor fixa escurece com a idade; cor por HSV esfria (hue desce) com a idade
+        colors = self.color[indices] * ratio[:, None]
+        hue = self.hue[indices]
+        hsv_mask = hue >= 0
+        if hsv_mask.any():
+            shifted = np.clip(hue[hsv_mask] - (1 - ratio[hsv_mask]) * 0.2, 0.0, 1.0)
+            colors[hsv_mask] = hsv_colors(shifted)
+        colors = np.clip(colors, 0, 255).astype(np.int32)
+
+        self.stamps.draw(screen, self.x[indices].astype(np.int32), self.y[indices].astype(np.int32),
+                         radii, colors)
+
+    def clear(self, layer=None):
+        """Remover todas as partículas (ou só as de uma camada)"""
+        if layer is None:
+            self.count = 0
+            return
+        self.life[:self.count][self.layer[:self.count] == layer] = 0
+        self.compact()
+
+    def get_stats(self):
+        """Estatísticas do sistema"""
+        return {
+            'active': self.count,
+            'capacity': self.capacity,
+            'limit': self.limit,
+            'emitted': self.emitted,
+            'dropped': self.dropped
+        }
+
+
+# Tipos de partícula de explosão
+KIND_SPARK = 0  # Fagulha: voa, cai com gravidade e encolhe
+KIND_RING = 1   # Anel de energia: expande no lugar e escurece
+
+
+class ExplosionParticles(ParticleSystem):
+    """Partículas das explosões gigantes (vida em segundos, gravidade e anéis)"""
+
+    FIELDS = dict(ParticleSystem.FIELDS, gravity=np.float32, expand=np.float32, kind=np.int8)
+
+    def emit_sparks(self, x, y, vx, vy, life, max_life, size, color, gravity):
+        """Emitir fagulhas (arrays de mesmo tamanho); retorna quantas couberam"""
+        start = self.count
+        amount = self.emit(x, y, vx, vy, life, color=color, max_life=max_life, size=size)
+        end = start + amount
+        self.gravity[start:end] = self._take(gravity, len(np.atleast_1d(vx)), amount)
+        self.expand[start:end] = 0
+        self.kind[start:end] = KIND_SPARK
+        return amount
+
+    def emit_rings(self, x, y, radius, expand_speed, life, color):
+        """Emitir anéis de energia; retorna quantos couberam"""
+        start = self.count
+        zeros = np.zeros(len(radius), dtype=np.float32)
+        amount = self.emit(x, y, zeros, zeros, life, color=color, size=radius)
+        end = start + amount
+        self.gravity[start:end] = 0
+        self.expand[start:end] = expand_speed[:amount]
+        self.kind[start:end] = KIND_RING
+        return amount
+
+    def update(self, dt, width=None, height=None):
+        """Integrar um passo de `dt` segundos e descartar mortas/fora da tela"""
+        n = self.count
+        if n == 0:
+            return
+
+        # Velocidades estão em pixels por frame a 60 FPS
+        frames = dt * 60
+        x, y, vy, size = self.x[:n], self.y[:n], self.vy[:n], self.size[:n]
+        x += self.vx[:n] * frames
+        y += vy * frames
+        vy += self.gravity[:n] * frames
+        size += self.expand[:n] * frames
+        self.life[:n] -= dt
+
+        # Fagulhas que saíram da tela não voltam (anéis morrem só por tempo)
+        if width is not None and height is not None:
+            outside = ((x + size < 0) | (x - size > width) |
+                       (y + size < 0) | (y - size > height))
+            self.life[:n][outside & (self.kind[:n] == KIND_SPARK)] = 0
+
+        self.compact()
+
+    def draw(self, screen):
+        """Desenhar fagulhas (com brilho interno) e anéis"""
+        n = self.count
+        if n == 0:
+            return
+
+        ratio = self.life[:n] / self.max_life[:n]
+        kind = self.kind[:n]
+
+        sparks = np.flatnonzero(kind == KIND_SPARK)
+        sizes = (self.size[sparks] * ratio[sparks]).astype(np.int32)
+        visible = sizes > 0
+        sparks, sizes = sparks[visible], sizes[visible]
+        colors = np.clip(self.color[sparks], 0, 255).astype(np.int32)
+        self.stamps.draw(screen, self.x[sparks].astype(np.int32), self.y[sparks].astype(np.int32),
+                         sizes, colors, glow=True)
+
+        rings = np.flatnonzero(kind == KIND_RING)
+        colors = np.clip(self.color[rings] * ratio[rings, None], 0, 255).astype(np.int32).tolist()
+        xs = self.x[rings].astype(np.int32).tolist()
+        ys = self.y[rings].astype(np.int32).tolist()
+        radii = self.size[rings].astype(np.int32).tolist()
+        for px, py, radius, color in zip(xs, ys, radii, colors):
+            pygame.draw.circle(screen, color, (px, py), radius, 3)
+
+
+def benchmark(count=5000, frames=120):
+    """Comparar listas de dicts vs arrays para `count` partículas"""
+    import random
+    import time
+
+    particles = []
+    for _ in range(count):
+        particles.append({'x': 0.0, 'y': 0.0, 'vel_x': random.uniform(-5, 5),
+                          'vel_y': random.uniform(-5, 5), 'life': random.randint(1, frames)})
+    start = time.perf_counter()
+    for _ in range(frames):
+        for particle in particles[:]:
+            particle['x'] += particle['vel_x']
+            particle['y'] += particle['vel_y']
+            particle['life'] -= 1
+            if particle['life'] <= 0:
+                particles.remove(particle)
+    dict_time = time.perf_counter() - start
+
+    system = ParticleSystem(capacity=count)
+    system.emit_burst(0, 0, count, (0, 5), (1, frames))
+    start = time.perf_counter()
+    for _ in range(frames):
+        system.update()
+    array_time = time.perf_counter() - start
+
+    print(f"✨ {count} partículas, {frames} frames")
+    print(f"   dicts:  {dict_time * 1000:8.1f} ms")
+    print(f"   arrays: {array_time * 1000:8.1f} ms ({dict_time / max(array_time, 1e-9):.0f}x)")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -1,10 +1,13 @@
 import pygame
 import math
-import colorsys
+import numpy as np
 from bullet import Bullet
+from particle_system import ParticleSystem, LAYER_THRUST
+from particle_budget import get_particle_budget
+from color_lut import hsv_color
 
 class Player(pygame.sprite.Sprite):
-    def __init__(self, x, y):
+    def __init__(self, x, y, particle_system=None):
         super().__init__()
         self.original_x = x
         self.original_y = y
@@ -35,7 +38,10 @@ class Player(pygame.sprite.Sprite):
         
         # Animação e efeitos visuais
         self.animation_frame = 0
-        self.thrust_particles = []
+        # Partículas de propulsão vão para o sistema compartilhado (ou um próprio)
+        if particle_system is None:
+            particle_system = ParticleSystem(capacity=256)
+        self.particle_system = particle_system
         
         # Atributos para compatibilidade
         self.skin = None
@@ -95,30 +101,22 @@ class Player(pygame.sprite.Sprite):
     
     def create_thrust_particles(self):
         """Criar partículas de propulsão atrás da nave"""
-        import random
-        
-        # Adicionar partículas na parte traseira da nave
-        for _ in range(2):
-            particle = {
-                'x': self.x + random.uniform(-5, 5),
-                'y': self.y + self.height // 2 + random.uniform(0, 10),
-                'vel_x': random.uniform(-1, 1),
-                'vel_y': random.uniform(2, 5),
-                'life': random.randint(15, 25),
-                'max_life': 25,
-                'hue': random.uniform(0.1, 0.3)  # Cores quentes (vermelho/laranja)
-            }
-            self.thrust_particles.append(particle)
+        count = get_particle_budget().get('thrust_particles')
+        self.particle_system.emit(
+            self.x + np.random.uniform(-5, 5, count),
+            self.y + self.height // 2 + np.random.uniform(0, 10, count),
+            np.random.uniform(-1, 1, count),
+            np.random.uniform(2, 5, count),
+            np.random.randint(15, 26, count),
+            max_life=25,
+            size=8,
+            hue=np.random.uniform(0.1, 0.3, count),  # Cores quentes (vermelho/laranja)
+            layer=LAYER_THRUST
+        )
     
     def update_thrust_particles(self):
         """Atualizar partículas de propulsão"""
-        for particle in self.thrust_particles[:]:
-            particle['x'] += particle['vel_x']
-            particle['y'] += particle['vel_y']
-            particle['life'] -= 1
-            
-            if particle['life'] <= 0:
-                self.thrust_particles.remove(particle)
+        self.particle_system.update(LAYER_THRUST)
     
     def shoot(self, bullets_group):
         """Atira um projétil"""
@@ -158,9 +156,7 @@ class Player(pygame.sprite.Sprite):
 
     def get_psychedelic_color(self, base_hue, time_offset=0.0):
         """Gerar cor psicodélica"""
-        hue = (base_hue + time_offset) % 1.0
-        rgb = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-        return tuple(int(c * 255) for c in rgb)
+        return hsv_color(base_hue + time_offset)
 
     def draw(self, screen, invulnerable=False):
         """Desenha o jogador com efeitos psicodélicos e feedback de invulnerabilidade"""
@@ -241,14 +237,4 @@ class Player(pygame.sprite.Sprite):
 
     def draw_thrust_particles(self, screen):
         """Desenha as partículas de propulsão."""
-        for particle in self.thrust_particles:
-            life_ratio = particle['life'] / particle['max_life']
-            size = max(1, int(life_ratio * 8))  # Tamanho mínimo 1
-            
-            # Cor muda de quente para fria (garantindo que hue seja válido)
-            hue = max(0.0, min(1.0, particle['hue'] - (1 - life_ratio) * 0.2))
-            rgb = colorsys.hsv_to_rgb(hue, 1, 1)
-            color = tuple(max(0, min(255, int(c * 255))) for c in rgb)  # Clamp RGB values
-            
-            if size > 0:  # Só desenhar se o tamanho for válido
-                pygame.draw.circle(screen, color, (int(particle['x']), int(particle['y'])), size)
\ No newline at end of file
+        self.particle_system.draw(screen, LAYER_THRUST)
\ No newline at end of file
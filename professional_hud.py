@@ -1,6 +1,8 @@
 import pygame
 import math
-import colorsys
+from color_lut import hsv_color
+from text_cache import get_text_cache
+from hud_layers import LayeredHUD
 
 class ProfessionalHUD:
     def __init__(self, width, height):
@@ -14,6 +16,7 @@ class ProfessionalHUD:
         self.small_font = pygame.font.Font(None, 28)
         self.font_small = pygame.font.Font(None, 22)
         self.font_tiny = pygame.font.Font(None, 18)
+        self.text_cache = get_text_cache()  # Textos renderizados uma vez, depois só blits
         
         # Cores psicodélicas
         self.primary_color = (255, 255, 255)
@@ -36,6 +39,11 @@ class ProfessionalHUD:
         
         # Margens da tela
         self.margin = 30
+        
+        # Widgets em camadas (redesenhados só quando mudam) e overlay de custo
+        self.layers = LayeredHUD(width, height)           # HUD compacto (draw)
+        self.complete_layers = LayeredHUD(width, height)  # HUD completo (draw_complete_hud)
+        self.show_debug = False
     
     def update(self, dt, score, lives, level, player_health=100):
         """Atualizar animações do HUD"""
@@ -58,24 +66,11 @@ class ProfessionalHUD:
     
     def get_psychedelic_color(self, base_color, intensity=1.0):
         """Gerar cor psicodélica animada"""
-        hue = (self.color_shift % 1.0)
-        rgb = colorsys.hsv_to_rgb(hue, 0.8, intensity)
-        return tuple(int(c * 255) for c in rgb)
+        return hsv_color(self.color_shift, 0.8, intensity)
     
     def draw_glow_text(self, screen, text, font, color, pos, glow=True):
-        """Desenhar texto com efeito de brilho"""
-        if glow:
-            # Efeito de brilho
-            glow_color = tuple(min(255, c + 50) for c in color)
-            for offset in [(2, 2), (-2, -2), (2, -2), (-2, 2)]:
-                glow_surf = font.render(text, True, glow_color)
-                glow_surf.set_alpha(80)
-                screen.blit(glow_surf, (pos[0] + offset[0], pos[1] + offset[1]))
-        
-        # Texto principal
-        text_surf = font.render(text, True, color)
-        screen.blit(text_surf, pos)
-        return text_surf.get_rect(topleft=pos)
+        """Desenhar texto com efeito de brilho (composto uma vez no cache de textos)"""
+        return self.text_cache.blit(screen, font, text, color, pos, glow)
     
     def draw_score(self, screen, score):
         """Desenhar SCORE no canto superior esquerdo"""
@@ -93,10 +88,8 @@ class ProfessionalHUD:
         
         score_text = f"{score:,}"
         if scale != 1.0:
-            temp_surf = self.large_font.render(score_text, True, self.primary_color)
-            original_size = temp_surf.get_size()
-            new_size = (int(original_size[0] * scale), int(original_size[1] * scale))
-            scaled_surf = pygame.transform.scale(temp_surf, new_size)
+            scaled_surf = self.text_cache.render(self.large_font, score_text, self.primary_color,
+                                                 scale=scale)
             screen.blit(scaled_surf, (x, y + 35))
         else:
             self.draw_glow_text(screen, score_text, self.large_font, self.primary_color, (x, y + 35))
@@ -133,8 +126,7 @@ class ProfessionalHUD:
         """Desenhar ícone de vida (nave com efeito psicodélico)"""
         # Cores psicodélicas
         hue = (self.color_shift + 0.3) % 1.0
-        rgb = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-        color = tuple(int(c * 255) for c in rgb)
+        color = hsv_color(hue)
         
         # Nave triangular
         points = [
@@ -177,8 +169,7 @@ class ProfessionalHUD:
         else:
             base_hue = 0.0   # Vermelho
         
-        rgb = colorsys.hsv_to_rgb(base_hue, 0.9, 1.0)
-        bar_color = tuple(int(c * 255) for c in rgb)
+        bar_color = hsv_color(base_hue, 0.9, 1.0)
         
         # Gradiente na barra
         for i in range(filled_width):
@@ -194,11 +185,11 @@ class ProfessionalHUD:
         
         # Texto da porcentagem centralizado
         percent_text = f"{int(health)}%"
-        text_surf = self.medium_font.render(percent_text, True, self.primary_color)
+        text_surf = self.text_cache.render(self.medium_font, percent_text, self.primary_color)
         text_rect = text_surf.get_rect(center=(bar_x + bar_width // 2, bar_y + bar_height // 2))
         
         # Sombra do texto
-        shadow_surf = self.medium_font.render(percent_text, True, (0, 0, 0))
+        shadow_surf = self.text_cache.render(self.medium_font, percent_text, (0, 0, 0))
         screen.blit(shadow_surf, (text_rect.x + 2, text_rect.y + 2))
         screen.blit(text_surf, text_rect)
     
@@ -229,38 +220,65 @@ class ProfessionalHUD:
         
         for i, control in enumerate(controls):
             color = self.get_psychedelic_color(self.primary_color, 0.9)
-            text = self.small_font.render(control, True, color)
+            text = self.text_cache.render(self.small_font, control, color)
             screen.blit(text, (start_x, start_y + i * 28))
     
     def draw_complete_hud(self, screen, score, lives, level, health=100, player_y=0, level_generator=None, coins=0, fps=0.0, show_fps=False, mode_icon="🎮", time_display=None):
-        """Desenhar HUD completo e limpo"""
+        """Desenhar HUD completo e limpo (cada widget é uma camada em cache)"""
+        layers = self.complete_layers
+        layers.begin()
+        margin = self.margin
+        
         # Esquerda: Score (topo) e Level (abaixo)
-        self.draw_score(screen, score)
-        self.draw_level(screen, level)
+        score_scale = round(self.score_animation_timer, 2) if self.score_animation_timer > 0 else 0
+        layers.layer('score', (margin - 4, margin - 4, 400, 100), (score, score_scale),
+                     lambda surface: self.draw_score(surface, score))
+        layers.layer('level', (margin - 4, margin + 106, 200, 90), (level,),
+                     lambda surface: self.draw_level(surface, level))
         
         # Direita: Vidas (topo) e Energia (abaixo)
-        self.draw_lives(screen, lives)
-        self.draw_energy_bar(screen, health)
+        lives_x = self.width - margin - 150
+        layers.layer('lives', (lives_x - 4, margin - 4, 40 * max(lives, 1) + 8, 75),
+                     (lives, hsv_color(self.color_shift + 0.3)),
+                     lambda surface: self.draw_lives(surface, lives))
+        energy_x = self.width - margin - 200
+        layers.layer('energy', (energy_x - 4, margin + 106, 210, 80),
+                     (int(health), round(self.score_pulse / 0.25)),  # Fase do gradiente animado
+                     lambda surface: self.draw_energy_bar(surface, health))
         
         # Centro-topo: Moedas
         if coins > 0:
-            self.draw_coins(screen, coins)
+            layers.layer('coins', (self.width // 2 - 4, 26, 200, 45),
+                         (coins, self.get_psychedelic_color(0.15)),
+                         lambda surface: self.draw_coins(surface, coins))
         
         # Modo de jogo (canto superior centro-esquerda)
         if mode_icon:
-            self.draw_mode_icon(screen, mode_icon)
+            layers.layer('mode', (self.width // 2 - 100, 30, 100, 45),
+                         (mode_icon, self.get_psychedelic_color((255, 200, 100), 0.9)),
+                         lambda surface: self.draw_mode_icon(surface, mode_icon))
         
         # Timer (se houver)
         if time_display:
-            self.draw_timer(screen, time_display)
+            layers.layer('timer', (self.width // 2 + 46, 26, 260, 50),
+                         (time_display, self.get_psychedelic_color((255, 100, 100), 1.0)),
+                         lambda surface: self.draw_timer(surface, time_display))
         
         # FPS (canto superior direito)
         if show_fps and fps > 0:
-            self.draw_fps(screen, fps)
+            layers.layer('fps', (self.width - 100, 10, 100, 25), (int(fps),),
+                         lambda surface: self.draw_fps(surface, fps))
         
         # Controles (primeiros 10 segundos)
         if self.show_controls:
-            self.draw_controls_help(screen)
+            layers.layer('controls', (self.width // 2 - 130, self.height - 140, 240, 120),
+                         (self.get_psychedelic_color((255, 255, 255), 0.8),
+                          self.get_psychedelic_color(self.primary_color, 0.9)),
+                         lambda surface: self.draw_controls_help(surface))
+        
+        layers.compose(screen)
+        if self.show_debug:
+            self.draw_debug_overlay(screen, layers)
     
     def draw_mode_icon(self, screen, icon):
         """Desenhar ícone do modo de jogo"""
@@ -271,7 +289,7 @@ class ProfessionalHUD:
         pos_x = self.width // 2 - 100
         pos_y = 30
         
-        text_surf = self.large_font.render(mode_text, True, color)
+        text_surf = self.text_cache.render(self.large_font, mode_text, color)
         screen.blit(text_surf, (pos_x, pos_y))
     
     def draw_timer(self, screen, time_display):
@@ -306,7 +324,7 @@ class ProfessionalHUD:
         else:
             color = (255, 0, 0)  # Vermelho
         
-        fps_surface = self.small_font.render(fps_text, True, color)
+        fps_surface = self.text_cache.render(self.small_font, fps_text, color)
         screen.blit(fps_surface, (self.width - 100, 10))
     
     def reset_controls_timer(self):
@@ -349,68 +367,127 @@ class ProfessionalHUD:
         fps = stats.get('fps', 0)
         self.color_shift = stats.get('color_shift', 0.0)
         
+        layers = self.layers
+        layers.begin()
+        
         # ============================================
         # CANTO SUPERIOR ESQUERDO - Score e Level
         # ============================================
+        x = 10
+        column_width = 260
+        y_pos = 10
+        
+        # Modo de jogo (ícone + nome) e timer (se houver)
+        header_height = 50 if time_display is not None else 25
+        layers.layer('header', (x, y_pos, column_width, header_height), (mode_icon, mode_name, time_display),
+                     lambda surface: self.draw_compact_header(surface, y_pos, mode_icon, mode_name, time_display))
+        y_pos += header_height
+        
+        # Score, fase, progresso e aviso de boss
+        score_height = 81 if boss_next else 63
+        layers.layer('score', (x, y_pos, column_width, score_height), (score, level, points_to_next, boss_next),
+                     lambda surface: self.draw_compact_score(surface, y_pos, score, level, points_to_next, boss_next))
+        y_pos += score_height + 10
+        
+        # Moedas e bombas
+        layers.layer('resources', (x, y_pos, column_width, 95), (coins, bombs, max_bombs, bomb_active),
+                     lambda surface: self.draw_compact_resources(surface, y_pos, coins, bombs, max_bombs, bomb_active))
+        y_pos += 95
+        
+        # ============================================
+        # ESQUERDA - Progressão (Nível e XP)
+        # ============================================
+        xp_width = int(150 * xp_progress)
+        layers.layer('progression', (x, y_pos, column_width, 48), (player_level, rank_name, xp_width),
+                     lambda surface: self.draw_compact_progression(surface, y_pos, player_level, rank_name, xp_width))
+        
+        # ============================================
+        # CANTO SUPERIOR DIREITO - Vida e FPS
+        # ============================================
+        right_x = self.width - 220
         y_pos = 10
         
-        # Modo de jogo (ícone + nome)
+        # Vida (a cor da barra acompanha o ciclo psicodélico)
+        health_ratio = health / max_health if max_health > 0 else 0
+        health_color = self.get_psychedelic_color(self.color_shift)
+        health_width = int(200 * health_ratio)
+        layers.layer('health', (right_x, y_pos, 220, 33), (int(health), max_health, health_width, health_color),
+                     lambda surface: self.draw_compact_health(surface, right_x, y_pos, health, max_health,
+                                                              health_width, health_color))
+        y_pos += 43
+        
+        # FPS (se habilitado)
+        if show_fps and fps > 0:
+            layers.layer('fps', (right_x, y_pos, 220, 25), (int(fps),),
+                         lambda surface: self.text_cache.blit_glyphs(surface, self.font_tiny, f"FPS: {int(fps)}",
+                                                                     (150, 150, 150), (right_x, y_pos)))
+            y_pos += 25
+        
+        # ============================================
+        # DIREITA - Missões Diárias (compactas)
+        # ============================================
+        mission_states = tuple((mission.get('completed', False), mission.get('progress', 0), mission.get('target', 1))
+                               for mission in missions)
+        layers.layer('missions', (right_x, y_pos, 220, 18 + 16 * len(mission_states)), mission_states,
+                     lambda surface: self.draw_compact_missions(surface, right_x, y_pos, mission_states))
+        
+        layers.compose(screen)
+        if self.show_debug:
+            self.draw_debug_overlay(screen, layers)
+    
+    def draw_compact_header(self, screen, y_pos, mode_icon, mode_name, time_display):
+        """Modo de jogo e timer (HUD compacto)"""
         mode_text = f"{mode_icon} {mode_name}"
-        mode_surf = self.font_small.render(mode_text, True, (255, 200, 100))
+        mode_surf = self.text_cache.render(self.font_small, mode_text, (255, 200, 100))
         screen.blit(mode_surf, (10, y_pos))
         y_pos += 25
         
-        # Timer (se houver)
         if time_display is not None:
             timer_text = f"⏱️ {time_display}"
             timer_color = (255, 100, 100) if "0:" in time_display else (255, 255, 255)
-            timer_surf = self.font_small.render(timer_text, True, timer_color)
+            timer_surf = self.text_cache.render(self.font_small, timer_text, timer_color)
             screen.blit(timer_surf, (10, y_pos))
-            y_pos += 25
-        
-        # Score
+    
+    def draw_compact_score(self, screen, y_pos, score, level, points_to_next, boss_next):
+        """Score, fase, progresso até o próximo nível e aviso de boss (HUD compacto)"""
         score_text = f"PONTOS: {score:,}"
-        score_surf = self.font_small.render(score_text, True, (255, 255, 100))
-        screen.blit(score_surf, (10, y_pos))
+        self.text_cache.blit_glyphs(screen, self.font_small, score_text, (255, 255, 100), (10, y_pos))
         y_pos += 25
         
         # Level do jogo
         game_level_text = f"FASE: {level}"
-        game_level_surf = self.font_small.render(game_level_text, True, (100, 200, 255))
+        game_level_surf = self.text_cache.render(self.font_small, game_level_text, (100, 200, 255))
         screen.blit(game_level_surf, (10, y_pos))
         y_pos += 20
         
         # Progresso até próximo nível
         progress_text = f"Próximo: {points_to_next:,} pts"
-        progress_surf = self.font_tiny.render(progress_text, True, (150, 150, 150))
-        screen.blit(progress_surf, (10, y_pos))
+        self.text_cache.blit_glyphs(screen, self.font_tiny, progress_text, (150, 150, 150), (10, y_pos))
         y_pos += 18
         
         # Indicador de boss
         if boss_next:
             boss_text = f"🐉 BOSS no Nível {level + 1}!"
-            boss_surf = self.font_tiny.render(boss_text, True, (255, 100, 100))
+            boss_surf = self.text_cache.render(self.font_tiny, boss_text, (255, 100, 100))
             screen.blit(boss_surf, (10, y_pos))
-            y_pos += 18
-        
-        y_pos += 10
-        
-        # Moedas
+    
+    def draw_compact_resources(self, screen, y_pos, coins, bombs, max_bombs, bomb_active):
+        """Moedas, dica da loja e bombas atômicas (HUD compacto)"""
         coins_text = f"💰 {coins}"
-        coins_surf = self.font_small.render(coins_text, True, (255, 215, 0))
+        coins_surf = self.text_cache.render(self.font_small, coins_text, (255, 215, 0))
         screen.blit(coins_surf, (10, y_pos))
         y_pos += 25
         
         # Dica da loja
         shop_hint = "TAB/S: Loja"
-        shop_surf = self.font_tiny.render(shop_hint, True, (200, 200, 100))
+        shop_surf = self.text_cache.render(self.font_tiny, shop_hint, (200, 200, 100))
         screen.blit(shop_surf, (10, y_pos))
         y_pos += 25
         
         # ⚛️ BOMBAS ATÔMICAS
         bombs_text = f"⚛️  BOMBAS: {bombs}/{max_bombs}"
         bombs_color = (255, 100, 255) if bombs > 0 else (100, 100, 100)
-        bombs_surf = self.font_small.render(bombs_text, True, bombs_color)
+        bombs_surf = self.text_cache.render(self.font_small, bombs_text, bombs_color)
         screen.blit(bombs_surf, (10, y_pos))
         y_pos += 20
         
@@ -422,21 +499,19 @@ class ProfessionalHUD:
             bomb_hint = "B: Disparar Bomba"
             bomb_hint_color = (200, 100, 200)
         
-        bomb_hint_surf = self.font_tiny.render(bomb_hint, True, bomb_hint_color)
+        bomb_hint_surf = self.text_cache.render(self.font_tiny, bomb_hint, bomb_hint_color)
         screen.blit(bomb_hint_surf, (10, y_pos))
-        y_pos += 25
-        
-        # ============================================
-        # ESQUERDA - Progressão (Nível e XP)
-        # ============================================
+    
+    def draw_compact_progression(self, screen, y_pos, player_level, rank_name, xp_width):
+        """Nível do jogador, rank e barra de XP (HUD compacto)"""
         player_level_text = f"NÍVEL {player_level}"
-        player_level_surf = self.font_small.render(player_level_text, True, (255, 150, 255))
+        player_level_surf = self.text_cache.render(self.font_small, player_level_text, (255, 150, 255))
         screen.blit(player_level_surf, (10, y_pos))
         y_pos += 20
         
         # Rank
         rank_text = f"{rank_name}"
-        rank_surf = self.font_tiny.render(rank_text, True, (200, 150, 200))
+        rank_surf = self.text_cache.render(self.font_tiny, rank_text, (200, 150, 200))
         screen.blit(rank_surf, (10, y_pos))
         y_pos += 20
         
@@ -444,59 +519,58 @@ class ProfessionalHUD:
         xp_bar_width = 150
         xp_bar_height = 8
         pygame.draw.rect(screen, (50, 50, 50), (10, y_pos, xp_bar_width, xp_bar_height))
-        pygame.draw.rect(screen, (150, 100, 255), (10, y_pos, int(xp_bar_width * xp_progress), xp_bar_height))
+        pygame.draw.rect(screen, (150, 100, 255), (10, y_pos, xp_width, xp_bar_height))
         pygame.draw.rect(screen, (200, 150, 255), (10, y_pos, xp_bar_width, xp_bar_height), 1)
-        
-        # ============================================
-        # CANTO SUPERIOR DIREITO - Vida e FPS
-        # ============================================
-        right_x = self.width - 220
-        y_pos = 10
-        
-        # Barra de vida
+    
+    def draw_compact_health(self, screen, right_x, y_pos, health, max_health, health_width, health_color):
+        """Texto e barra de vida (HUD compacto)"""
         bar_width = 200
         bar_height = 15
-        health_ratio = health / max_health if max_health > 0 else 0
         
-        # Texto de vida
         health_text = f"VIDA: {int(health)}/{max_health}"
-        health_surf = self.font_tiny.render(health_text, True, (255, 255, 255))
-        screen.blit(health_surf, (right_x, y_pos))
+        self.text_cache.blit_glyphs(screen, self.font_tiny, health_text, (255, 255, 255), (right_x, y_pos))
         y_pos += 18
         
-        # Barra
         pygame.draw.rect(screen, (80, 0, 0), (right_x, y_pos, bar_width, bar_height))
-        health_color = self.get_psychedelic_color(self.color_shift)
-        pygame.draw.rect(screen, health_color, (right_x, y_pos, int(bar_width * health_ratio), bar_height))
+        pygame.draw.rect(screen, health_color, (right_x, y_pos, health_width, bar_height))
         pygame.draw.rect(screen, (255, 255, 255), (right_x, y_pos, bar_width, bar_height), 2)
-        y_pos += 25
-        
-        # FPS (se habilitado)
-        if show_fps and fps > 0:
-            fps_text = f"FPS: {int(fps)}"
-            fps_surf = self.font_tiny.render(fps_text, True, (150, 150, 150))
-            screen.blit(fps_surf, (right_x, y_pos))
-            y_pos += 25
-        
-        # ============================================
-        # DIREITA - Missões Diárias (compactas)
-        # ============================================
+    
+    def draw_compact_missions(self, screen, right_x, y_pos, mission_states):
+        """Missões diárias compactas"""
         missions_title = "MISSÕES DIÁRIAS"
-        missions_title_surf = self.font_tiny.render(missions_title, True, (255, 200, 100))
+        missions_title_surf = self.text_cache.render(self.font_tiny, missions_title, (255, 200, 100))
         screen.blit(missions_title_surf, (right_x, y_pos))
         y_pos += 18
         
-        for mission in missions:
+        for completed, progress, target in mission_states:
             # Ícone de status
-            status_icon = "✓" if mission.get('completed', False) else "○"
-            color = (100, 255, 100) if mission.get('completed', False) else (180, 180, 180)
+            status_icon = "✓" if completed else "○"
+            color = (100, 255, 100) if completed else (180, 180, 180)
             
             # Texto compacto
-            mission_text = f"{status_icon} {mission.get('progress', 0)}/{mission.get('target', 1)}"
-            mission_surf = self.font_tiny.render(mission_text, True, color)
+            mission_text = f"{status_icon} {progress}/{target}"
+            mission_surf = self.text_cache.render(self.font_tiny, mission_text, color)
             screen.blit(mission_surf, (right_x + 10, y_pos))
             y_pos += 16
     
+    def toggle_debug(self):
+        """Mostrar/esconder o overlay de custo do HUD"""
+        self.show_debug = not self.show_debug
+    
+    def draw_debug_overlay(self, screen, layers):
+        """Overlay de debug: custo do HUD e camadas redesenhadas neste frame"""
+        stats = layers.get_stats()
+        text_stats = self.text_cache.get_stats()
+        lines = [
+            f"HUD: {stats['cost_ms']:.2f} ms (média {stats['average_cost_ms']:.2f} ms)",
+            f"Camadas: {stats['redraws']}/{stats['layers']} redesenhadas",
+            f"Textos: {text_stats['surfaces']} em cache, acertos {text_stats['hit_rate']:.0%}"
+        ]
+        y_pos = self.height - 20 * len(lines) - 10
+        for line in lines:
+            self.text_cache.blit_glyphs(screen, self.font_tiny, line, (0, 255, 200), (10, y_pos))
+            y_pos += 20
+    
     def force_show_controls(self, show=True):
         """Forçar mostrar ou esconder dicas de controle"""
         self.show_controls = show
\ No newline at end of file
@@ -21,7 +21,8 @@ class SaveSystem:
                 'resolution': [800, 600],
                 'show_fps': False,
                 'particle_quality': 'alta',
-                'screen_shake': True
+                'screen_shake': True,
+                'palette_mode': False
             },
             'stats': {
                 'total_games_played': 0,
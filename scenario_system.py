@@ -7,6 +7,7 @@ import pygame
 import colorsys
 import random
 from enum import Enum
+from particle_budget import get_particle_budget
 
 class ScenarioType(Enum):
     """Tipos de cenários disponíveis"""
@@ -193,9 +194,13 @@ class ScenarioRenderer:
         elif self.config.get('digital_rain'):
             self.create_digital_rain()
     
+    def ambient_count(self, count):
+        """Quantidade de partículas ambientais escalada pelo nível de qualidade"""
+        return get_particle_budget().scaled(count, 'ambient_scale')
+    
     def create_sandstorm_particles(self):
         """Criar partículas de tempestade de areia"""
-        for _ in range(50):
+        for _ in range(self.ambient_count(50)):
             self.ambient_particles.append({
                 'x': random.randint(0, self.width),
                 'y': random.randint(0, self.height),
@@ -207,7 +212,7 @@ class ScenarioRenderer:
     
     def create_bubble_particles(self):
         """Criar bolhas subaquáticas"""
-        for _ in range(30):
+        for _ in range(self.ambient_count(30)):
             self.ambient_particles.append({
                 'x': random.randint(0, self.width),
                 'y': random.randint(self.height // 2, self.height),
@@ -219,7 +224,7 @@ class ScenarioRenderer:
     
     def create_snow_particles(self):
         """Criar neve caindo"""
-        for _ in range(100):
+        for _ in range(self.ambient_count(100)):
             self.ambient_particles.append({
                 'x': random.randint(0, self.width),
                 'y': random.randint(0, self.height),
@@ -232,7 +237,7 @@ class ScenarioRenderer:
     
     def create_firefly_particles(self):
         """Criar vaga-lumes"""
-        for _ in range(40):
+        for _ in range(self.ambient_count(40)):
             self.ambient_particles.append({
                 'x': random.randint(0, self.width),
                 'y': random.randint(0, self.height),
@@ -245,7 +250,7 @@ class ScenarioRenderer:
     
     def create_digital_rain(self):
         """Criar chuva digital estilo Matrix"""
-        for _ in range(20):
+        for _ in range(self.ambient_count(20)):
             self.ambient_particles.append({
                 'x': random.randint(0, self.width),
                 'y': random.randint(-self.height, 0),
@@ -1,6 +1,7 @@
 import pygame
 import math
-import colorsys
+from particle_budget import get_particle_budget
+from color_lut import hsv_color
 
 
 class SettingsMenu:
@@ -82,11 +83,18 @@ class SettingsMenu:
                 'name': 'Screen Shake',
                 'type': 'toggle',
                 'format': lambda v: "SIM" if v else "NÃO"
+            },
+            {
+                'id': 'palette_mode',
+                'name': 'Modo 8-bit (Paleta)',
+                'type': 'toggle',
+                'format': lambda v: "SIM" if v else "NÃO"
             }
         ]
         
         # Carregar configurações atuais
         self.load_settings()
+        self.apply_setting('particle_quality')
     
     def load_settings(self):
         """Carregar configurações do save system"""
@@ -111,7 +119,8 @@ class SettingsMenu:
                     'music_volume': 0.3,
                     'sfx_volume': 0.5,
                     'fullscreen': False,
-                    'show_fps': False
+                    'show_fps': False,
+                    'palette_mode': False
                 }.get(option_id, False)
                 
                 self.current_values[option_id] = self.save_system.get_setting(option_id, default)
@@ -157,9 +166,9 @@ class SettingsMenu:
         """Aplicar configuração imediatamente"""
         value = self.current_values[option_id]
         
-        # Aqui você pode adicionar lógica para aplicar certas configurações imediatamente
-        # Por exemplo, mudar volume, fullscreen, etc.
-        pass
+        if option_id == 'particle_quality':
+            # Novo nível vale já no próximo frame (sem reiniciar)
+            get_particle_budget().set_tier(value)
     
     def handle_input(self, event):
         """Processar entrada do usuário"""
@@ -200,8 +209,7 @@ class SettingsMenu:
     def get_psychedelic_color(self, hue_offset=0.0, brightness=1.0):
         """Gerar cor psicodélica animada"""
         hue = (hue_offset + self.animation_frame * 0.02) % 1.0
-        rgb = colorsys.hsv_to_rgb(hue, 1.0, brightness)
-        return tuple(int(c * 255) for c in rgb)
+        return hsv_color(hue, 1.0, brightness)
     
     def draw(self, screen):
         """Desenhar menu de configurações"""
@@ -219,7 +227,8 @@ class SettingsMenu:
         
         # Desenhar opções
         start_y = 150
-        spacing = 70
+        # Espaçamento reduzido se as opções não couberem acima das instruções
+        spacing = min(70, (self.height - 90 - start_y) // max(1, len(self.options) - 1))
         
         for i, option in enumerate(self.options):
             y_pos = start_y + i * spacing
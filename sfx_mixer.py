@@ -0,0 +1,147 @@
+"""
+Mixer de efeitos sonoros com alocação de vozes
+- Pool de N canais do pygame.mixer (vozes) em vez de um único canal de SFX
+- Prioridade por som e roubo de voz (voice stealing) quando o pool está cheio
+- Coalescência: no máximo X instâncias do mesmo som numa janela de ~1 frame (16 ms),
+  medida pelo relógio (vale em qualquer loop: jogo, loja, menus, demos)
+- Contadores por frame de pedidos tocados, mesclados e descartados
+"""
+
+import time
+import pygame
+
+# Prioridade de cada som (maior = mais importante, pode roubar vozes de menor prioridade)
+SOUND_PRIORITIES = {
+    'powerup': 4,
+    'explosion': 3,
+    'laser': 2,
+    'shoot': 2,
+    'enemy_hit': 1
+}
+DEFAULT_PRIORITY = 2
+
+# Janela de coalescência: pedidos do mesmo som dentro dela são mesclados (segundos)
+COALESCE_WINDOW = 0.016
+
+# Máximo de instâncias do mesmo som iniciadas dentro da janela
+MAX_INSTANCES_PER_FRAME = {
+    'explosion': 1,
+    'powerup': 1,
+    'enemy_hit': 1
+}
+DEFAULT_MAX_INSTANCES = 2
+
+
+class SFXMixer:
+    def __init__(self, channels):
+        """Pool de vozes sobre os canais do mixer recebidos"""
+        self.voices = [{'channel': channel, 'name': None, 'priority': 0, 'started': 0.0}
+                       for channel in channels]
+        self.priorities = dict(SOUND_PRIORITIES)
+        self.max_instances = dict(MAX_INSTANCES_PER_FRAME)
+
+        # Início (perf_counter) das instâncias recentes de cada som
+        self.recent_starts = {}
+        
+        # Estatísticas do frame atual, do último frame completo e acumuladas
+        self.frame_stats = self._empty_stats()
+        self.last_frame_stats = self._empty_stats()
+        self.total_stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats():
+        return {'requests': 0, 'played': 0, 'merged': 0, 'dropped': 0, 'stolen': 0}
+
+    def begin_frame(self):
+        """Fechar as estatísticas do frame anterior (a coalescência é por tempo)"""
+        self.last_frame_stats = self.frame_stats
+        self.frame_stats = self._empty_stats()
+
+    def play(self, name, sound):
+        """
+        Pedir para tocar um som.
+
+        Returns:
+            'played', 'stolen', 'merged' ou 'dropped'
+        """
+        self._count('requests')
+
+        # Coalescência: o mesmo som já foi iniciado vezes suficientes nos últimos ~16 ms
+        now = time.perf_counter()
+        starts = [started for started in self.recent_starts.get(name, ())
+                  if now - started < COALESCE_WINDOW]
+        self.recent_starts[name] = starts
+        if len(starts) >= self.max_instances.get(name, DEFAULT_MAX_INSTANCES):
+            self._count('merged')
+            return 'merged'
+
+        priority = self.priorities.get(name, DEFAULT_PRIORITY)
+        voice = self._find_free_voice()
+        result = 'played'
+
+        if voice is None:
+            voice = self._find_voice_to_steal(priority)
+            if voice is None:
+                self._count('dropped')
+                return 'dropped'
+            voice['channel'].stop()
+            result = 'stolen'
+            self._count('stolen')
+
+        voice['channel'].play(sound)
+        voice['name'] = name
+        voice['priority'] = priority
+        voice['started'] = now
+
+        starts.append(now)
+        self._count('played')
+        return result
+
+    def _find_free_voice(self):
+        """Primeira voz ociosa (ou None)"""
+        for voice in self.voices:
+            if not voice['channel'].get_busy():
+                return voice
+        return None
+
+    def _find_voice_to_steal(self, priority):
+        """Voz de menor prioridade (a mais antiga no empate) que pode ser roubada"""
+        candidates = [voice for voice in self.voices if voice['priority'] <= priority]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda voice: (voice['priority'], voice['started']))
+
+    def _count(self, key):
+        self.frame_stats[key] += 1
+        self.total_stats[key] += 1
+
+    def set_volume(self, volume):
+        """Ajustar volume de todas as vozes"""
+        for voice in self.voices:
+            voice['channel'].set_volume(volume)
+
+    def stop_all(self):
+        """Parar todas as vozes"""
+        for voice in self.voices:
+            voice['channel'].stop()
+
+    def active_voices(self):
+        """Número de vozes tocando agora"""
+        return sum(1 for voice in self.voices if voice['channel'].get_busy())
+
+    def get_stats(self):
+        """Estatísticas do último frame completo e acumuladas"""
+        return {
+            'voices': len(self.voices),
+            'active_voices': self.active_voices(),
+            'last_frame': dict(self.last_frame_stats),
+            'total': dict(self.total_stats)
+        }
+
+
+def create_voice_channels(first_channel, count):
+    """Reservar canais do mixer para o pool de vozes (aumentando o número se preciso)"""
+    needed = first_channel + count
+    if pygame.mixer.get_num_channels() < needed:
+        pygame.mixer.set_num_channels(needed)
+    return [pygame.mixer.Channel(index) for index in range(first_channel, first_channel + count)]
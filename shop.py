@@ -1,7 +1,7 @@
 import pygame
 import math
 import random
-import colorsys
+from color_lut import hsv_color
 
 
 class Shop:
@@ -171,8 +171,7 @@ class Shop:
     def get_psychedelic_color(self, hue_offset=0.0, brightness=1.0):
         """Gerar cor psicodélica animada"""
         hue = (hue_offset + self.animation_frame * 0.02) % 1.0
-        rgb = colorsys.hsv_to_rgb(hue, 1.0, brightness)
-        return tuple(int(c * 255) for c in rgb)
+        return hsv_color(hue, 1.0, brightness)
     
     def draw(self, screen):
         """Desenhar interface da loja"""
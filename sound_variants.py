@@ -0,0 +1,106 @@
+"""
+Banco de variações de efeitos sonoros
+- Cada SFX base é renderizado uma vez; K variações são derivadas dele
+- Pitch por reamostragem vetorizada (np.interp), ganho e passa-baixa leve
+- Escolha da variação por round-robin ou aleatória, sem custo de síntese por play
+"""
+
+import random
+import zlib
+import numpy as np
+import pygame
+import audio_dsp
+
+# Sons que recebem variações (os demais tocam sempre o som base)
+VARIANT_SOUNDS = ('laser', 'enemy_hit', 'explosion')
+
+VARIANT_POLICIES = ('round_robin', 'random')
+
+
+def resample(pcm, ratio):
+    """
+    Reamostrar PCM (mono ou stereo) por interpolação linear.
+
+    ratio > 1 acelera (pitch mais agudo, som mais curto); ratio < 1 o contrário.
+    """
+    frames = len(pcm)
+    new_frames = max(1, int(frames / ratio))
+    positions = np.arange(new_frames) * ratio
+    source_positions = np.arange(frames)
+
+    if pcm.ndim == 1:
+        return np.interp(positions, source_positions, pcm)
+
+    resampled = np.empty((new_frames, pcm.shape[1]))
+    for channel in range(pcm.shape[1]):
+        resampled[:, channel] = np.interp(positions, source_positions, pcm[:, channel])
+    return resampled
+
+
+class SoundVariantBank:
+    def __init__(self, sample_rate, variants=4, policy='round_robin',
+                 pitch_range=1.5, gain_range=0.2, min_cutoff=5000):
+        """Banco de variações (pitch em semitons, ganho relativo, corte mínimo em Hz)"""
+        self.sample_rate = sample_rate
+        self.variants = variants
+        self.policy = policy
+        self.pitch_range = pitch_range
+        self.gain_range = gain_range
+        self.min_cutoff = min_cutoff
+
+        self.bank = {}         # nome -> lista de pygame.mixer.Sound
+        self.next_index = {}   # nome -> próxima variação (round-robin)
+
+    def variant_settings(self, name):
+        """Parâmetros (semitons, ganho, corte) de cada variação, estáveis por nome"""
+        rng = np.random.default_rng(zlib.crc32(name.encode('utf-8')))
+        nyquist = self.sample_rate / 2
+        settings = [(0.0, 1.0, nyquist)]  # Variação 0 = som original
+        for _ in range(self.variants - 1):
+            semitones = rng.uniform(-self.pitch_range, self.pitch_range)
+            gain = 1.0 - rng.uniform(0, self.gain_range)
+            cutoff = rng.uniform(self.min_cutoff, nyquist)
+            settings.append((semitones, gain, cutoff))
+        return settings
+
+    def build(self, name, base_sound):
+        """Derivar as variações de um som base (uma vez por nome)"""
+        base = pygame.sndarray.array(base_sound).astype(np.float32)
+        sounds = []
+        for semitones, gain, cutoff in self.variant_settings(name):
+            if semitones == 0.0 and gain == 1.0:
+                sounds.append(base_sound)
+                continue
+
+            variant = resample(base, 2 ** (semitones / 12))
+            low_pass = audio_dsp.OnePoleLowPass(cutoff, self.sample_rate)
+            if variant.ndim == 1:
+                variant = low_pass(variant)
+            else:
+                for channel in range(variant.shape[1]):
+                    variant[:, channel] = low_pass(variant[:, channel])
+            variant *= gain
+            np.clip(variant, -32768, 32767, out=variant)
+            sounds.append(pygame.sndarray.make_sound(np.ascontiguousarray(variant, dtype=np.int16)))
+
+        self.bank[name] = sounds
+        self.next_index[name] = 0
+        return sounds
+
+    def pick(self, name, base_sound):
+        """Escolher a variação a tocar (constrói o banco do som na primeira vez)"""
+        sounds = self.bank.get(name)
+        if sounds is None:
+            sounds = self.build(name, base_sound)
+
+        if self.policy == 'random':
+            return random.choice(sounds)
+
+        index = self.next_index[name]
+        self.next_index[name] = (index + 1) % len(sounds)
+        return sounds[index]
+
+    def clear(self):
+        """Descartar variações (ex.: sons base mudaram)"""
+        self.bank.clear()
+        self.next_index.clear()
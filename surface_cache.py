@@ -0,0 +1,138 @@
+"""
+Cache de superfícies translúcidas pequenas (anéis e discos dos inimigos)
+- Chave: (forma, raio, alpha, cor quantizada, espessura) -> Surface SRCALPHA
+- LRU limitado: as menos usadas saem quando o cache enche
+- Substitui o pygame.Surface(..., SRCALPHA) criado por anel/rastro a cada frame
+- Contadores de acertos/faltas para verificar a taxa de reaproveitamento
+
+Uso: python surface_cache.py  (compara alocar por frame vs cache com 30 inimigos)
+"""
+
+from collections import OrderedDict
+import pygame
+
+# Quantização de cor: 16 níveis por canal (passo de 17)
+COLOR_STEP = 17
+
+DEFAULT_MAX_SURFACES = 1024
+
+
+class SurfaceCache:
+    def __init__(self, max_surfaces=DEFAULT_MAX_SURFACES):
+        """Cache LRU de anéis/discos renderizados"""
+        self.max_surfaces = max_surfaces
+        self.surfaces = OrderedDict()
+
+        # Estatísticas
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def quantize_color(color):
+        """Cor RGB arredondada para o nível mais próximo (reduz variações de chave)"""
+        return tuple((int(c) + COLOR_STEP // 2) // COLOR_STEP * COLOR_STEP for c in color[:3])
+
+    def get(self, shape, radius, color, alpha=255, width=0):
+        """
+        Superfície (2*raio x 2*raio) com um círculo centralizado.
+
+        Args:
+            shape: 'ring' ou 'disc' (só entra na chave; o contorno vem de width)
+            radius: raio em pixels
+            color: cor RGB (quantizada antes de virar chave)
+            alpha: transparência 0-255
+            width: espessura do contorno (0 = preenchido)
+        """
+        color = self.quantize_color(color)
+        key = (shape, radius, alpha, color, width)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        size = max(1, radius * 2)
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        if radius > 0:
+            pygame.draw.circle(surface, (*color, alpha), (radius, radius), radius, width)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def ring(self, radius, color, alpha=255, width=1):
+        """Anel translúcido (contorno de espessura width)"""
+        return self.get('ring', radius, color, alpha, width)
+
+    def disc(self, radius, color, alpha=255):
+        """Disco translúcido preenchido"""
+        return self.get('disc', radius, color, alpha, 0)
+
+    def clear(self):
+        """Descartar todas as superfícies"""
+        self.surfaces.clear()
+
+    def get_stats(self):
+        """Estatísticas do cache"""
+        total = self.hits + self.misses
+        return {
+            'surfaces': len(self.surfaces),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+
+_cache = None
+
+
+def get_surface_cache():
+    """Cache compartilhado por todos os inimigos"""
+    global _cache
+    if _cache is None:
+        _cache = SurfaceCache()
+    return _cache
+
+
+def benchmark(enemies=30, frames=300):
+    """Comparar o custo de desenho dos inimigos: superfícies novas por frame vs cache"""
+    import random
+    import time
+    import surface_cache
+    from enemy import Enemy, ENEMY_TYPES
+    from particle_budget import get_particle_budget
+
+    screen = pygame.Surface((800, 600))
+    group = [Enemy(random.randint(50, 750), random.randint(50, 550), random.choice(ENEMY_TYPES))
+             for _ in range(enemies)]
+    for enemy in group:
+        enemy.trail = [(enemy.x, enemy.y + i * 4) for i in range(get_particle_budget().get('enemy_trail'))]
+
+    cache = surface_cache.get_surface_cache()  # A mesma instância usada por enemy.py
+    print(f"👾 Desenho de {enemies} inimigos ({frames} frames)")
+    for label, cached in (("sem cache", False), ("com cache", True)):
+        cache.clear()
+        cache.hits = cache.misses = cache.evictions = 0
+        cache.max_surfaces = DEFAULT_MAX_SURFACES if cached else 0
+        start = time.perf_counter()
+        for _ in range(frames):
+            screen.fill((0, 0, 0))
+            for enemy in group:
+                enemy.animation_frame += 1
+                enemy.energy_field += 0.1
+                enemy.draw(screen)
+        elapsed = (time.perf_counter() - start) / frames
+        stats = cache.get_stats()
+        print(f"   {label}: {elapsed * 1000:6.2f} ms/frame | {stats['misses'] / frames:6.1f} "
+              f"superfícies criadas/frame | acertos {stats['hit_rate']:.0%}")
+
+    cache.max_surfaces = DEFAULT_MAX_SURFACES
+
+
+if __name__ == "__main__":
+    pygame.init()
+    benchmark()
@@ -0,0 +1,194 @@
+"""
+Índice de colisão do terreno por faixas de y (coordenadas de mundo)
+- Segmentos de parede e obstáculos ficam em faixas horizontais de BAND_HEIGHT pixels
+- Atualização incremental: cada segmento/obstáculo entra uma vez, quando é gerado;
+  faixas que saem por baixo da tela são descartadas inteiras
+- Consulta do jogador: só os itens das 2-3 faixas que cruzam o retângulo dele
+  (em vez de um pygame.Rect novo por segmento e obstáculo a cada frame)
+- Mesmos retângulos de antes: parede = do ponto superior até o inferior + 10px,
+  convertidos para a tela como o pygame.Rect fazia (topo e altura truncados para int)
+
+Uso: python terrain_collision.py  (estresse: canais estreitos e muito variados)
+"""
+
+import math
+
+# Altura de cada faixa do índice (pixels de mundo)
+BAND_HEIGHT = 32
+
+# Altura extra dos retângulos de parede (cobre a junção entre segmentos)
+SEGMENT_PADDING = 10
+
+
+class TerrainCollisionIndex:
+    def __init__(self, width, band_height=BAND_HEIGHT):
+        """Índice vazio para um nível de largura width"""
+        self.width = width
+        self.band_height = band_height
+        self.bands = {}  # faixa -> [(esquerda, direita, y, deslocamento, altura), ...]
+        self.max_band = None  # Faixa mais baixa ainda no índice (próxima a sair)
+
+        # Estatísticas
+        self.queries = 0
+        self.items_tested = 0
+
+    def add_rect(self, left, right, y, height, offset=0):
+        """
+        Registrar um retângulo em todas as faixas que ele pode cruzar.
+
+        Na tela ele é pygame.Rect(left, y + scroll - offset, right - left, height):
+        o topo é truncado para int a cada consulta, com a mesma conta de antes.
+
+        Args:
+            left, right: x inteiros
+            y: y de mundo
+            height: altura (truncada para int, como no pygame.Rect)
+            offset: deslocamento inteiro subtraído depois do scroll
+        """
+        height = int(height)
+        if right <= left or height <= 0:
+            return  # Retângulo vazio nunca colide (como pygame.Rect)
+        item = (left, right, y, offset, height)
+        # A truncagem move o topo até 1px: faixas com folga de 1px para cada lado
+        first = math.floor((y - offset - 1) / self.band_height)
+        last = math.ceil((y - offset + height + 1) / self.band_height) - 1
+        for band in range(first, last + 1):
+            items = self.bands.get(band)
+            if items is None:
+                items = self.bands[band] = []
+            items.append(item)
+        if self.max_band is None or last > self.max_band:
+            self.max_band = last
+
+    def add_wall_segment(self, side, upper, lower):
+        """
+        Registrar o segmento entre dois pontos consecutivos de uma parede.
+
+        Args:
+            side: 'left' ou 'right'
+            upper: ponto (x, y) de cima (menor y); sua largura define o retângulo
+            lower: ponto (x, y) de baixo
+        """
+        x1, y1 = upper
+        top = min(y1, lower[1])
+        height = abs(lower[1] - y1) + SEGMENT_PADDING
+        if side == 'left':
+            self.add_rect(0, x1, top, height)
+        else:
+            self.add_rect(x1, self.width, top, height)
+
+    def add_obstacle(self, obstacle):
+        """Registrar o retângulo de um obstáculo (dict com x, y de mundo e size)"""
+        size = obstacle['size']
+        left = obstacle['x'] - size // 2
+        self.add_rect(left, left + size, obstacle['y'], size, size // 2)
+
+    def rebuild(self, left_wall, right_wall, obstacles=()):
+        """Recriar o índice a partir das paredes (de cima para baixo) e obstáculos"""
+        self.bands.clear()
+        self.max_band = None
+        for side, wall in (('left', list(left_wall)), ('right', list(right_wall))):
+            for upper, lower in zip(wall, wall[1:]):
+                self.add_wall_segment(side, upper, lower)
+        for obstacle in obstacles:
+            self.add_obstacle(obstacle)
+
+    def evict_below(self, world_y):
+        """Descartar as faixas que começam abaixo de world_y (já saíram da tela)"""
+        while self.bands and self.max_band * self.band_height >= world_y:
+            self.bands.pop(self.max_band, None)
+            self.max_band -= 1
+        if not self.bands:
+            self.max_band = None
+
+    def collides(self, left, top, right, bottom, scroll=0):
+        """Verificar se o retângulo (tela, com o scroll atual) toca alguma parede ou obstáculo"""
+        self.queries += 1
+        band_height = self.band_height
+        bands = self.bands
+        for band in range(math.floor((top - scroll) / band_height), math.ceil((bottom - scroll) / band_height)):
+            items = bands.get(band)
+            if items is None:
+                continue
+            self.items_tested += len(items)
+            for item_left, item_right, item_y, item_offset, item_height in items:
+                if left < item_right and item_left < right:
+                    item_top = int(item_y + scroll - item_offset)
+                    if top < item_top + item_height and item_top < bottom:
+                        return True
+        return False
+
+    def get_stats(self):
+        """Estatísticas do índice"""
+        return {
+            'bands': len(self.bands),
+            'items': sum(len(items) for items in self.bands.values()),
+            'queries': self.queries,
+            'items_per_query': self.items_tested / self.queries if self.queries else 0.0
+        }
+
+
+def benchmark(queries=20000):
+    """Estresse: canais estreitos e muito variados, retângulos novos por consulta vs índice"""
+    import random
+    import time
+    import pygame
+    from level_generator import LevelGenerator
+
+    def old_collision_rects(level):
+        """Caminho antigo: um pygame.Rect por segmento e obstáculo a cada consulta"""
+        rects = []
+        scroll = level.scroll
+        for wall, is_left in ((list(level.left_wall), True), (list(level.right_wall), False)):
+            for (x1, y1), (x2, y2) in zip(wall, wall[1:]):
+                top = min(y1, y2) + scroll
+                if is_left:
+                    rects.append(pygame.Rect(0, top, x1, abs(y2 - y1) + SEGMENT_PADDING))
+                else:
+                    rects.append(pygame.Rect(x1, top, level.width - x1, abs(y2 - y1) + SEGMENT_PADDING))
+        for obstacle in level.obstacles:
+            size = obstacle['size']
+            rects.append(pygame.Rect(obstacle['x'] - size // 2, obstacle['y'] + scroll - size // 2,
+                                     size, size))
+        return rects
+
+    print(f"💥 Colisão com o terreno ({queries} consultas por cenário)")
+    for speed, complexity in ((4, 1), (2, 6), (2.3, 3), (0.5, 12)):
+        random.seed(7)
+        level = LevelGenerator(800, 600)
+        level.terrain_complexity = complexity
+        level.current_level = 10
+        level.wall_width = 80
+        for _ in range(int(900 / speed)):
+            level.update(speed)
+            if random.random() < 0.2:
+                level.generate_obstacle()  # Muitos obstáculos no canal
+
+        # Jogador (40x40) em posições aleatórias da tela
+        players = [pygame.Rect(random.randint(0, 760), random.randint(0, 560), 40, 40)
+                   for _ in range(queries)]
+        index = level.collision_index
+        index.queries = index.items_tested = 0
+
+        start = time.perf_counter()
+        old_results = [any(player.colliderect(rect) for rect in old_collision_rects(level))
+                       for player in players[:queries // 20]]
+        old_time = (time.perf_counter() - start) / (queries // 20)
+
+        start = time.perf_counter()
+        scroll = level.scroll
+        new_results = [index.collides(player.left, player.top, player.right, player.bottom, scroll)
+                       for player in players]
+        new_time = (time.perf_counter() - start) / queries
+
+        mismatches = sum(old != new for old, new in zip(old_results, new_results))
+        stats = index.get_stats()
+        segments = len(level.left_wall) + len(level.right_wall) - 2
+        print(f"   velocidade {speed:3}, complexidade {complexity:2}: {segments:5d} segmentos + "
+              f"{len(level.obstacles):3d} obstáculos")
+        print(f"      retângulos: {old_time * 1e6:8.1f} µs/consulta | índice: {new_time * 1e6:6.1f} µs/consulta "
+              f"({stats['items_per_query']:.1f} itens testados) | divergências: {mismatches}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,176 @@
+"""
+Faixa de terreno com rolagem incremental (buffer circular)
+- Superfície 8-bit alta (altura da tela + margem) usada como buffer circular
+- Cada segmento novo de parede é rasterizado uma única vez, quando é gerado
+- O desenho do frame é só 1-2 blits da janela visível com o deslocamento da rolagem
+- Cores psicodélicas: as paredes são índices de paleta; o ciclo de cores troca
+  3 entradas da paleta, sem re-rasterizar
+- Custo de desenho independente do número de pontos das paredes
+
+Coordenadas de mundo: y_tela = y_mundo + rolagem. A linha da faixa que guarda
+y_mundo é y_mundo % altura_da_faixa.
+
+Uso: python terrain_strip.py  (polígonos por frame vs faixa, com poucas e muitas paredes)
+"""
+
+import math
+import pygame
+from color_lut import hsv_color
+
+# Linhas extras além da altura da tela (segmentos gerados acima da tela, y = -20)
+STRIP_MARGIN = 64
+
+# Índices da paleta da faixa; 0 é transparente
+TRANSPARENT_INDEX = 0
+WALL_INDICES = {'left': 1, 'right': 2, 'edge': 3}
+
+# Tons relativos das paredes: (tom, saturação, brilho)
+WALL_COLORS = {'left': (0.7, 0.8, 0.6), 'right': (0.3, 0.8, 0.6), 'edge': (0.1, 1.0, 1.0)}
+
+EDGE_WIDTH = 3
+
+
+class TerrainStrip:
+    def __init__(self, width, height, margin=STRIP_MARGIN):
+        """Faixa de terreno com paleta própria"""
+        self.width = width
+        self.height = height
+        self.strip_height = height + margin
+        self.surface = self.create_surface()
+        self.indices = dict(WALL_INDICES)
+        self.color_shift = None
+        self.shared_palette = False  # Modo 8-bit: paleta definida pelo PaletteRenderer
+
+        # Estatísticas
+        self.segments_rasterized = 0
+
+    def create_surface(self):
+        """Superfície 8-bit transparente (índice 0 = colorkey)"""
+        surface = pygame.Surface((self.width, self.strip_height), depth=8)
+        surface.set_colorkey(TRANSPARENT_INDEX)
+        surface.fill(TRANSPARENT_INDEX)
+        return surface
+
+    def rebuild(self, left_wall, right_wall):
+        """Rasterizar todas as paredes (pontos em coordenadas de mundo, de cima para baixo)"""
+        self.surface.fill(TRANSPARENT_INDEX)
+        left_wall, right_wall = list(left_wall), list(right_wall)
+        # De baixo para cima: segmentos mais altos sobrescrevem os que dão a volta no buffer
+        for i in range(min(len(left_wall), len(right_wall)) - 1, 0, -1):
+            self.add_segment(left_wall[i - 1], left_wall[i], right_wall[i - 1], right_wall[i])
+
+    def add_segment(self, left_top, left_bottom, right_top, right_bottom):
+        """
+        Rasterizar o trecho entre dois pontos consecutivos das paredes.
+
+        Pontos em coordenadas de mundo; *_top tem o menor y.
+        """
+        top = min(left_top[1], right_top[1])
+        bottom = max(left_bottom[1], right_bottom[1])
+        base = math.floor(top / self.strip_height) * self.strip_height
+
+        self.rasterize(base, top, bottom, left_top, left_bottom, right_top, right_bottom)
+        if bottom - base > self.strip_height:
+            # Trecho cruza o fim do buffer: completar no começo
+            self.rasterize(base + self.strip_height, top, bottom,
+                           left_top, left_bottom, right_top, right_bottom)
+        self.segments_rasterized += 1
+
+    def rasterize(self, base, top, bottom, left_top, left_bottom, right_top, right_bottom):
+        """Limpar a banda e desenhar paredes e bordas deslocadas por -base"""
+        surface = self.surface
+        # Linhas inteiras: a banda ocupa [topo, base_da_banda) e não apaga a banda de baixo
+        band_top = math.floor(top) - base
+        # Recortar na faixa: fill com y negativo não encolhe a altura e apagaria linhas a mais
+        band = pygame.Rect(0, band_top, self.width, math.floor(bottom) - base - band_top)
+        surface.fill(TRANSPARENT_INDEX, band.clip(surface.get_rect()))
+
+        (lx1, ly1), (lx2, ly2) = left_top, left_bottom
+        (rx1, ry1), (rx2, ry2) = right_top, right_bottom
+        ly1, ly2 = math.floor(ly1) - base, math.floor(ly2) - base
+        ry1, ry2 = math.floor(ry1) - base, math.floor(ry2) - base
+
+        pygame.draw.polygon(surface, self.indices['left'], [(0, ly1), (lx1, ly1), (lx2, ly2), (0, ly2)])
+        pygame.draw.polygon(surface, self.indices['right'],
+                            [(rx1, ry1), (self.width, ry1), (self.width, ry2), (rx2, ry2)])
+        pygame.draw.line(surface, self.indices['edge'], (lx1, ly1), (lx2, ly2), EDGE_WIDTH)
+        pygame.draw.line(surface, self.indices['edge'], (rx1, ry1), (rx2, ry2), EDGE_WIDTH)
+
+    def set_indices(self, indices):
+        """
+        Usar os índices de parede de uma paleta compartilhada (modo 8-bit).
+
+        A paleta passa a ser definida por quem compartilha; a faixa precisa ser
+        re-rasterizada (rebuild) com os novos índices.
+        """
+        self.indices = dict(indices)
+        self.shared_palette = True
+
+    def update_colors(self, color_shift):
+        """Ciclo de cores da paleta da faixa: 3 entradas por frame"""
+        if self.shared_palette or color_shift == self.color_shift:
+            return
+        self.color_shift = color_shift
+        for name, (hue, saturation, value) in WALL_COLORS.items():
+            self.surface.set_palette_at(self.indices[name], hsv_color(color_shift + hue, saturation, value))
+
+    def draw(self, screen, scroll, color_shift):
+        """Desenhar a janela visível da faixa (1 ou 2 blits, conforme a volta do buffer)"""
+        self.update_colors(color_shift)
+
+        row = math.floor(-scroll) % self.strip_height
+        first = min(self.height, self.strip_height - row)
+        blits = [(self.surface, (0, 0), (0, row, self.width, first))]
+        if first < self.height:
+            blits.append((self.surface, (0, first), (0, 0, self.width, self.height - first)))
+        screen.blits(blits, doreturn=False)
+
+    def get_stats(self):
+        """Estatísticas da faixa"""
+        return {
+            'strip_height': self.strip_height,
+            'segments_rasterized': self.segments_rasterized,
+            'memory_kb': self.width * self.strip_height // 1024
+        }
+
+
+def benchmark(frames=300):
+    """Comparar o desenho do terreno: polígonos refeitos por frame vs faixa incremental"""
+    import time
+    from level_generator import LevelGenerator
+
+    def draw_polygons(surface, level, color_shift):
+        """Desenho antigo: dois polígonos + duas linhas com todos os pontos visíveis"""
+        height = level.height
+        left_points = [(x, y + level.scroll) for x, y in level.left_wall if 0 <= y + level.scroll <= height]
+        right_points = [(x, y + level.scroll) for x, y in level.right_wall if 0 <= y + level.scroll <= height]
+        pygame.draw.polygon(surface, hsv_color(color_shift + 0.7, 0.8, 0.6),
+                            [(0, 0), (0, height)] + left_points[::-1])
+        pygame.draw.polygon(surface, hsv_color(color_shift + 0.3, 0.8, 0.6),
+                            [(level.width, 0), (level.width, height)] + right_points[::-1])
+        pygame.draw.lines(surface, hsv_color(color_shift + 0.1), False, left_points, 3)
+        pygame.draw.lines(surface, hsv_color(color_shift + 0.1), False, right_points, 3)
+
+    screen = pygame.Surface((800, 600))
+    print(f"🏞️  Desenho do terreno ({frames} frames)")
+    for speed in (8, 3, 1):  # Rolagem mais lenta = mais pontos nas paredes
+        level = LevelGenerator(800, 600)
+        for _ in range(700 // speed):
+            level.update(speed)
+        points = len(level.left_wall) + len(level.right_wall)
+
+        timings = {}
+        for label, draw in (("polígonos", lambda shift: draw_polygons(screen, level, shift)),
+                            ("faixa", lambda shift: level.terrain_strip.draw(screen, level.scroll, shift))):
+            start = time.perf_counter()
+            for frame in range(frames):
+                screen.fill((0, 0, 0))
+                draw(frame * 0.01)
+            timings[label] = (time.perf_counter() - start) / frames * 1000
+        print(f"   {points:4d} pontos: polígonos {timings['polígonos']:5.2f} ms | "
+              f"faixa {timings['faixa']:5.2f} ms")
+
+
+if __name__ == "__main__":
+    pygame.init()
+    benchmark()
@@ -0,0 +1,14 @@
+"""
+Configuração comum dos testes
+- Pygame sem janela e sem placa de som (drivers dummy)
+- Módulos do jogo importados da raiz do repositório
+"""
+
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
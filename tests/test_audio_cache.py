@@ -0,0 +1,96 @@
+"""Testes do cache de áudio em disco: invalidação e remoção LRU"""
+
+import os
+import numpy as np
+import pytest
+
+import audio_cache
+from audio_cache import AudioCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Relógio controlado (last_used distintos e em ordem)"""
+    now = [1000.0]
+
+    def tick():
+        now[0] += 1.0
+        return now[0]
+
+    monkeypatch.setattr(audio_cache.time, 'time', tick)
+    return now
+
+
+def make_pcm(samples=1000):
+    return np.arange(samples, dtype=np.int16)
+
+
+def test_roundtrip(tmp_path):
+    cache = AudioCache(str(tmp_path))
+    cache.put('laser', {'freq': 440}, make_pcm())
+
+    pcm = cache.get('laser', {'freq': 440})
+    assert np.array_equal(pcm, make_pcm())
+    assert cache.get_stats()['hits'] == 1
+
+
+def test_changed_params_invalidate_previous_entry(tmp_path):
+    cache = AudioCache(str(tmp_path))
+    cache.put('laser', {'freq': 440}, make_pcm())
+    old_path = cache.entry_path(cache.make_key({'freq': 440}))
+
+    cache.put('laser', {'freq': 880}, make_pcm(500))
+
+    assert cache.get('laser', {'freq': 440}) is None
+    assert not os.path.exists(old_path)
+    assert len(cache.index['entries']) == 1
+    assert len(cache.get('laser', {'freq': 880})) == 500
+
+
+def test_version_bump_invalidates(tmp_path, monkeypatch):
+    cache = AudioCache(str(tmp_path))
+    cache.put('laser', {'freq': 440}, make_pcm())
+
+    monkeypatch.setattr(audio_cache, 'AUDIO_CACHE_VERSION', audio_cache.AUDIO_CACHE_VERSION + 1)
+    assert cache.get('laser', {'freq': 440}) is None
+
+
+def test_missing_file_is_dropped_from_index(tmp_path):
+    cache = AudioCache(str(tmp_path))
+    cache.put('laser', {'freq': 440}, make_pcm())
+    os.remove(cache.entry_path(cache.make_key({'freq': 440})))
+
+    assert cache.get('laser', {'freq': 440}) is None
+    assert cache.index['entries'] == {}
+    assert AudioCache(str(tmp_path)).index['entries'] == {}
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path, clock):
+    entry_size = len(make_pcm()) * 2 + 128  # PCM + cabeçalho .npy
+    cache = AudioCache(str(tmp_path), max_bytes=3 * entry_size)
+    for name in ('a', 'b', 'c'):
+        cache.put(name, {'name': name}, make_pcm())
+
+    # 'a' é o mais antigo, mas foi usado agora: 'b' passa a ser o menos recente
+    assert cache.get('a', {'name': 'a'}) is not None
+    cache.put('d', {'name': 'd'}, make_pcm())
+
+    assert set(cache.index['names']) == {'a', 'c', 'd'}
+    assert cache.get_stats()['evictions'] == 1
+    assert not os.path.exists(cache.entry_path(cache.make_key({'name': 'b'})))
+    assert cache.total_size() <= cache.max_bytes
+
+
+def test_hits_update_index_only_on_flush(tmp_path, clock):
+    cache = AudioCache(str(tmp_path))
+    cache.put('laser', {'freq': 440}, make_pcm())
+    key = cache.make_key({'freq': 440})
+    saved = AudioCache(str(tmp_path)).index['entries'][key]['last_used']
+
+    cache.get('laser', {'freq': 440})
+    assert cache.dirty
+    assert AudioCache(str(tmp_path)).index['entries'][key]['last_used'] == saved
+
+    cache.flush()
+    assert not cache.dirty
+    assert AudioCache(str(tmp_path)).index['entries'][key]['last_used'] > saved
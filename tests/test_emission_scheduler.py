@@ -0,0 +1,92 @@
+"""Testes do agendador de emissões: orçamento por frame e fatias das explosões"""
+
+import pytest
+
+from emission_scheduler import EmissionScheduler
+from effects import PsychedelicEffects
+
+
+class Recorder:
+    """Emissor que só registra as fatias pedidas (amount, offset)"""
+
+    def __init__(self):
+        self.slices = []
+
+    def __call__(self, amount, offset):
+        self.slices.append((amount, offset))
+
+    def total(self):
+        return sum(amount for amount, _ in self.slices)
+
+
+def test_per_frame_budget_is_never_exceeded():
+    scheduler = EmissionScheduler(spawn_budget=100)
+    bursts = [Recorder() for _ in range(3)]
+    for burst, count in zip(bursts, (250, 80, 30)):
+        scheduler.schedule(burst, count)
+
+    frames = 0
+    while scheduler.pending():
+        scheduler.update(1 / 60)
+        assert scheduler.spawned_last_frame <= 100
+        frames += 1
+
+    assert frames == 4  # 360 partículas a 100 por frame
+    assert [burst.total() for burst in bursts] == [250, 80, 30]
+    assert scheduler.get_stats()['max_spawned_per_frame'] == 100
+
+
+def test_slices_are_contiguous_and_fifo():
+    scheduler = EmissionScheduler(spawn_budget=100)
+    first, second = Recorder(), Recorder()
+    scheduler.schedule(first, 150)
+    scheduler.schedule(second, 100)
+
+    scheduler.update(1 / 60)
+    assert first.slices == [(100, 0)]
+    assert second.slices == []  # Orçamento do frame gasto pela primeira rajada
+
+    scheduler.update(1 / 60)
+    scheduler.update(1 / 60)
+    assert first.slices == [(100, 0), (50, 100)]
+    assert second.slices == [(50, 0), (50, 50)]
+
+
+def test_delay_postpones_burst():
+    scheduler = EmissionScheduler(spawn_budget=100)
+    burst = Recorder()
+    scheduler.schedule(burst, 10, delay=0.05)
+
+    scheduler.update(0.03)
+    scheduler.update(0.03)
+    assert burst.slices == []
+    scheduler.update(0.03)
+    assert burst.slices == [(10, 0)]
+
+
+@pytest.mark.parametrize('budget', [7, 50, 1000])
+def test_sliced_giant_explosion_creates_whole_explosion(budget):
+    effects = PsychedelicEffects(800, 600)
+    size = 8.0
+    particles, secondary, rings = effects.giant_explosion_counts(size)
+    total = effects.giant_explosion_count(size)
+
+    created = []
+    ring_counts = []
+
+    def emit(amount, offset):
+        rings_before = int((effects.explosions.kind[:effects.explosions.count] == 1).sum())
+        created.append(effects.create_giant_explosion(400, 300, size, start=offset, stop=offset + amount))
+        ring_counts.append(int((effects.explosions.kind[:effects.explosions.count] == 1).sum())
+                           - rings_before)
+
+    scheduler = EmissionScheduler(spawn_budget=budget)
+    scheduler.schedule(emit, total)
+    while scheduler.pending():
+        scheduler.update(1 / 60)
+
+    assert sum(created) == total == particles + secondary + rings
+    assert sum(ring_counts) == rings
+    assert max(created) <= budget  # Cada fatia cria exatamente o que foi pedido
+    if len(created) > 1:
+        assert ring_counts[0] < rings  # Anéis divididos entre as fatias
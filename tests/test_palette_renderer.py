@@ -0,0 +1,50 @@
+"""Teste do modo 8-bit: mesmo cenário do caminho normal, composto por índices"""
+
+import random
+import numpy as np
+import pygame
+import pytest
+
+from effects import PsychedelicEffects
+from level_generator import LevelGenerator
+from palette_renderer import PaletteRenderer
+
+
+def make_level(seed, frames=150, speed=3.3):
+    random.seed(seed)
+    level = LevelGenerator(800, 600)
+    for frame in range(frames):
+        random.seed(seed + frame)
+        level.update(speed)
+    return level
+
+
+@pytest.mark.parametrize('color_shift', [0.0, 0.37, 0.81])
+def test_palette_mode_matches_normal_path(color_shift):
+    effects = PsychedelicEffects(800, 600)
+    normal_level = make_level(2)
+    renderer = PaletteRenderer(effects, make_level(2))
+
+    normal = pygame.Surface((800, 600))
+    effects.draw_background(normal, color_shift)
+    normal_level.draw_terrain(normal, color_shift)
+
+    indexed = pygame.Surface((800, 600))
+    renderer.draw(indexed, color_shift)
+
+    # Só arredondamento da tabela HSV (paredes) vs conversão exata
+    difference = np.abs(pygame.surfarray.array3d(normal).astype(np.int32) -
+                        pygame.surfarray.array3d(indexed))
+    assert difference.max() <= 8
+
+
+def test_palette_mode_skips_terrain_in_level_draw():
+    level = make_level(3, frames=10)
+    PaletteRenderer(PsychedelicEffects(800, 600), level)
+    screen = pygame.Surface((800, 600))
+    screen.fill((0, 0, 0))
+
+    level.obstacles.clear()
+    level.powerups.clear()
+    level.draw(screen, 0.0)
+    assert pygame.surfarray.array3d(screen).max() == 0
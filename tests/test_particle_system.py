@@ -0,0 +1,98 @@
+"""Testes do sistema de partículas em arrays: swap-remove e camadas"""
+
+import numpy as np
+
+from particle_system import ParticleSystem, LAYER_EFFECTS, LAYER_THRUST
+
+
+def make_system(capacity=64):
+    return ParticleSystem(capacity, stamps=object())  # Sem desenho nos testes
+
+
+def alive_ids(system):
+    """Identificador de cada partícula viva (x inicial único), ordenado"""
+    return sorted(system.x[:system.count].tolist())
+
+
+def test_compact_fills_holes_with_survivors():
+    system = make_system()
+    ids = np.arange(10, dtype=np.float32)
+    colors = np.stack([ids, ids * 2, ids * 3], axis=1)
+    system.emit(ids, 0, 0, 0, life=np.where(ids % 3 == 0, 0, 5), color=colors)
+
+    system.compact()
+
+    survivors = [i for i in range(10) if i % 3 != 0]
+    assert system.count == len(survivors)
+    assert alive_ids(system) == survivors
+    # Todos os campos andam juntos com a partícula movida
+    n = system.count
+    assert np.array_equal(system.color[:n, 1], system.x[:n] * 2)
+    assert np.array_equal(system.color[:n, 2], system.x[:n] * 3)
+    assert (system.life[:n] == 5).all()
+
+
+def test_compact_all_dead_and_none_dead():
+    system = make_system()
+    system.emit(np.arange(5), 0, 0, 0, life=3)
+    system.compact()
+    assert system.count == 5
+
+    system.life[:5] = 0
+    system.compact()
+    assert system.count == 0
+
+
+def test_update_ages_and_removes_expired():
+    system = make_system()
+    system.emit(np.arange(4), 0, 1, 2, life=np.array([1, 2, 1, 3]))
+
+    system.update()
+
+    assert system.count == 2
+    assert alive_ids(system) == [2.0, 4.0]  # x inicial 1 e 3, movidas por vx=1
+    assert (system.y[:2] == 2).all()
+
+
+def test_update_layer_only_touches_that_layer():
+    system = make_system()
+    system.emit(np.arange(3), 0, 1, 0, life=1, layer=LAYER_EFFECTS)
+    system.emit(np.arange(10, 13), 0, 1, 0, life=np.array([1, 5, 1]), layer=LAYER_THRUST)
+
+    system.update(layer=LAYER_THRUST)
+
+    effects = system.layer[:system.count] == LAYER_EFFECTS
+    thrust = ~effects
+    # Efeitos: intactos (nem movidos nem envelhecidos)
+    assert sorted(system.x[:system.count][effects].tolist()) == [0.0, 1.0, 2.0]
+    assert (system.life[:system.count][effects] == 1).all()
+    # Propulsão: só a de vida 5 sobrevive, movida e envelhecida
+    assert system.x[:system.count][thrust].tolist() == [12.0]
+    assert system.life[:system.count][thrust].tolist() == [4.0]
+
+
+def test_clear_layer_keeps_other_layers():
+    system = make_system()
+    system.emit(np.arange(5), 0, 0, 0, life=5, layer=LAYER_THRUST)
+    system.emit(np.arange(10, 13), 0, 0, 0, life=5, layer=LAYER_EFFECTS)
+    system.emit(np.arange(5, 7), 0, 0, 0, life=5, layer=LAYER_THRUST)
+
+    system.clear(layer=LAYER_THRUST)
+
+    assert system.count == 3
+    assert alive_ids(system) == [10.0, 11.0, 12.0]
+    assert (system.layer[:3] == LAYER_EFFECTS).all()
+
+    system.clear()
+    assert system.count == 0
+
+
+def test_emit_respects_limit():
+    system = make_system(capacity=8)
+    assert system.emit(np.arange(6), 0, 0, 0, life=5) == 6
+    assert system.emit(np.arange(6), 0, 0, 0, life=5) == 2
+    assert system.get_stats()['dropped'] == 4
+
+    system.set_limit(3)
+    assert system.count == 3
+    assert system.emit(0, 0, 0, 0, life=5) == 0
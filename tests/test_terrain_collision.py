@@ -0,0 +1,75 @@
+"""Testes do índice de colisão do terreno: mesmas respostas que os retângulos por segmento"""
+
+import random
+import pygame
+import pytest
+
+from level_generator import LevelGenerator
+from terrain_collision import SEGMENT_PADDING, TerrainCollisionIndex
+
+
+def reference_rects(level):
+    """Caminho antigo: um pygame.Rect por segmento de parede e por obstáculo (tela)"""
+    rects = []
+    scroll = level.scroll
+    for wall, is_left in ((list(level.left_wall), True), (list(level.right_wall), False)):
+        for (x1, y1), (x2, y2) in zip(wall, wall[1:]):
+            top = min(y1, y2) + scroll
+            if is_left:
+                rects.append(pygame.Rect(0, top, x1, abs(y2 - y1) + SEGMENT_PADDING))
+            else:
+                rects.append(pygame.Rect(x1, top, level.width - x1, abs(y2 - y1) + SEGMENT_PADDING))
+    for obstacle in level.obstacles:
+        size = obstacle['size']
+        rects.append(pygame.Rect(obstacle['x'] - size // 2, obstacle['y'] + scroll - size // 2, size, size))
+    return rects
+
+
+def assert_same_hits(level, index, queries=400):
+    """Jogadores (40x40) aleatórios: índice e retângulos de referência concordam sempre"""
+    rects = reference_rects(level)
+    scroll = level.scroll
+    for _ in range(queries):
+        player = pygame.Rect(random.randint(-20, 780), random.randint(-20, 580), 40, 40)
+        expected = player.collidelist(rects) != -1
+        assert index.collides(player.left, player.top, player.right, player.bottom, scroll) == expected
+
+
+@pytest.mark.parametrize('speed, complexity', [(4, 1), (2, 6), (0.5, 12), (2.3, 3), (7.5, 3)])
+def test_collides_matches_reference_rects(speed, complexity):
+    random.seed(7)
+    level = LevelGenerator(800, 600)
+    level.terrain_complexity = complexity
+    level.wall_width = 80
+    for frame in range(int(1200 / speed)):
+        level.update(speed)
+        if random.random() < 0.2:
+            level.generate_obstacle()
+        # Depois de muitas faixas descartadas por baixo, não só no começo
+        if frame % 40 == 39:
+            assert_same_hits(level, level.collision_index, queries=100)
+    assert level.collision_index.max_band is not None
+    assert_same_hits(level, level.collision_index)
+
+
+def test_rebuild_matches_incremental_index():
+    random.seed(3)
+    level = LevelGenerator(800, 600)
+    level.terrain_complexity = 6
+    for _ in range(300):
+        level.update(3)
+
+    rebuilt = TerrainCollisionIndex(800)
+    rebuilt.rebuild(level.left_wall, level.right_wall, level.obstacles)
+    assert_same_hits(level, rebuilt)
+
+
+def test_fractional_rows_truncate_like_pygame():
+    index = TerrainCollisionIndex(800)
+    index.add_wall_segment('left', (266, -23.0), (266, -22.5))  # 10.5px de altura -> 10
+    for scroll in (340.0, 340.7, 20.3):  # 20.3: topo negativo na tela, truncado para cima
+        rect = pygame.Rect(0, -23.0 + scroll, 266, 10.5)
+        for top in range(rect.top - 45, rect.bottom + 5):
+            player = pygame.Rect(240, top, 40, 40)
+            assert index.collides(player.left, player.top, player.right, player.bottom, scroll) == \
+                player.colliderect(rect)
@@ -0,0 +1,58 @@
+"""Testes da faixa de terreno: mesmo desenho dos polígonos por frame, inclusive na volta do buffer"""
+
+import random
+import numpy as np
+import pygame
+import pytest
+
+from color_lut import hsv_color
+from level_generator import LevelGenerator
+
+
+def draw_polygons(surface, level, color_shift):
+    """Desenho antigo do terreno: dois polígonos + duas linhas refeitos a cada frame"""
+    height = level.height
+    left = [(x, y + level.scroll) for x, y in level.left_wall if 0 <= y + level.scroll <= height]
+    right = [(x, y + level.scroll) for x, y in level.right_wall if 0 <= y + level.scroll <= height]
+    pygame.draw.polygon(surface, hsv_color(color_shift + 0.7, 0.8, 0.6), [(0, 0), (0, height)] + left[::-1])
+    pygame.draw.polygon(surface, hsv_color(color_shift + 0.3, 0.8, 0.6),
+                        [(level.width, 0), (level.width, height)] + right[::-1])
+    pygame.draw.lines(surface, hsv_color(color_shift + 0.1), False, left, 3)
+    pygame.draw.lines(surface, hsv_color(color_shift + 0.1), False, right, 3)
+    return left, right
+
+
+def wall_mask(surface):
+    """Pixels pintados (paredes ou bordas) de uma superfície com fundo preto"""
+    return pygame.surfarray.array3d(surface).any(axis=2)
+
+
+@pytest.mark.parametrize('speed', [4.4, 6.0, 6.5, 7.5, 8.0])
+def test_strip_matches_polygons_across_wraps(speed):
+    random.seed(11)
+    level = LevelGenerator(800, 600)
+    strip = level.terrain_strip
+    reference = pygame.Surface((800, 600))
+    drawn = pygame.Surface((800, 600))
+
+    wraps = 0
+    last_row = None
+    for frame in range(240):
+        level.update(speed)
+        row = int(-level.scroll) % strip.strip_height
+        wraps += last_row is not None and row > last_row
+        last_row = row
+
+        reference.fill((0, 0, 0))
+        left, right = draw_polygons(reference, level, 0.0)
+        drawn.fill((0, 0, 0))
+        level.draw_terrain(drawn, 0.0)
+
+        # Linhas entre o primeiro e o último ponto visível (bordas da tela diferem por construção)
+        top = int(max(left[0][1], right[0][1])) + 2
+        bottom = int(min(left[-1][1], right[-1][1])) - 2
+        missing = wall_mask(reference)[:, top:bottom] & ~wall_mask(drawn)[:, top:bottom]
+        # Só serrilhado nas bordas inclinadas; uma faixa apagada falta na largura inteira da parede
+        assert missing.sum(axis=0).max() <= 32, f"frame {frame}: linha sem parede"
+
+    assert wraps > 0
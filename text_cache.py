@@ -0,0 +1,188 @@
+"""
+Cache de textos renderizados (HUD, combo e textos flutuantes)
+- Chave: (fonte, texto, cor quantizada, brilho, escala) -> Surface pronta para blit
+- O brilho (4 cópias deslocadas translúcidas + texto) é composto uma única vez
+- Textos que mudam todo frame (score, contadores) são montados glifo a glifo
+- LRU limitado: textos que mudam (score, timer) saem quando o cache enche
+- Contadores de acertos/faltas para verificar que o HUD só faz blits
+
+Uso: python text_cache.py  (tempo do HUD por frame: sem cache vs com cache)
+"""
+
+from collections import OrderedDict
+import pygame
+
+# Brilho do texto: deslocamentos, transparência e clareamento da cor
+GLOW_OFFSETS = ((2, 2), (-2, -2), (2, -2), (-2, 2))
+GLOW_PADDING = 2
+GLOW_ALPHA = 80
+GLOW_LIGHTEN = 50
+
+# Escalas (textos flutuantes) arredondadas para este passo
+SCALE_STEP = 0.05
+
+# Cores arredondadas para 16 níveis por canal (textos com cor psicodélica animada)
+COLOR_STEP = 17
+
+DEFAULT_MAX_SURFACES = 512
+
+
+class TextCache:
+    def __init__(self, max_surfaces=DEFAULT_MAX_SURFACES):
+        """Cache LRU de superfícies de texto"""
+        self.max_surfaces = max_surfaces
+        self.surfaces = OrderedDict()
+
+        # Estatísticas
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, color, glow=False, scale=1.0):
+        """
+        Superfície do texto (renderizada só na primeira vez).
+
+        Com glow=True a superfície tem GLOW_PADDING pixels de margem em cada
+        lado (use blit() para posicionar pelo canto do texto). A superfície é
+        compartilhada: quem muda o alpha (set_alpha) deve fazê-lo antes de cada blit.
+        """
+        color = tuple((int(c) + COLOR_STEP // 2) // COLOR_STEP * COLOR_STEP for c in color[:3])
+        if scale != 1.0:
+            scale = round(scale / SCALE_STEP) * SCALE_STEP
+        key = (font, text, color, glow, scale)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.compose_glow(font, text, color) if glow else font.render(text, True, color)
+        if scale != 1.0:
+            width, height = surface.get_size()
+            surface = pygame.transform.scale(surface, (int(width * scale), int(height * scale)))
+
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def blit_glyphs(self, screen, font, text, color, pos):
+        """
+        Desenhar um texto que muda quase todo frame (score, contadores) glifo a glifo.
+
+        Cada caractere é renderizado uma vez e reaproveitado em qualquer texto;
+        o frame só faz um Surface.blits. Retorna o Rect ocupado.
+        """
+        x, y = pos
+        blits = []
+        for char in text:
+            glyph = self.render(font, char, color)
+            blits.append((glyph, (x, y)))
+            x += glyph.get_width()
+        screen.blits(blits, doreturn=False)
+        return pygame.Rect(pos[0], pos[1], x - pos[0], font.get_height())
+
+    @staticmethod
+    def compose_glow(font, text, color):
+        """Texto com brilho: cópias clareadas translúcidas nos 4 cantos + texto por cima"""
+        text_surf = font.render(text, True, color)
+        glow_color = tuple(min(255, c + GLOW_LIGHTEN) for c in color)
+        glow_surf = font.render(text, True, glow_color)
+        glow_surf.set_alpha(GLOW_ALPHA)
+
+        width, height = text_surf.get_size()
+        surface = pygame.Surface((width + GLOW_PADDING * 2, height + GLOW_PADDING * 2),
+                                 pygame.SRCALPHA)
+        for dx, dy in GLOW_OFFSETS:
+            surface.blit(glow_surf, (GLOW_PADDING + dx, GLOW_PADDING + dy))
+        surface.blit(text_surf, (GLOW_PADDING, GLOW_PADDING))
+        return surface
+
+    def blit(self, screen, font, text, color, pos, glow=False):
+        """Desenhar o texto com o canto superior esquerdo em pos; retorna o Rect do texto"""
+        surface = self.render(font, text, color, glow)
+        if glow:
+            screen.blit(surface, (pos[0] - GLOW_PADDING, pos[1] - GLOW_PADDING))
+            return pygame.Rect(pos[0], pos[1], surface.get_width() - GLOW_PADDING * 2,
+                               surface.get_height() - GLOW_PADDING * 2)
+        screen.blit(surface, pos)
+        return surface.get_rect(topleft=pos)
+
+    def clear(self):
+        """Descartar todas as superfícies"""
+        self.surfaces.clear()
+
+    def get_stats(self):
+        """Estatísticas do cache"""
+        total = self.hits + self.misses
+        return {
+            'surfaces': len(self.surfaces),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+
+_cache = None
+
+
+def get_text_cache():
+    """Cache compartilhado por HUD, combo e menus"""
+    global _cache
+    if _cache is None:
+        _cache = TextCache()
+    return _cache
+
+
+def benchmark(frames=300):
+    """Tempo do HUD completo + combo por frame: renderizar sempre vs cache"""
+    import time
+    import text_cache
+    from professional_hud import ProfessionalHUD
+    from combo_system import ComboSystem
+
+    screen = pygame.Surface((800, 600))
+    hud = ProfessionalHUD(800, 600)
+    combo = ComboSystem()
+    for _ in range(12):
+        combo.add_kill(0.0, (400, 300))
+
+    stats = {
+        'score': 123450, 'level': 7, 'health': 220, 'max_health': 300, 'bombs': 2,
+        'xp_progress': 0.4, 'time_display': '1:23', 'coins': 42, 'show_fps': True, 'fps': 60.0,
+        'missions': [{'completed': True, 'progress': 5, 'target': 5},
+                     {'completed': False, 'progress': 2, 'target': 10}]
+    }
+
+    cache = text_cache.get_text_cache()  # A mesma instância usada pelo HUD
+    print(f"🔤 HUD + combo ({frames} frames)")
+    for label, cached in (("sem cache", False), ("com cache", True)):
+        cache.clear()
+        cache.hits = cache.misses = cache.evictions = 0
+        cache.max_surfaces = DEFAULT_MAX_SURFACES if cached else 0
+        start = time.perf_counter()
+        for frame in range(frames):
+            stats['color_shift'] = frame * 0.01
+            stats['score'] += 10 if frame % 30 == 0 else 0  # Score muda ~2x por segundo
+            screen.fill((0, 0, 0))
+            hud.draw(screen, stats)
+            hud.draw_complete_hud(screen, stats['score'], 3, stats['level'], 80,
+                                  coins=stats['coins'], fps=60.0, show_fps=True,
+                                  time_display=stats['time_display'])
+            combo.update(1 / 60)
+            combo.combo_timer = combo.combo_timeout
+            combo.render(screen)
+        elapsed = (time.perf_counter() - start) / frames
+        result = cache.get_stats()
+        print(f"   {label}: {elapsed * 1000:6.2f} ms/frame | {result['misses'] / frames:5.1f} "
+              f"renderizações/frame | acertos {result['hit_rate']:.0%}")
+
+    cache.max_surfaces = DEFAULT_MAX_SURFACES
+
+
+if __name__ == "__main__":
+    pygame.init()
+    benchmark()
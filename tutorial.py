@@ -1,6 +1,6 @@
 import pygame
 import math
-import colorsys
+from color_lut import hsv_color
 
 
 class Tutorial:
@@ -217,8 +217,7 @@ class Tutorial:
     def get_psychedelic_color(self, hue_offset=0.0, brightness=1.0):
         """Gerar cor psicodélica"""
         hue = (hue_offset + self.animation_frame * 0.02) % 1.0
-        rgb = colorsys.hsv_to_rgb(hue, 1.0, brightness)
-        return tuple(int(c * 255) for c in rgb)
+        return hsv_color(hue, 1.0, brightness)
     
     def draw(self, screen):
         """Desenhar UI do tutorial"""